@@ -7,25 +7,14 @@ QueryToTriplesConverter 클래스
 import os
 import ast
 import torch
-import heapq
-import json
-from pathlib import Path
-from typing import List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple
 from openai import OpenAI
 from dotenv import load_dotenv
-from tqdm import tqdm
-import torch.nn.functional as F
-from sentence_transformers import SentenceTransformer
+from pathlib import Path
 
-load_dotenv()
+from search_core import TOP_K, token_to_sentence, triples_in_scene, get_search_index
 
-# 검색 관련 상수
-DATASET = "drama_media_data"  # "dummy" or "media_data" or "drama_media_data"
-JSON_ROOT = Path(f"output/{DATASET}/scene_graph_class/gpt-4o")
-Z_CACHE = Path(f"cache/cached_graphs_{DATASET}_embed_fixed_z_ver1+2")
-BERT_NAME = "sentence-transformers/all-MiniLM-L6-v2"
-DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
-TOP_K = 5
+load_dotenv()
 
 
 class QueryToTriplesConverter:
@@ -66,8 +55,13 @@ class QueryToTriplesConverter:
         # instruction 템플릿 로드
         self.qa_template = self._load_qa_template()
         
-        # SBERT 모델 초기화
-        self.sbert = SentenceTransformer(BERT_NAME, device=DEVICE).eval()
+        # SBERT와 샤드 캐시는 search_core의 공유 인덱스를 사용 (검색 시 지연 로드)
+        self.index = get_search_index()
+    
+    @property
+    def sbert(self):
+        """공유 SBERT 모델"""
+        return self.index.sbert
     
     def _load_qa_template(self) -> str:
         """
@@ -86,7 +80,6 @@ class QueryToTriplesConverter:
         except Exception as e:
             raise Exception(f"템플릿 파일 로드 중 오류 발생: {e}")
     
-    @torch.no_grad()
     def _vec(self, txt: str) -> torch.Tensor:
         """
         텍스트를 벡터로 변환합니다.
@@ -97,7 +90,7 @@ class QueryToTriplesConverter:
         Returns:
             torch.Tensor: 변환된 벡터
         """
-        return self.sbert.encode(txt, normalize_embeddings=True, convert_to_tensor=True).float()
+        return self.index.vec(txt)
     
     def _token_to_sentence(self, tok: str | None) -> str:
         """
@@ -109,10 +102,7 @@ class QueryToTriplesConverter:
         Returns:
             str: 변환된 문장
         """
-        if not tok:
-            return ""
-        sup, typ = tok.split(":", 1) if ":" in tok else (tok, tok)
-        return f"A {typ} which is a kind of {sup}."
+        return token_to_sentence(tok, pad_plain=True)
     
     def _embed_query(self, tokens: List[str]) -> Tuple[torch.Tensor|None, ...]:
         """
@@ -124,14 +114,7 @@ class QueryToTriplesConverter:
         Returns:
             Tuple[torch.Tensor|None, ...]: 임베딩된 벡터들
         """
-        s_tok, v_tok, o_tok = (tokens + [None, None])[:3]
-        q_s = self._vec(self._token_to_sentence(s_tok)) if s_tok else None
-        q_v = self._vec(v_tok) if v_tok else None
-        q_o = (
-            self._vec(self._token_to_sentence(o_tok))
-            if o_tok not in (None, "", "none", "None") else None
-        )
-        return q_s, q_v, q_o
+        return self.index.embed_query(tokens, pad_plain=True)
     
     def _extract_list(self, txt: str) -> List:
         """
@@ -165,15 +148,7 @@ class QueryToTriplesConverter:
         Returns:
             List[Tuple[int, int, Optional[int], str]]: 추출된 triples
         """
-        out, g = [], js["scene_graph"]
-        for ev in g.get("events", []):
-            s, o = ev.get("subject"), ev.get("object")
-            if s is None:
-                continue
-            # object가 정수 ID가 아닐 경우 None 처리
-            o = o if isinstance(o, int) else None
-            out.append((s, ev["event_id"], o, ev.get("verb", "")))
-        return out
+        return triples_in_scene(js)
     
     def _search_topk_multi(self, queries_emb: List[Tuple], tau: float, k: int = TOP_K):
         """
@@ -187,77 +162,7 @@ class QueryToTriplesConverter:
         Returns:
             List: 검색 결과
         """
-        heap = []
-        total_q = len(queries_emb)
-
-        for pt_fp in tqdm(list(Z_CACHE.rglob("*.pt")), desc="search"):
-            blob = torch.load(pt_fp, map_location="cpu")
-            z = F.normalize(blob["z"], dim=1)
-            id2idx = {nid: i for i, nid in enumerate(blob["orig_id"])}
-
-            rel_path = Path(blob["path"])
-            js_fp = JSON_ROOT / rel_path
-            if not js_fp.exists(): 
-                continue
-            scene_triples = self._triples_in_scene(json.load(js_fp.open()))
-            if not scene_triples: 
-                continue
-
-            matched = []
-            used = set()
-
-            for q_idx, (q_s, q_v, q_o) in enumerate(queries_emb):
-                best = None
-                for sid, eid, oid, _ in scene_triples:
-                    # triple의 각 요소가 list인 경우 스킵
-                    if any(isinstance(x, list) for x in (sid, eid, oid)):
-                        continue
-                    if sid not in id2idx or eid not in id2idx: 
-                        continue
-                    # 객체 필수 여부 판단
-                    need_obj = q_o is not None
-                    if need_obj and oid is None:              
-                        continue
-
-                    v_s = z[id2idx[sid]]
-                    v_v = z[id2idx[eid]]
-                    v_o = z[id2idx[oid]] if (oid is not None and oid in id2idx) else None
-
-                    # 객체 유효성 점검
-                    if need_obj and v_o is None: 
-                        continue
-
-                    s_sim = float(torch.dot(q_s, v_s)) if q_s is not None else None
-                    v_sim = float(torch.dot(q_v, v_v)) if q_v is not None else None
-                    o_sim = (
-                        float(torch.dot(q_o, v_o))
-                        if (q_o is not None and v_o is not None) else None
-                    )
-
-                    # 임계치 검사
-                    if (q_s is not None and s_sim < tau) or \
-                       (q_v is not None and v_sim < tau) or \
-                       (q_o is not None and o_sim < tau):
-                        continue
-
-                    sims = [x for x in (s_sim, v_sim, o_sim) if x is not None]
-                    sim = sum(sims) / len(sims)
-
-                    if best is None or sim > best[0]:
-                        best = (sim, s_sim, v_sim, o_sim, (sid, eid, oid))
-                if best:
-                    matched.append((q_idx,) + best)
-                    used.add(best[-1])
-
-            if not matched: 
-                continue
-            match_cnt = len(matched)
-            avg_sim = sum(m[1] for m in matched) / match_cnt
-            heapq.heappush(heap, (match_cnt, avg_sim, matched, rel_path.parts[0], rel_path, total_q))
-            if len(heap) > k: 
-                heapq.heappop(heap)
-
-        return sorted(heap, key=lambda x: (-x[0], -x[1]))
+        return self.index.search_topk_multi(queries_emb, tau, k)
     
     def __call__(self, question: str, tau: float = 0.30, top_k: int = TOP_K) -> dict:
         """
@@ -311,7 +216,7 @@ class QueryToTriplesConverter:
             
             # 2. triples 임베딩
             print(f"🚀 triples 임베딩 중...")
-            queries_emb = [self._embed_query(t) for t in triples]
+            queries_emb = self.index.embed_queries(triples, pad_plain=True)
             
             # 3. 검색 수행
             print(f"🚀 검색 수행 중... (tau={tau}, top_k={top_k})")
@@ -421,3 +326,33 @@ class QueryToTriplesConverter:
             self.max_tokens = max_tokens
         print(f"파라미터가 업데이트되었습니다: temperature={self.temperature}, max_tokens={self.max_tokens}")
 
+
+# 모델별 변환기 캐시 (SBERT 로딩과 템플릿 I/O를 호출마다 반복하지 않도록 재사용)
+_converter_cache: Dict[Tuple[str, str], QueryToTriplesConverter] = {}
+
+
+def get_converter(qa_template_path: str = "templates/qa_to_triple_template.txt",
+                  api_key: Optional[str] = None,
+                  model: str = "gpt-4o-mini") -> QueryToTriplesConverter:
+    """
+    (model, 템플릿 경로)별로 하나의 QueryToTriplesConverter를 생성해 재사용합니다.
+    
+    Args:
+        qa_template_path (str): QA to triple 템플릿 파일 경로
+        api_key (str, optional): OpenAI API 키. 최초 생성 시에만 사용
+        model (str): 사용할 OpenAI 모델명
+        
+    Returns:
+        QueryToTriplesConverter: 캐시된 변환기 인스턴스
+    """
+    key = (model, qa_template_path)
+    converter = _converter_cache.get(key)
+    if converter is None:
+        converter = QueryToTriplesConverter(
+            qa_template_path=qa_template_path,
+            api_key=api_key,
+            model=model
+        )
+        _converter_cache[key] = converter
+    return converter
+
@@ -5,14 +5,23 @@ R-GCN 모델을 활용한 그래프 임베딩 처리
 """
 
 import json
+import atexit
+import logging
 import torch
 import torch.nn.functional as F
 from pathlib import Path
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional, Any
-from torch_geometric.data import HeteroData, Data
 from torch_geometric.nn import RGCNConv
 from sentence_transformers import SentenceTransformer
 
+from util.pt_io import load_pt_file
+
+logger = logging.getLogger(__name__)
+
+# 빈 값으로 취급하는 토큰
+_EMPTY_TOKENS = (None, "", "None", "none")
+
 
 class RGCNEmbedder:
     """
@@ -23,7 +32,13 @@ class RGCNEmbedder:
                  model_path: str = "model/embed_triplet_struct_ver1+2/best_model.pt",
                  edge_map_path: str = "config/graph/edge_type_map.json",
                  sbert_model: str = "sentence-transformers/all-MiniLM-L6-v2",
-                 device: str = None):
+                 device: str = None,
+                 emb_cache_size: int = 8192,
+                 emb_cache_path: Optional[str] = None,
+                 compile_model: bool = True,
+                 use_onnx: bool = True,
+                 quantize_cpu: bool = True,
+                 triple_cache_size: int = 65536):
         """
         RGCNEmbedder 초기화
         
@@ -32,6 +47,12 @@ class RGCNEmbedder:
             edge_map_path: 엣지 타입 맵 파일 경로
             sbert_model: Sentence-BERT 모델명
             device: 사용할 디바이스
+            emb_cache_size: SBERT 임베딩 LRU 캐시 최대 항목 수
+            emb_cache_path: 임베딩 캐시 저장 경로 (지정 시 시작할 때 로드하고 종료 시 저장)
+            compile_model: CUDA에서 R-GCN forward를 torch.compile(reduce-overhead)로 컴파일할지 여부
+            use_onnx: SBERT 인코딩을 ONNX Runtime으로 수행할지 여부 (CUDA에서는 CUDA provider가 있을 때만, 실패 시 SBERT 사용)
+            quantize_cpu: CPU에서 SBERT를 int8 동적 양자화할지 여부 (ONNX 사용 시 ONNX 그래프, 아니면 Linear 레이어 / False면 FP32 유지)
+            triple_cache_size: R-GCN triple 임베딩 LRU 캐시 최대 항목 수
         """
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
         self.model_path = Path(model_path)
@@ -48,13 +69,61 @@ class RGCNEmbedder:
         # 엣지 타입 맵 로드
         self.edge2id = self._load_edge_map()
         self.num_relations = len(self.edge2id)
+        self._edge_templates = self._build_edge_templates()
         
         # Sentence-BERT 모델 초기화
         self.sbert = SentenceTransformer(sbert_model, device=self.device).eval()
         
+        # SBERT transformer를 ONNX Runtime으로 실행 (search_core와 모델별 export/세션 공유)
+        # CUDA 디바이스에서 CUDA provider가 없으면 CPU ONNX로 조용히 떨어지지 않도록 SBERT(GPU)를 사용
+        self.onnx_encoder = None
+        if use_onnx:
+            try:
+                import onnxruntime as ort
+                from search_core import get_onnx_encoder
+                if self.device == "cpu":
+                    providers = ["CPUExecutionProvider"]
+                elif "CUDAExecutionProvider" in ort.get_available_providers():
+                    providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+                else:
+                    providers = None
+                if providers is not None:
+                    # CPU에서는 ONNX 그래프 자체를 int8 동적 양자화해 실행
+                    quantize = self.device == "cpu" and quantize_cpu
+                    self.onnx_encoder = get_onnx_encoder(self.sbert, sbert_model, providers, quantize=quantize)
+                    print(f"✅ ONNX Runtime SBERT 인코더 사용: {self.onnx_encoder.onnx_path}")
+            except Exception as e:
+                print(f"⚠️ ONNX Runtime 사용 불가, SBERT로 대체합니다: {e}")
+        
+        # CPU에서 ONNX를 쓰지 못한 경우 SBERT Linear 레이어를 int8로 동적 양자화
+        if self.device == "cpu" and quantize_cpu and self.onnx_encoder is None:
+            self.sbert = torch.quantization.quantize_dynamic(self.sbert, {torch.nn.Linear}, dtype=torch.qint8)
+            print("✅ SBERT int8 동적 양자화 적용 (CPU)")
+        
+        # CUDA에서는 추론 전용이므로 SBERT/R-GCN 가중치를 FP16으로 유지 (임베딩 캐시도 같은 dtype으로 보관)
+        self.use_fp16 = self.device.startswith("cuda")
+        self.dtype = torch.float16 if self.use_fp16 else torch.float32
+        
+        # SBERT 임베딩 LRU 캐시 (문장 -> self.dtype CPU 텐서)
+        self.emb_cache_size = emb_cache_size
+        self.emb_cache_path = Path(emb_cache_path) if emb_cache_path else None
+        self._emb_cache: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+        self._load_embedding_cache()
+        if self.emb_cache_path is not None:
+            atexit.register(self.save_embedding_cache)
+        
+        # R-GCN triple 임베딩 LRU 캐시 ((subject, verb, object) -> self.dtype CPU 텐서 튜플)
+        self.triple_cache_size = triple_cache_size
+        self._triple_cache: "OrderedDict[Tuple[str, str, Optional[str]], Tuple[Optional[torch.Tensor], ...]]" = OrderedDict()
+        
         # R-GCN 모델 초기화 및 로드
         self.model = self._load_model()
         
+        if self.use_fp16:
+            self.sbert = self.sbert.half()
+            self.model = self.model.half()
+        self._forward = self._compile_model() if compile_model else self.model
+        
         print(f"✅ RGCNEmbedder 초기화 완료 - Device: {self.device}")
     
     def _load_edge_map(self) -> Dict[str, int]:
@@ -68,6 +137,43 @@ class RGCNEmbedder:
         print(f"✅ 엣지 타입 맵 로드 완료: {len(edge_map)}개 타입")
         return edge_map
     
+    def _build_edge_templates(self) -> Dict[int, Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        (subject, verb, object) 존재 여부 3비트 마스크별 엣지 템플릿 생성
+        
+        노드는 존재하는 것만 subject, verb, object 순으로 배치되며
+        subject -> verb, verb -> object 엣지 뒤에 노드별 self-loop(타입 num_relations)를 가집니다.
+        (self-loop를 미리 넣어 두어 RGCNModel.forward는 입력 엣지를 그대로 사용)
+        
+        Returns:
+            Dict[int, Tuple[torch.Tensor, torch.Tensor]]: mask -> (edge_index, edge_type)
+        """
+        subj_rel = self.edge2id.get("object_subject_of_event_event", 0)
+        obj_rel = self.edge2id.get("event_object_of_event_object", 1)
+        
+        templates = {}
+        for mask in range(8):
+            pos = {}
+            for bit, role in ((1, "subj"), (2, "verb"), (4, "obj")):
+                if mask & bit:
+                    pos[role] = len(pos)
+            
+            edges, types = [], []
+            if "subj" in pos and "verb" in pos:
+                edges.append((pos["subj"], pos["verb"]))
+                types.append(subj_rel)
+            if "verb" in pos and "obj" in pos:
+                edges.append((pos["verb"], pos["obj"]))
+                types.append(obj_rel)
+            for i in range(len(pos)):
+                edges.append((i, i))
+                types.append(self.num_relations)
+            
+            edge_index = torch.tensor(edges, dtype=torch.long).view(-1, 2).t().contiguous()
+            edge_type = torch.tensor(types, dtype=torch.long)
+            templates[mask] = (edge_index.to(self.device), edge_type.to(self.device))
+        return templates
+    
     def _load_model(self) -> torch.nn.Module:
         """학습된 R-GCN 모델 로드"""
         if not self.model_path.exists():
@@ -77,8 +183,8 @@ class RGCNEmbedder:
         model = RGCNModel(self.num_relations, self.IN_DIM, self.HIDDEN, self.OUT_DIM, 
                          self.NUM_BASES, self.HOP, self.SELF_WEIGHT)
         
-        # 학습된 가중치 로드
-        state_dict = torch.load(self.model_path, map_location=self.device, weights_only=False)
+        # 학습된 가중치 로드 (safetensors 파일이 있으면 mmap으로 바로 로드)
+        state_dict = self._load_state_dict()
         model.load_state_dict(state_dict)
         model.to(self.device)
         model.eval()
@@ -86,14 +192,191 @@ class RGCNEmbedder:
         print(f"✅ R-GCN 모델 로드 완료: {self.model_path}")
         return model
     
+    def _load_state_dict(self) -> Dict[str, torch.Tensor]:
+        """
+        R-GCN 가중치 state_dict 로드
+        
+        model_path와 같은 이름의 .safetensors 파일이 있으면 safetensors로 mmap 로드하고,
+        없으면 기존 체크포인트를 load_pt_file로 로드합니다. (weights_only + mmap 우선, 미지원 torch/포맷은 일반 로드)
+        """
+        st_path = self.model_path.with_suffix(".safetensors")
+        if st_path.exists():
+            try:
+                from safetensors.torch import load_file
+                state_dict = load_file(str(st_path), device=self.device)
+                print(f"✅ safetensors 가중치 사용: {st_path}")
+                return state_dict
+            except ImportError:
+                print("⚠️ safetensors 미설치, 기존 체크포인트를 사용합니다")
+        
+        return load_pt_file(self.model_path, map_location=self.device)
+    
+    def _load_embedding_cache(self) -> None:
+        """디스크에 저장된 임베딩 캐시 로드"""
+        if self.emb_cache_path is None or not self.emb_cache_path.exists():
+            return
+        try:
+            cached = load_pt_file(self.emb_cache_path, map_location="cpu")
+            for text, emb in list(cached.items())[-self.emb_cache_size:]:
+                # mmap 로드된 텐서는 종료 시 같은 파일을 덮어쓰면 무효화되므로 메모리로 복사해 보관
+                self._cache_put(text, emb.clone())
+            print(f"✅ 임베딩 캐시 로드 완료: {len(self._emb_cache)}개")
+        except Exception as e:
+            print(f"⚠️ 임베딩 캐시 로드 실패: {e}")
+    
+    def save_embedding_cache(self) -> None:
+        """임베딩 캐시를 디스크에 저장 (재시작 시 재사용)"""
+        if self.emb_cache_path is None or not self._emb_cache:
+            return
+        try:
+            self.emb_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            torch.save({text: emb.clone() for text, emb in self._emb_cache.items()}, self.emb_cache_path)
+        except Exception as e:
+            print(f"⚠️ 임베딩 캐시 저장 실패: {e}")
+    
+    def _cache_put(self, text: str, emb: torch.Tensor) -> None:
+        """
+        임베딩을 모델 연산 dtype(self.dtype)의 CPU 텐서로 LRU 캐시에 저장
+        캐시 적중/미스 모두 같은 값을 반환하도록 반올림 없이 연산 dtype 그대로 보관합니다. (CPU는 FP32, CUDA는 FP16)
+        """
+        emb = emb.detach().to("cpu", self.dtype)
+        if self.device.startswith("cuda"):
+            emb = emb.pin_memory()
+        self._emb_cache[text] = emb
+        self._emb_cache.move_to_end(text)
+        if len(self._emb_cache) > self.emb_cache_size:
+            self._emb_cache.popitem(last=False)
+    
     @torch.no_grad()
-    def embed_text(self, text: str) -> torch.Tensor:
-        """텍스트를 Sentence-BERT로 임베딩"""
-        return self.sbert.encode(text, normalize_embeddings=True, convert_to_tensor=True).float()
+    def _compile_model(self):
+        """
+        CUDA에서 R-GCN forward를 CUDA Graph 기반으로 컴파일하고 엣지 템플릿 형태로 워밍업
+        컴파일에 실패하면 eager 모델을 그대로 사용합니다.
+        """
+        if not self.device.startswith("cuda"):
+            return self.model
+        
+        # RGCNConv basis matmul에 TF32 허용
+        torch.set_float32_matmul_precision("high")
+        try:
+            compiled = torch.compile(self.model, mode="reduce-overhead", dynamic=False)
+            for mask, (edge_index, edge_type) in self._edge_templates.items():
+                num_nodes = bin(mask).count("1")
+                if num_nodes == 0:
+                    continue
+                x = torch.zeros(num_nodes, self.IN_DIM, device=self.device, dtype=self.dtype)
+                compiled(x, edge_index, edge_type)
+            print("✅ R-GCN 모델 컴파일 완료 (reduce-overhead)")
+            return compiled
+        except Exception as e:
+            print(f"⚠️ torch.compile 실패, eager 모드 사용: {e}")
+            return self.model
     
-    def create_triple_subgraph(self, subject: str, verb: str, object_text: str = None) -> HeteroData:
+    @torch.no_grad()
+    def embed_text(self, text: str, normalize: bool = False) -> torch.Tensor:
         """
-        Triple을 서브그래프로 변환
+        텍스트를 Sentence-BERT로 임베딩
+        
+        Args:
+            text: 임베딩할 텍스트
+            normalize: 결과를 L2 정규화할지 여부 (R-GCN 입력으로 쓸 때는 불필요)
+        """
+        return self.embed_texts([text], normalize=normalize)[0]
+    
+    @torch.no_grad()
+    def embed_texts(self, texts: List[str], normalize: bool = False) -> torch.Tensor:
+        """여러 텍스트를 한 번의 Sentence-BERT 호출로 임베딩 ([N, D], FP32)"""
+        embs = self._encode(texts).float()
+        return F.normalize(embs, dim=-1) if normalize else embs
+    
+    @torch.no_grad()
+    def embed_texts_batched(self, texts: List[str], bucket_size: int = 32, normalize: bool = False) -> torch.Tensor:
+        """
+        많은 텍스트를 길이순 버킷으로 나눠 임베딩 ([N, D], FP32)
+        길이가 비슷한 문장끼리 묶어 패딩 토큰을 줄이고, 결과는 입력 순서로 반환합니다.
+        """
+        embs = self._encode(texts, bucket_size).float()
+        return F.normalize(embs, dim=-1) if normalize else embs
+    
+    @torch.no_grad()
+    def embed_triples(self, triples: List[Tuple[str, str, Optional[str]]]) -> List[Tuple[Optional[torch.Tensor], ...]]:
+        """
+        여러 triple의 subject/verb/object를 한 번에 SBERT로 임베딩
+        
+        Args:
+            triples: (subject, verb, object) 리스트
+        
+        Returns:
+            List[Tuple]: triple별 (subject_emb, verb_emb, object_emb), 없는 역할은 None
+        """
+        texts, slots = [], []
+        for t_idx, triple in enumerate(triples):
+            for role, token in enumerate(triple[:3]):
+                if token in _EMPTY_TOKENS:
+                    continue
+                # verb는 그대로, subject/object는 문장으로 변환
+                texts.append(token if role == 1 else self._token_to_sentence(token))
+                slots.append((t_idx, role))
+        
+        results = [[None, None, None] for _ in triples]
+        if texts:
+            # 검색용 벡터로 바로 반환되므로 단위 벡터로 정규화
+            embs = self.embed_texts_batched(texts, normalize=True)
+            for row, (t_idx, role) in enumerate(slots):
+                results[t_idx][role] = embs[row]
+        return [tuple(r) for r in results]
+    
+    @torch.no_grad()
+    def _encode_uncached(self, texts: List[str], bucket_size: int) -> List[torch.Tensor]:
+        """캐시에 없는 텍스트를 길이순 버킷 단위로 인코딩 (입력 순서 유지)"""
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        out: List[Optional[torch.Tensor]] = [None] * len(texts)
+        for start in range(0, len(order), bucket_size):
+            idx = order[start:start + bucket_size]
+            chunk = [texts[i] for i in idx]
+            if self.onnx_encoder is not None:
+                embs = torch.from_numpy(self.onnx_encoder.encode(chunk))
+            else:
+                with torch.autocast(device_type="cuda", dtype=torch.float16, enabled=self.use_fp16):
+                    # 정규화는 소비하는 쪽에서 필요할 때만 수행 (R-GCN 입력은 단위 벡터일 필요 없음)
+                    embs = self.sbert.encode(chunk, batch_size=len(chunk), normalize_embeddings=False,
+                                             convert_to_tensor=True)
+            for i, emb in zip(idx, embs):
+                out[i] = emb
+        return out
+    
+    @torch.no_grad()
+    def _encode(self, texts: List[str], bucket_size: int = 32) -> torch.Tensor:
+        """
+        텍스트를 모델 연산 dtype(self.dtype)으로 임베딩 ([N, D])
+        캐시에 있는 문장은 SBERT를 다시 실행하지 않습니다.
+        """
+        # 캐시 적중분만 pinned CPU 메모리에서 디바이스로 복사
+        found = {}
+        for text in texts:
+            if text in found:
+                continue
+            emb = self._emb_cache.get(text)
+            if emb is not None:
+                self._emb_cache.move_to_end(text)
+                found[text] = emb.to(self.device, self.dtype, non_blocking=True)
+        
+        # 새로 인코딩한 임베딩은 디바이스에 있는 결과를 그대로 사용 (캐시에는 CPU 사본 저장)
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            for text, emb in zip(missing, self._encode_uncached(missing, bucket_size)):
+                self._cache_put(text, emb)
+                found[text] = emb.to(self.device, self.dtype, non_blocking=True)
+        
+        return torch.stack([found[text] for text in texts])
+    
+    def build_homo_tensors(self, subject: str, verb: str, object_text: str = None
+                           ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, Dict[str, int]]:
+        """
+        Triple을 R-GCN 입력용 동종(homogeneous) 그래프 텐서로 변환
+        
+        존재하는 노드만 subject, verb, object 순으로 배치하고
+        (subject, verb, object) 존재 여부 마스크에 맞는 사전 생성 엣지 템플릿을 사용합니다.
         
         Args:
             subject: 주어 (예: "person:man")
@@ -101,81 +384,28 @@ class RGCNEmbedder:
             object_text: 목적어 (예: "object:car" 또는 None)
         
         Returns:
-            HeteroData: 서브그래프 데이터
+            Tuple: (x [N, D], edge_index [2, E], edge_type [E] (self-loop 포함), roles: 역할 -> 행 인덱스)
         """
-        data = HeteroData()
-        
-        # 노드 생성
-        nodes = []
-        node_types = []
-        node_id_map = {}
-        
-        # Subject 노드 (object 타입)
-        if subject and subject != "None":
-            subj_text = self._token_to_sentence(subject)
-            subj_emb = self.embed_text(subj_text)
-            nodes.append(subj_emb)
-            node_types.append(1)  # object type
-            node_id_map[subject] = len(nodes) - 1
-        
-        # Verb 노드 (event 타입)
-        if verb and verb != "None":
-            verb_emb = self.embed_text(verb)
-            nodes.append(verb_emb)
-            node_types.append(2)  # event type
-            node_id_map[verb] = len(nodes) - 1
-        
-        # Object 노드 (object 타입)
-        if object_text and object_text not in ("None", "none", ""):
-            obj_text = self._token_to_sentence(object_text)
-            obj_emb = self.embed_text(obj_text)
-            nodes.append(obj_emb)
-            node_types.append(1)  # object type
-            node_id_map[object_text] = len(nodes) - 1
-        
-        if not nodes:
+        texts, mask, roles = self._triple_nodes(subject, verb, object_text)
+        if not texts:
             raise ValueError("유효한 노드가 없습니다.")
         
-        # 노드 특성 및 타입 설정
-        data["object"].x = torch.stack([nodes[i] for i, t in enumerate(node_types) if t == 1])
-        data["event"].x = torch.stack([nodes[i] for i, t in enumerate(node_types) if t == 2])
-        
-        # 노드 타입 설정
-        data["object"].node_type = torch.full((data["object"].x.size(0),), 1)
-        data["event"].node_type = torch.full((data["event"].x.size(0),), 2)
-        
-        # 엣지 생성
-        edge_indices = []
-        edge_types = []
-        
-        # Subject -> Event 관계
-        if subject in node_id_map and verb in node_id_map:
-            subj_idx = node_id_map[subject]
-            verb_idx = node_id_map[verb]
-            edge_indices.append([subj_idx, verb_idx])
-            edge_types.append(self.edge2id.get("object_subject_of_event_event", 0))
-        
-        # Event -> Object 관계
-        if verb in node_id_map and object_text in node_id_map:
-            verb_idx = node_id_map[verb]
-            obj_idx = node_id_map[object_text]
-            edge_indices.append([verb_idx, obj_idx])
-            edge_types.append(self.edge2id.get("event_object_of_event_object", 1))
-        
-        # 엣지 설정
-        if edge_indices:
-            edge_index = torch.tensor(edge_indices, dtype=torch.long).t()
-            edge_type = torch.tensor(edge_types, dtype=torch.long)
-            
-            # HeteroData에 엣지 추가
-            if subject in node_id_map and verb in node_id_map:
-                data[("object", "subject_of_event", "event")].edge_index = edge_index
-                data[("object", "subject_of_event", "event")].edge_type = edge_type
-            elif verb in node_id_map and object_text in node_id_map:
-                data[("event", "object_of_event", "object")].edge_index = edge_index
-                data[("event", "object_of_event", "object")].edge_type = edge_type
-        
-        return data
+        x = self._encode(texts)
+        edge_index, edge_type = self._edge_templates[mask]
+        return x, edge_index, edge_type, roles
+    
+    def _triple_nodes(self, subject: str, verb: str, object_text: str = None
+                      ) -> Tuple[List[str], int, Dict[str, int]]:
+        """Triple의 존재하는 노드 텍스트(subject, verb, object 순), 존재 여부 마스크, 역할 -> 행 인덱스"""
+        texts, roles, mask = [], {}, 0
+        for bit, role, token in ((1, "subject", subject), (2, "verb", verb), (4, "object", object_text)):
+            if token in _EMPTY_TOKENS:
+                continue
+            roles[role] = len(texts)
+            # verb는 그대로, subject/object는 문장으로 변환
+            texts.append(token if role == "verb" else self._token_to_sentence(token))
+            mask |= bit
+        return texts, mask, roles
     
     def _token_to_sentence(self, token: str) -> str:
         """토큰을 문장으로 변환"""
@@ -198,60 +428,122 @@ class RGCNEmbedder:
         Returns:
             Tuple[torch.Tensor, torch.Tensor, torch.Tensor]: (subject_emb, verb_emb, object_emb)
         """
-        try:
-            # Object가 None인 경우 SBERT로 fallback
-            if not object_text or object_text in ("None", "none", ""):
-                print("⚠️ Object가 None이므로 SBERT로 fallback")
-                subject_emb = self.embed_text(self._token_to_sentence(subject)) if subject and subject != "None" else None
-                verb_emb = self.embed_text(verb) if verb and verb != "None" else None
-                object_emb = None
-                return subject_emb, verb_emb, object_emb
-            
-            # 서브그래프 생성
-            subgraph = self.create_triple_subgraph(subject, verb, object_text)
-            
-            # Homogeneous 그래프로 변환
-            homo_data = subgraph.to_homogeneous(
-                node_attrs=["x", "node_type"],
-                add_node_type=True,
-                add_edge_type=False
-            )
-            
-            # R-GCN으로 임베딩
-            with torch.no_grad():
-                embeddings = self.model(
-                    homo_data.x.to(self.device),
-                    homo_data.edge_index.to(self.device),
-                    homo_data.edge_type.to(self.device)
-                )
-            
-            # 원래 노드 타입에 따라 임베딩 분리
-            subject_emb = None
-            verb_emb = None
-            object_emb = None
-            
-            node_idx = 0
-            if subject and subject != "None":
-                subject_emb = embeddings[node_idx]
-                node_idx += 1
-            
-            if verb and verb != "None":
-                verb_emb = embeddings[node_idx]
-                node_idx += 1
-            
-            if object_text and object_text not in ("None", "none", ""):
-                object_emb = embeddings[node_idx]
+        # Object가 None인 경우(또는 노드가 없는 경우) R-GCN 없이 SBERT 임베딩만 사용
+        if object_text in _EMPTY_TOKENS:
+            logger.debug("Object가 None이므로 SBERT로 fallback: (%s, %s)", subject, verb)
+            return self.embed_triples([(subject, verb, None)])[0]
+        
+        # eval 모드 R-GCN 출력은 입력에 대해 결정적이므로 동일 triple은 캐시에서 반환
+        key = (subject, verb, object_text)
+        cached = self._triple_cache.get(key)
+        if cached is not None:
+            self._triple_cache.move_to_end(key)
+            return tuple(None if emb is None else emb.to(self.device, torch.float32, non_blocking=True)
+                         for emb in cached)
+        
+        x, edge_index, edge_type, roles = self.build_homo_tensors(subject, verb, object_text)
+        
+        # R-GCN으로 임베딩 (pgvector 저장/비교를 위해 결과는 FP32로 반환)
+        with torch.no_grad(), torch.autocast(device_type="cuda", dtype=torch.float16, enabled=self.use_fp16):
+            embeddings = self._forward(x, edge_index, edge_type).float()
+        
+        # subject, verb, object 순으로 배치된 행을 분리
+        subject_emb = embeddings[roles["subject"]] if "subject" in roles else None
+        verb_emb = embeddings[roles["verb"]] if "verb" in roles else None
+        object_emb = embeddings[roles["object"]]
+        
+        self._triple_cache_put(key, (subject_emb, verb_emb, object_emb))
+        return subject_emb, verb_emb, object_emb
+    
+    @torch.no_grad()
+    def embed_triples_batch(self, triples: List[Tuple[str, str, Optional[str]]]) -> List[Tuple[Optional[torch.Tensor], ...]]:
+        """
+        여러 triple을 하나의 분리 합집합(disjoint-union) 그래프로 묶어 R-GCN forward 1회로 임베딩
+        
+        결과는 triple별 embed_triple_with_rgcn과 동일합니다.
+        (object가 없는 triple은 SBERT 임베딩, 캐시에 있는 triple은 캐시 값 사용)
+        
+        Args:
+            triples: (subject, verb, object) 리스트
+        
+        Returns:
+            List[Tuple]: triple별 (subject_emb, verb_emb, object_emb), 없는 역할은 None
+        """
+        results: List[Optional[Tuple[Optional[torch.Tensor], ...]]] = [None] * len(triples)
+        
+        # object가 없는 triple은 SBERT 임베딩을 한 번에 계산
+        no_obj = [i for i, t in enumerate(triples) if t[2] in _EMPTY_TOKENS]
+        if no_obj:
+            for i, embs in zip(no_obj, self.embed_triples([(triples[i][0], triples[i][1], None) for i in no_obj])):
+                results[i] = embs
+        
+        # 캐시에 없는 triple만 노드/엣지를 오프셋을 더해 하나의 그래프로 이어 붙임
+        texts, edge_indices, edge_types, pending = [], [], [], []
+        for i, (subject, verb, object_text) in enumerate(t[:3] for t in triples):
+            if results[i] is not None:
+                continue
+            key = (subject, verb, object_text)
+            cached = self._triple_cache.get(key)
+            if cached is not None:
+                self._triple_cache.move_to_end(key)
+                results[i] = tuple(None if emb is None else emb.to(self.device, torch.float32, non_blocking=True)
+                                   for emb in cached)
+                continue
             
-            return subject_emb, verb_emb, object_emb
+            node_texts, mask, roles = self._triple_nodes(subject, verb, object_text)
+            edge_index, edge_type = self._edge_templates[mask]
+            # 템플릿에 self-loop가 포함되어 있으므로 노드 오프셋만 더하면 합집합 그래프의 self-loop도 완성됨
+            edge_indices.append(edge_index + len(texts))
+            edge_types.append(edge_type)
+            pending.append((i, key, {role: row + len(texts) for role, row in roles.items()}))
+            texts.extend(node_texts)
+        
+        if pending:
+            x = self._encode(texts)
+            edge_index = torch.cat(edge_indices, dim=1)
+            edge_type = torch.cat(edge_types)
             
-        except Exception as e:
-            print(f"❌ R-GCN 임베딩 실패: {e}")
-            # 실패 시 원본 SBERT 임베딩 반환
-            subject_emb = self.embed_text(self._token_to_sentence(subject)) if subject and subject != "None" else None
-            verb_emb = self.embed_text(verb) if verb and verb != "None" else None
-            object_emb = self.embed_text(self._token_to_sentence(object_text)) if object_text and object_text not in ("None", "none", "") else None
+            # 노드 수가 배치마다 달라지므로 정적 형태로 컴파일된 forward 대신 eager 모델 사용
+            with torch.autocast(device_type="cuda", dtype=torch.float16, enabled=self.use_fp16):
+                embeddings = self.model(x, edge_index, edge_type).float()
             
-            return subject_emb, verb_emb, object_emb
+            for i, key, roles in pending:
+                embs = tuple(embeddings[roles[role]] if role in roles else None
+                             for role in ("subject", "verb", "object"))
+                self._triple_cache_put(key, embs)
+                results[i] = embs
+        
+        return results
+    
+    def _triple_cache_put(self, key: Tuple[str, str, Optional[str]],
+                          embs: Tuple[Optional[torch.Tensor], ...]) -> None:
+        """
+        R-GCN triple 임베딩을 모델 연산 dtype(self.dtype)의 CPU 텐서로 LRU 캐시에 저장
+        R-GCN 출력은 이 dtype에서 계산되므로 반올림이 없고, 캐시 적중 시에도 미스 때와 같은 FP32 값을 반환합니다.
+        """
+        self._triple_cache[key] = tuple(None if emb is None else emb.detach().to("cpu", self.dtype)
+                                        for emb in embs)
+        self._triple_cache.move_to_end(key)
+        if len(self._triple_cache) > self.triple_cache_size:
+            self._triple_cache.popitem(last=False)
+
+
+def _rgcn_mix_eager(out: torch.Tensor, h: torch.Tensor, w: float, relu: bool) -> torch.Tensor:
+    """레이어 출력과 입력의 가중 합 (torch.compile 중에는 이 식을 그대로 추적해 inductor가 융합)"""
+    if relu:
+        h = torch.relu(h)
+    return w * out + (1.0 - w) * h
+
+
+# eager 경로용 TorchScript 버전 (element-wise 연산을 하나의 커널로 융합)
+_rgcn_mix = torch.jit.script(_rgcn_mix_eager)
+
+
+# torch.compile 추적 중인지 여부 (구버전 torch는 torch._dynamo API 사용)
+try:
+    from torch.compiler import is_compiling as _is_compiling
+except ImportError:
+    from torch._dynamo import is_compiling as _is_compiling
 
 
 class RGCNModel(torch.nn.Module):
@@ -272,14 +564,35 @@ class RGCNModel(torch.nn.Module):
         ])
     
     def forward(self, x, edge_index, edge_type):
-        N = x.size(0)
-        loop_idx = torch.arange(N, device=x.device)
-        self_loops = torch.stack([loop_idx, loop_idx])
-        loop_types = torch.full((N,), self.self_loop_id, dtype=torch.long, device=x.device)
-        edge_index = torch.cat([edge_index, self_loops], dim=1)
-        edge_type = torch.cat([edge_type, loop_types])
+        """
+        edge_index/edge_type에는 노드별 self-loop(타입 self_loop_id)가 이미 포함되어 있어야 합니다.
+        (RGCNEmbedder의 엣지 템플릿이 미리 넣어 두므로 forward 안에서는 텐서를 만들지 않음)
+        """
+        # 컴파일된 forward에서 ScriptFunction을 호출하면 그래프가 끊기므로(CUDA Graph 분할) 일반 식을 사용
+        mix = _rgcn_mix_eager if _is_compiling() else _rgcn_mix
         out = x
         for i, conv in enumerate(self.convs):
             h = conv(out, edge_index, edge_type)
-            out = self.self_weight * out + (1 - self.self_weight) * (F.relu(h) if i < len(self.convs) - 1 else h)
+            out = mix(out, h, self.self_weight, i < len(self.convs) - 1)
         return out
+
+
+def export_safetensors(model_path: str, output_path: Optional[str] = None) -> Path:
+    """
+    기존 .pt 체크포인트를 safetensors 포맷으로 변환 (배포 시 1회 실행)
+    
+    Args:
+        model_path: 기존 체크포인트 경로
+        output_path: 저장 경로 (기본값: model_path와 같은 이름의 .safetensors)
+    
+    Returns:
+        Path: 저장된 safetensors 파일 경로
+    """
+    from safetensors.torch import save_file
+    
+    model_path = Path(model_path)
+    output_path = Path(output_path) if output_path else model_path.with_suffix(".safetensors")
+    state_dict = torch.load(model_path, map_location="cpu", weights_only=True)
+    save_file({k: v.contiguous() for k, v in state_dict.items()}, str(output_path))
+    print(f"✅ safetensors 변환 완료: {output_path}")
+    return output_path
@@ -4,22 +4,344 @@
 모든 DB API 접근 기능을 통합한 클래스
 """
 
+from __future__ import annotations
+
 import os
+import re
+import base64
+import copy
 import json
+import functools
+import hashlib
+import logging
+import struct
+import threading
+import time
 import requests
-import torch
-import torch.nn.functional as F
-import heapq
-from typing import Dict, List, Any, Optional, Tuple
-from dotenv import load_dotenv
-from sentence_transformers import SentenceTransformer
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Dict, List, Any, NamedTuple, Optional, Tuple
 
 # 기존 클라이언트 모듈들 import
-from util import VideoDataDeleter, SceneGraphDataChecker, SceneGraphAPIUploader
+from util import VideoDataDeleter, SceneGraphDataChecker, SceneGraphAPIUploader, create_http_session, load_pt_file
 from util.schema_info import SchemaInfoChecker
 
-# 환경 변수 로드
-load_dotenv()
+# torch / sentence_transformers / search_core는 검색·PT 로드 시에만 import
+# (업로드·조회만 하는 스크립트가 수 초의 import 비용과 수백 MB 메모리를 쓰지 않도록)
+if TYPE_CHECKING:
+    import torch
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+logger = logging.getLogger(__name__)
+
+# 장면그래프 파일명 패턴: "{drama}_{episode}_visual_{start}-{end}_..._meta_info[ (n)].json"
+_FILENAME_RE = re.compile(r'(.+)_(.+)_visual_(\d+)-(\d+)_.*_meta_info(?: \(\d+\))?\.json')
+
+# vector_search 질의 캐시 최대 항목 수
+QUERY_CACHE_MAXSIZE = 512
+
+# 조회(GET) 결과 캐시 설정: 같은 세션에서 반복 조회 시 서버 재요청 방지
+GET_CACHE_MAXSIZE = 512
+GET_CACHE_TTL = 30  # 초
+
+# 헬스 체크 성공 결과 유지 시간 (초)
+HEALTH_CHECK_TTL = 30.0
+
+# 장면 내 유사도 검색 결과 캐시 최대 항목 수 ((쿼리 벡터, 노드 타입, 장면, tau)별)
+SCENE_SEARCH_CACHE_MAXSIZE = 4096
+
+# predicate 노드별 장면 내 검색을 동시에 보낼 스레드 수 (HTTP 커넥션 풀 크기 이하)
+SCENE_SEARCH_MAX_WORKERS = 16
+
+
+_verbose_logging_lock = threading.Lock()
+
+# 스레드별 업로드 진행 로그 억제 여부 (upload_scene_graphs의 워커는 진행률 표시줄만 출력)
+_upload_output = threading.local()
+
+
+def _enable_verbose_logging() -> None:
+    """항목별 업로드/검색 로그(logger.debug)를 콘솔에 출력"""
+    with _verbose_logging_lock:
+        logger.setLevel(logging.DEBUG)
+        if not logger.handlers:
+            logger.addHandler(logging.StreamHandler())
+
+
+def _progress(message: str) -> None:
+    """업로드 진행 로그 출력 (현재 스레드가 quiet 업로드 중이면 생략, 오류 로그는 print로 항상 출력)"""
+    if not getattr(_upload_output, "quiet", False):
+        print(message)
+
+
+class _LazyIds:
+    """logger.debug 인자용 노드 ID 리스트 (로그가 실제로 출력될 때만 리스트를 만듦)"""
+    
+    __slots__ = ("nodes", "key")
+    
+    def __init__(self, nodes: List[Dict[str, Any]], key: str):
+        self.nodes = nodes
+        self.key = key
+    
+    def __str__(self) -> str:
+        return str([node[self.key] for node in self.nodes])
+
+
+def _dumps(obj: Any) -> bytes:
+    """요청 본문 JSON 직렬화 (orjson이 있으면 사용, numpy 배열도 그대로 직렬화)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, default=lambda o: o.tolist()).encode('utf-8')
+
+
+# 서버 embeddings.embedding 컬럼(Vector(384))과 동일한 임베딩 차원
+EMBEDDING_DIM = 384
+
+# PT node_type 값 -> 노드 타입 (0=scene 등 나머지는 임베딩 저장 제외)
+_NODE_TYPE_BY_INDEX = {1: 'object', 2: 'event', 3: 'spatial'}
+
+# node_type 정보가 없을 때 orig_id // 1000 -> 노드 타입 (서버 database_manager와 동일)
+_ORIG_ID_TYPE_TABLE = {1: 'object', 2: 'temporal', 3: 'event', 11: 'spatial'}
+
+
+def _as_embedding_matrix(embeddings: Any, count: int) -> Optional[np.ndarray]:
+    """
+    임베딩 목록을 (count, EMBEDDING_DIM) float32 연속 행렬로 한 번에 변환/검증
+    
+    행별 검사 대신 shape 한 번으로 개수와 차원을 확인하며, 이후 행 슬라이스는 복사 없는 뷰입니다.
+    
+    Returns:
+        np.ndarray 또는 형식이 맞지 않으면 None
+    """
+    try:
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    except (TypeError, ValueError) as e:
+        print(f"❌ 임베딩을 float32 행렬로 변환할 수 없음: {e}")
+        return None
+    if matrix.shape != (count, EMBEDDING_DIM):
+        print(f"❌ 임베딩 형식 불일치: {matrix.shape} (기대값: ({count}, {EMBEDDING_DIM}))")
+        return None
+    return matrix
+
+
+class _EmbeddingBatch(NamedTuple):
+    """
+    업로드할 임베딩 묶음 (항목별 dict 대신 병렬 리스트 + float32 행렬)
+    
+    행렬은 원본 임베딩에서 저장 대상 행만 한 번에 골라낸 것이므로
+    바이너리/base64 직렬화 시 행을 다시 모으지 않고 그대로 바이트로 보냅니다.
+    """
+    node_ids: List[str]
+    node_types: List[str]
+    vectors: np.ndarray  # (N, EMBEDDING_DIM) float32
+    labels: List[str]    # 로그 출력용 라벨
+    
+    @classmethod
+    def empty(cls) -> "_EmbeddingBatch":
+        return cls([], [], np.empty((0, EMBEDDING_DIM), dtype=np.float32), [])
+    
+    def with_prefix(self, prefix: str) -> "_EmbeddingBatch":
+        """node_id 앞에 접두사를 붙인 묶음 (행렬과 라벨은 그대로 공유)"""
+        return self._replace(node_ids=[prefix + node_id for node_id in self.node_ids])
+    
+    def as_items(self) -> List[Dict[str, Any]]:
+        """JSON bulk/항목별 POST용 항목 리스트 (embedding은 행렬 행의 뷰)"""
+        return [
+            {"node_id": node_id, "node_type": node_type, "embedding": vector}
+            for node_id, node_type, vector in zip(self.node_ids, self.node_types, self.vectors)
+        ]
+
+
+def _pack_embeddings(batch: _EmbeddingBatch) -> bytes:
+    """
+    임베딩 묶음을 바이너리 bulk 포맷으로 직렬화
+    
+    [헤더 길이 (4바이트 little-endian uint32)][JSON 헤더 {node_ids, node_types, dim}][float32 행렬 (little-endian)]
+    """
+    header = _dumps({
+        "node_ids": batch.node_ids,
+        "node_types": batch.node_types,
+        "dim": int(batch.vectors.shape[1])
+    })
+    return struct.pack('<I', len(header)) + header + batch.vectors.astype('<f4', copy=False).tobytes()
+
+
+@functools.lru_cache(maxsize=1024)
+def _video_unique_id(drama_name: str, episode_number: str) -> int:
+    """(드라마명, 에피소드) -> video_unique_id (같은 입력은 해시를 다시 계산하지 않음)"""
+    # 기존에 저장된 video_unique_id와 호환되도록 MD5 상위 28비트를 사용
+    # (hexdigest()[:7]을 16진수로 파싱한 값과 동일하며, 문자열 변환 없이 digest에서 바로 계산)
+    content = f"{drama_name}_{episode_number}"
+    digest = hashlib.md5(content.encode()).digest()
+    return (int.from_bytes(digest[:4], "big") >> 4) % 2000000000  # 20억 미만으로 제한
+
+
+def _to_node_id(raw: Any, prefix: str) -> str:
+    """장면 내 숫자 ID(정수 또는 숫자 문자열)는 prefix를 붙여 전역 node_id로 변환하고, 그 외는 문자열 그대로 사용"""
+    if type(raw) is int and raw >= 0:
+        return prefix + str(raw)
+    raw = str(raw)
+    return prefix + raw if raw.isdigit() else raw
+
+
+# 장면그래프 노드 -> API 항목 변환
+# base는 "{video_unique_id}_{scene_id}_" 형태의 node_id 접두사이며,
+# scene_id를 아직 모르는 /scenes/full 업로드에서는 SCENE_PREFIX_TOKEN을 넣어 서버가 치환합니다.
+SCENE_PREFIX_TOKEN = "$SCENE_PREFIX_"
+
+
+def _object_items(objects: List[Dict[str, Any]], base: str) -> List[Dict[str, Any]]:
+    """객체 노드 항목 생성"""
+    return [
+        {
+            "object_id": f"{base}object_{obj.get('object_id')}",
+            "super_type": obj.get('super_type', 'unknown'),
+            "type_of": obj.get('type of', 'unknown'),
+            # label이 없으면 type of를 사용
+            "label": obj.get('label') or obj.get('type of', 'unknown'),
+            "attributes": obj.get('attributes', {})
+        }
+        for obj in objects
+    ]
+
+
+def _event_items(events: List[Dict[str, Any]], base: str) -> List[Dict[str, Any]]:
+    """이벤트 노드 항목 생성 (subject/object는 객체 node_id로 매핑)"""
+    event_prefix, object_prefix = base + "event_", base + "object_"
+    return [
+        {
+            "event_id": event_prefix + str(event.get('event_id', f"EVT_{i}")),
+            "subject_id": _to_node_id(event.get('subject', ''), object_prefix),
+            "verb": event.get('verb', 'unknown_action'),
+            "object_id": _to_node_id(event['object'], object_prefix) if event.get('object') else None,
+            "attributes": {"attribute": event.get('attribute', '')}
+        }
+        for i, event in enumerate(events)
+    ]
+
+
+def _spatial_items(spatial: List[Dict[str, Any]], base: str) -> List[Dict[str, Any]]:
+    """공간 관계 항목 생성 (subject/object는 객체 node_id로 매핑)"""
+    spatial_prefix, object_prefix = base + "spatial_", base + "object_"
+    return [
+        {
+            "spatial_id": spatial_prefix + str(rel.get('spatial_id', f"SPAT_{i}")),
+            "subject_id": _to_node_id(rel.get('subject', ''), object_prefix),
+            "predicate": rel.get('predicate', 'unknown_relation'),
+            "object_id": _to_node_id(rel.get('object', ''), object_prefix)
+        }
+        for i, rel in enumerate(spatial)
+    ]
+
+
+def _temporal_items(temporal: List[Dict[str, Any]], base: str) -> List[Dict[str, Any]]:
+    """시간 관계 항목 생성 (subject/object는 이벤트 node_id로 매핑)"""
+    temporal_prefix, event_prefix = base + "temporal_", base + "event_"
+    return [
+        {
+            "temporal_id": temporal_prefix + str(rel.get('temporal_id', f"TEMP_{i}")),
+            "subject_id": _to_node_id(rel.get('subject', ''), event_prefix),
+            "predicate": rel.get('predicate', 'unknown_relation'),
+            "object_id": _to_node_id(rel.get('object', ''), event_prefix)
+        }
+        for i, rel in enumerate(temporal)
+    ]
+
+
+def _embedding_batch(node_info: List[Dict[str, Any]], node_embeddings: np.ndarray,
+                     base: str) -> _EmbeddingBatch:
+    """임베딩 묶음 생성 (scene 노드 제외, node_id: {base}{node_type}_{orig_id})"""
+    keep = [i for i, node in enumerate(node_info) if node['node_type'] != 'scene']
+    nodes = [node_info[i] for i in keep]
+    return _EmbeddingBatch(
+        node_ids=[f"{base}{node['node_type']}_{node.get('node_id')}" for node in nodes],
+        node_types=[node['node_type'] for node in nodes],
+        vectors=node_embeddings[np.asarray(keep, dtype=np.intp)],
+        labels=[f"{node.get('node_label', 'unknown')} ({node['node_type']})" for node in nodes]
+    )
+
+
+def _pt_embedding_batch(pt_data: Dict[str, Any], base: str) -> Optional[_EmbeddingBatch]:
+    """
+    PT 데이터(z, orig_id, node_type)에서 임베딩 묶음 생성
+    
+    node_id: {base}{node_type}_{orig_id}, ID 0(scene 노드)과 타입을 알 수 없는 노드는 제외
+    
+    Returns:
+        _EmbeddingBatch, 임베딩 정보가 없거나 형식이 맞지 않으면 None
+    """
+    if 'z' not in pt_data or 'orig_id' not in pt_data:
+        print("❌ PT 데이터에 임베딩 정보가 없습니다.")
+        return None
+    
+    orig_ids = pt_data['orig_id']
+    node_types = pt_data.get('node_type', [])
+    
+    embeddings = _as_embedding_matrix(pt_data['z'], len(orig_ids))
+    if embeddings is None:
+        return None
+    
+    # 노드 타입 결정 (벡터 연산으로 한 번에 계산)
+    # - node_type 정보가 있는 인덱스: _NODE_TYPE_BY_INDEX
+    # - node_type 정보가 없는 인덱스: orig_id // 1000으로 _ORIG_ID_TYPE_TABLE 조회
+    oids = np.asarray(orig_ids, dtype=np.int64).ravel()
+    nts = np.zeros(len(oids), dtype=np.int64)
+    given = np.asarray(node_types, dtype=np.int64).ravel()[:len(oids)]
+    nts[:len(given)] = given
+    has_nt = np.arange(len(oids)) < len(given)
+    types_from_nt = np.select([nts == k for k in _NODE_TYPE_BY_INDEX],
+                              list(_NODE_TYPE_BY_INDEX.values()), default='')
+    buckets = oids // 1000
+    types_from_oid = np.select([buckets == k for k in _ORIG_ID_TYPE_TABLE],
+                               list(_ORIG_ID_TYPE_TABLE.values()), default='')
+    types = np.where(has_nt, types_from_nt, types_from_oid)
+    
+    # ID 0은 특별한 노드이므로 건너뛰기
+    keep = np.flatnonzero((oids != 0) & (types != ''))
+    
+    kept_types = types[keep].tolist()
+    kept_oids = oids[keep].tolist()
+    labels = [f"{node_type}_{orig_id}" for node_type, orig_id in zip(kept_types, kept_oids)]
+    return _EmbeddingBatch(
+        node_ids=[base + label for label in labels],
+        node_types=kept_types,
+        vectors=embeddings[keep],
+        labels=labels
+    )
+
+
+def _b64_embeddings(batch: _EmbeddingBatch) -> Dict[str, Any]:
+    """
+    임베딩 묶음을 /scenes/full 본문용 필드로 변환
+    
+    벡터는 float32(little-endian) 행렬 하나를 base64로 인코딩해 보내므로
+    384개 실수를 항목마다 JSON 숫자로 직렬화/파싱하지 않습니다.
+    """
+    if not batch.node_ids:
+        return {}
+    return {
+        "embedding_ids": batch.node_ids,
+        "embedding_types": batch.node_types,
+        "embedding_dim": int(batch.vectors.shape[1]),
+        "embeddings_b64": base64.b64encode(batch.vectors.astype('<f4', copy=False).tobytes()).decode('ascii')
+    }
+
+
+def _loads(data: bytes) -> Any:
+    """응답 본문 JSON 파싱 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class SceneGraphDBClient:
     """
@@ -32,29 +354,160 @@ class SceneGraphDBClient:
     - 기본적인 DB API 접근 기능
     """
     
-    def __init__(self, db_api_base_url: str = None):
+    def __init__(self, db_api_base_url: str = None, http2: bool = False):
         """
         초기화
         
         Args:
             db_api_base_url: API 서버 URL (기본값: 환경변수 API_URL 또는 http://localhost:8000)
+            http2: httpx HTTP/2 클라이언트 사용 여부 (httpx[http2] 미설치 시 requests 세션 사용)
         """
-        self.db_api_base_url = db_api_base_url or os.getenv("API_URL", "http://localhost:8000")
-        self.session = requests.Session()
-        
-        # 하위 클라이언트들 초기화
-        self.deleter = VideoDataDeleter(self.db_api_base_url)
-        self.checker = SceneGraphDataChecker(self.db_api_base_url)
-        self.uploader = SceneGraphAPIUploader(self.db_api_base_url)
+        if db_api_base_url is None:
+            # .env는 URL을 명시하지 않은 경우에만 로드 (import 시 파일 탐색 비용 제거)
+            from dotenv import load_dotenv
+            load_dotenv()
+            db_api_base_url = os.getenv("API_URL", "http://localhost:8000")
+        self.db_api_base_url = db_api_base_url
+        self.http2 = False
+        self.session = self._create_session(http2)
+        
+        # 하위 클라이언트들 초기화 (하나의 세션/커넥션 풀을 공유)
+        # 하위 클라이언트는 requests 예외로 오류를 처리하므로 HTTP/2 사용 시에는 별도 requests 세션을 공유
+        self._shared_session = self.session if isinstance(self.session, requests.Session) else self._create_session()
+        self.deleter = VideoDataDeleter(self.db_api_base_url, session=self._shared_session)
+        self.checker = SceneGraphDataChecker(self.db_api_base_url, session=self._shared_session)
+        self.uploader = SceneGraphAPIUploader(self.db_api_base_url, session=self._shared_session)
         self.schema_checker = SchemaInfoChecker()
         
+        # 조회 결과 캐시 (cachetools 미설치 시 dict + 저장 시각으로 TTL 확인)
+        self._get_cache = TTLCache(maxsize=GET_CACHE_MAXSIZE, ttl=GET_CACHE_TTL) if TTLCache else {}
+        # TTLCache는 스레드 안전하지 않으므로 조회/저장/비우기는 락 안에서 수행 (스레드 풀 조회/업로드에서 동시 접근)
+        self._get_cache_lock = threading.Lock()
+        
+        # 마지막으로 헬스 체크에 성공한 시각 (time.monotonic)
+        self._last_health_ok = 0.0
+        
+        # 검색용 SBERT 모델 (첫 검색 시 로드 후 재사용)
+        self._bert = None
+        # 문장 -> 임베딩 LRU 캐시 (SBERT 로드 시 서버 어휘로 미리 채움)
+        self._sentence_cache = None
+        # 질의 -> (triples, 임베딩) LRU 캐시 (OpenAI 변환과 SBERT 인코딩 생략)
+        self._query_cache: "OrderedDict[str, Tuple[List[List[str]], List[Tuple]]]" = OrderedDict()
+        # 장면 내 유사도 검색 결과 LRU 캐시 (같은 장면의 predicate마다 반복되는 서버 검색 생략)
+        self._scene_search_cache: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self._scene_search_lock = threading.Lock()
+        
+        # 서버 미지원 엔드포인트 표시 (404를 받으면 이후 요청은 대체 경로 사용, 스레드 풀 워커가 동시에 갱신)
+        self._full_scene_unsupported = False
+        self._bulk_unsupported = False
+        self._binary_bulk_unsupported = False
+        self._binary_search_unsupported = False
+        self._unsupported_lock = threading.Lock()
+        
         print(f"🌐 SceneGraphClient 초기화 완료 - API URL: {self.db_api_base_url}")
     
+    def _create_session(self, http2: bool = False):
+        """
+        커넥션 풀/재시도/압축이 설정된 HTTP 세션 생성
+        
+        http2=True이면 하나의 연결에서 요청을 다중화하는 httpx HTTP/2 클라이언트를 생성합니다.
+        (post/get/json/raise_for_status 사용법은 requests 세션과 동일)
+        HTTP/2 다중화는 h2를 지원하는 서버/프록시(TLS)에서만 적용되며, uvicorn에 직접 붙으면 HTTP/1.1 keep-alive 풀로 동작합니다.
+        """
+        if http2:
+            try:
+                import httpx
+                # transport를 직접 넘기면 Client의 limits/http2 인자는 무시되므로 transport에 설정
+                # 스레드 풀 동시 요청이 연결을 다시 맺지 않도록 keep-alive 수를 최대 연결 수와 맞춤
+                limits = httpx.Limits(max_keepalive_connections=64, max_connections=64)
+                client = httpx.Client(
+                    timeout=30,
+                    transport=httpx.HTTPTransport(http2=True, retries=3, limits=limits),
+                    headers={"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"}
+                )
+                self.http2 = True
+                print("✅ HTTP/2 클라이언트 사용 (httpx)")
+                return client
+            except ImportError as e:
+                print(f"⚠️ httpx[http2] 사용 불가, requests 세션으로 대체합니다: {e}")
+        
+        return create_http_session()
+    
+    def close(self) -> None:
+        """HTTP 세션(커넥션 풀)을 닫습니다. 하위 클라이언트가 공유하는 세션도 함께 닫힙니다."""
+        if self._shared_session is not self.session:
+            self._shared_session.close()
+        self.session.close()
+    
+    def __enter__(self) -> "SceneGraphDBClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def _mark_unsupported(self, flag: str, message: Optional[str] = None) -> None:
+        """엔드포인트 미지원 플래그를 설정 (여러 스레드가 동시에 404를 받아도 안내는 한 번만 출력)"""
+        with self._unsupported_lock:
+            if getattr(self, flag):
+                return
+            setattr(self, flag, True)
+        if message:
+            print(message)
+    
+    # ==================== 조회 캐시 ====================
+    
+    def _cached_get(self, key: Tuple, loader):
+        """
+        TTL 캐시를 거쳐 조회 (빈 결과/실패는 캐시하지 않음)
+        
+        캐시에는 복사본을 저장하고 캐시 적중 시에도 복사본을 반환하므로,
+        호출자가 결과 리스트/딕셔너리를 수정해도 다른 호출자의 결과에는 영향이 없습니다.
+        
+        Args:
+            key: 캐시 키 (메서드명, 인자)
+            loader: 캐시 미스 시 호출할 조회 함수
+        """
+        with self._get_cache_lock:
+            hit = self._get_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < GET_CACHE_TTL:
+            return copy.deepcopy(hit[1])
+        
+        # 네트워크 조회는 락 밖에서 수행
+        value = loader()
+        if value:
+            entry = (time.monotonic(), copy.deepcopy(value))
+            with self._get_cache_lock:
+                if TTLCache is None and len(self._get_cache) >= GET_CACHE_MAXSIZE:
+                    self._get_cache.clear()
+                self._get_cache[key] = entry
+        return value
+    
+    def invalidate_cache(self) -> None:
+        """조회/장면 검색 캐시 비우기 (비디오/장면 생성·삭제 후 호출)"""
+        with self._get_cache_lock:
+            self._get_cache.clear()
+        with self._scene_search_lock:
+            self._scene_search_cache.clear()
+    
     # ==================== 기본 연결 및 상태 확인 ====================
     
-    def health_check(self) -> bool:
-        """API 서버 헬스 체크"""
-        return self.checker.check_connection()
+    def health_check(self, force: bool = False) -> bool:
+        """
+        API 서버 헬스 체크
+        
+        최근 HEALTH_CHECK_TTL초 안에 성공한 적이 있으면 요청 없이 True를 반환합니다.
+        (여러 파일을 연속 업로드할 때 업로드마다 확인 요청을 보내지 않도록)
+        
+        Args:
+            force: True면 캐시를 무시하고 서버에 다시 확인
+        """
+        now = time.monotonic()
+        if not force and now - self._last_health_ok < HEALTH_CHECK_TTL:
+            return True
+        
+        ok = self.checker.check_connection()
+        self._last_health_ok = now if ok else 0.0
+        return ok
     
     def get_server_info(self) -> Dict[str, Any]:
         """서버 기본 정보 조회"""
@@ -73,11 +526,13 @@ class SceneGraphDBClient:
         return self.checker.get_videos()
     
     def get_video_info(self, video_unique_id: int) -> Optional[Dict[str, Any]]:
-        """특정 비디오의 상세 정보 조회"""
-        return self.deleter.get_video_info(video_unique_id)
+        """특정 비디오의 상세 정보 조회 (TTL 캐시)"""
+        return self._cached_get(("video_info", video_unique_id),
+                                lambda: self.deleter.get_video_info(video_unique_id))
     
     def create_video(self, drama_name: str, episode_number: str, video_unique_id: int = None) -> Optional[Dict[str, Any]]:
         """비디오 생성"""
+        self.invalidate_cache()
         try:
             if video_unique_id is None:
                 video_unique_id = self._generate_video_id(drama_name, episode_number)
@@ -97,6 +552,7 @@ class SceneGraphDBClient:
     
     def delete_video(self, video_unique_id: int, confirm: bool = False) -> bool:
         """비디오 및 연결된 모든 데이터 삭제"""
+        self.invalidate_cache()
         return self.deleter.delete_video(video_unique_id, confirm)
     
     def list_videos(self) -> None:
@@ -106,16 +562,16 @@ class SceneGraphDBClient:
     # ==================== 장면 관리 ====================
     
     def get_scenes(self, video_id: int) -> List[Dict[str, Any]]:
-        """특정 비디오의 장면 목록 조회"""
-        return self.checker.get_scenes(video_id)
+        """특정 비디오의 장면 목록 조회 (TTL 캐시)"""
+        return self._cached_get(("scenes", video_id), lambda: self.checker.get_scenes(video_id))
     
     def get_scene_graph(self, scene_id: int) -> Dict[str, Any]:
-        """특정 장면의 완전한 그래프 정보 조회"""
-        return self.checker.get_scene_graph(scene_id)
+        """특정 장면의 완전한 그래프 정보 조회 (TTL 캐시)"""
+        return self._cached_get(("scene_graph", scene_id), lambda: self.checker.get_scene_graph(scene_id))
     
     def get_scene_objects(self, scene_id: int) -> List[Dict[str, Any]]:
-        """특정 장면의 객체 노드 조회"""
-        return self.checker.get_objects(scene_id)
+        """특정 장면의 객체 노드 조회 (TTL 캐시)"""
+        return self._cached_get(("scene_objects", scene_id), lambda: self.checker.get_objects(scene_id))
     
     def get_scene_events(self, scene_id: int) -> List[Dict[str, Any]]:
         """특정 장면의 이벤트 노드 조회"""
@@ -133,19 +589,71 @@ class SceneGraphDBClient:
         """특정 장면의 임베딩 정보 조회"""
         return self.checker.get_embeddings(scene_id)
     
+    def get_bulk_scene_data(self, scene_ids: Optional[List[int]] = None, include_embeddings: bool = True,
+                            max_workers: int = 16) -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
+        """
+        여러 장면의 객체/이벤트/공간관계/시간관계/임베딩을 한 번의 요청으로 조회
+        (/search/bulk_scene_data를 지원하지 않는 서버는 장면별 API를 병렬 호출하여 대체)
+        
+        Args:
+            scene_ids: 조회할 장면 ID 리스트 (None이면 모든 장면)
+            include_embeddings: 임베딩 포함 여부
+            max_workers: 장면별 조회로 대체할 때의 동시 요청 수
+            
+        Returns:
+            Dict[int, Dict]: scene_id -> {'objects', 'events', 'spatial', 'temporal', 'embeddings'}
+        """
+        if scene_ids is not None:
+            scene_ids = list(dict.fromkeys(scene_ids))
+            if not scene_ids:
+                return {}
+        
+        try:
+            body = {"scene_ids": scene_ids, "include_embeddings": include_embeddings}
+            response = self.session.post(f"{self.db_api_base_url}/search/bulk_scene_data",
+                                         **self._raw_body(_dumps(body)))
+            if response.status_code != 404:
+                response.raise_for_status()
+                # JSON 객체 키는 문자열이므로 scene_id를 정수로 복원
+                return {int(scene_id): bundle for scene_id, bundle in _loads(response.content).items()}
+            response.close()
+            
+            if scene_ids is None:
+                scene_ids = [scene['id'] for video in self.get_videos() for scene in self.get_scenes(video['id'])]
+            fetchers = {
+                "objects": self.get_scene_objects,
+                "events": self.get_scene_events,
+                "spatial": self.get_scene_spatial_relations,
+                "temporal": self.get_scene_temporal_relations,
+            }
+            if include_embeddings:
+                fetchers["embeddings"] = self.get_scene_embeddings
+            
+            bundles = {scene_id: {} for scene_id in scene_ids}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(fetch, scene_id): (scene_id, kind)
+                           for scene_id in scene_ids for kind, fetch in fetchers.items()}
+                for future in as_completed(futures):
+                    scene_id, kind = futures[future]
+                    bundles[scene_id][kind] = future.result()
+            return bundles
+        except Exception as e:
+            print(f"❌ 장면 데이터 일괄 조회 실패: {e}")
+            return {}
+    
     def delete_scene_embeddings(self, scene_id: int) -> bool:
         """특정 장면의 모든 임베딩 정보 삭제 (실제로는 스킵 - 업데이트 로직 활용)"""
         try:
-            print(f"🔄 장면 {scene_id}의 임베딩 덮어쓰기 준비")
+            _progress(f"🔄 장면 {scene_id}의 임베딩 덮어쓰기 준비")
             
             # 해당 장면의 모든 임베딩 조회
             embeddings = self.get_scene_embeddings(scene_id)
             if not embeddings:
-                print(f"⚠️ 장면 {scene_id}에 기존 임베딩이 없습니다.")
+                _progress(f"⚠️ 장면 {scene_id}에 기존 임베딩이 없습니다.")
                 return True
             
-            print(f"ℹ️ 장면 {scene_id}에 {len(embeddings)}개의 기존 임베딩이 있습니다.")
-            print(f"ℹ️ 새로운 임베딩으로 자동 업데이트됩니다.")
+            _progress(f"ℹ️ 장면 {scene_id}에 {len(embeddings)}개의 기존 임베딩이 있습니다.")
+            _progress(f"ℹ️ 새로운 임베딩으로 자동 업데이트됩니다.")
             return True
             
         except Exception as e:
@@ -154,20 +662,36 @@ class SceneGraphDBClient:
     
     # ==================== 장면그래프 업로드 ====================
     
-    def upload_scene_graph(self, json_file_path: str, overwrite_embeddings: bool = False) -> bool:
+    def upload_scene_graph(self, json_file_path: str, overwrite_embeddings: bool = False,
+                           verbose: bool = False, quiet: bool = False) -> bool:
         """
         JSON 파일과 대응하는 PT 파일을 이용하여 장면그래프 데이터를 업로드
         
         Args:
             json_file_path: JSON 파일 경로
             overwrite_embeddings: 기존 임베딩을 덮어쓸지 여부 (기본값: False)
+            verbose: 노드/임베딩 항목별 저장 로그 출력 여부 (기본값: 요약만 출력)
+            quiet: 진행 로그를 생략하고 오류만 출력 (여러 파일을 동시에 업로드할 때 사용)
             
         Returns:
             bool: 업로드 성공 여부
         """
+        if verbose:
+            _enable_verbose_logging()
+        self.invalidate_cache()
+        
+        previous_quiet = getattr(_upload_output, "quiet", False)
+        _upload_output.quiet = quiet
+        try:
+            return self._upload_scene_graph(json_file_path, overwrite_embeddings)
+        finally:
+            _upload_output.quiet = previous_quiet
+    
+    def _upload_scene_graph(self, json_file_path: str, overwrite_embeddings: bool) -> bool:
+        """upload_scene_graph 본문 (진행 로그는 _progress로 출력)"""
         try:
-            print(f"🚀 장면그래프 파일 업로드 시작: {json_file_path}")
-            print("=" * 50)
+            _progress(f"🚀 장면그래프 파일 업로드 시작: {json_file_path}")
+            _progress("=" * 50)
             
             # 1. API 서버 헬스 체크
             if not self.health_check():
@@ -181,8 +705,8 @@ class SceneGraphDBClient:
             start_frame = file_info['start_frame']
             end_frame = file_info['end_frame']
             
-            print(f"📺 비디오 정보: {drama_name} {episode_number}")
-            print(f"🎬 프레임 범위: {start_frame}-{end_frame}")
+            _progress(f"📺 비디오 정보: {drama_name} {episode_number}")
+            _progress(f"🎬 프레임 범위: {start_frame}-{end_frame}")
             
             # 3. JSON 파일 로드
             scene_data = self._load_scene_graph_data(json_file_path)
@@ -196,17 +720,7 @@ class SceneGraphDBClient:
             # 5. PT 파일 로드
             pt_data = self._load_pt_data(pt_file_path)
             
-            # 6. 비디오 생성/조회
-            video_result = self.create_video(drama_name, episode_number)
-            if not video_result:
-                print("❌ 비디오 생성 실패")
-                return False
-            
-            video_id = video_result.get('video_id')
-            actual_video_unique_id = video_result.get('video_unique_id')
-            print(f"✅ 비디오 준비 완료: {drama_name} {episode_number} (ID: {video_id})")
-            
-            # 7. 장면 메타데이터 생성
+            # 6. 장면 메타데이터 생성
             scene_meta = scene_data.get('scene_graph', {}).get('meta', {})
             scene_payload = {
                 "scene_number": f"{start_frame}-{end_frame}",
@@ -217,6 +731,33 @@ class SceneGraphDBClient:
                 "end_frame": end_frame
             }
             
+            # 7. /scenes/full 단일 요청으로 업로드 (미지원 서버는 단계별 업로드로 대체)
+            #    임베딩은 node_id를 upsert하므로 overwrite_embeddings 여부와 관계없이 새 값으로 덮어씀
+            #    PT 임베딩 묶음은 접두사 없이 한 번만 만들고, 단계별 업로드로 대체될 때도 재사용
+            pt_batch = _pt_embedding_batch(pt_data, "")
+            full_result = self._upload_full_scene(
+                scene_payload, scene_data.get('scene_graph', {}),
+                pt_batch.with_prefix(SCENE_PREFIX_TOKEN) if pt_batch is not None else _EmbeddingBatch.empty(),
+                None, drama_name, episode_number
+            )
+            if full_result is not None:
+                _progress("\n" + "=" * 50)
+                _progress("✅ 장면그래프 데이터 업로드 완료!")
+                _progress(f"📺 비디오: {drama_name} {episode_number}")
+                _progress(f"🎭 장면: 프레임 {start_frame}-{end_frame}")
+                _progress(f"🆔 비디오 ID: {full_result.get('video_id')}, 장면 ID: {full_result.get('scene_id')}")
+                return True
+            
+            # 비디오 생성/조회
+            video_result = self.create_video(drama_name, episode_number)
+            if not video_result:
+                print("❌ 비디오 생성 실패")
+                return False
+            
+            video_id = video_result.get('video_id')
+            actual_video_unique_id = video_result.get('video_unique_id')
+            _progress(f"✅ 비디오 준비 완료: {drama_name} {episode_number} (ID: {video_id})")
+            
             # 8. 장면 생성 API 호출 (임베딩 없이)
             scene_request = {
                 "video_unique_id": actual_video_unique_id,
@@ -233,24 +774,26 @@ class SceneGraphDBClient:
                 print("❌ 장면 생성 실패")
                 return False
             
-            print(f"✅ 장면 생성 완료: {scene_id}")
-            
-            # 9. 노드 데이터 저장 (objects, events, spatial, temporal)
-            self._create_nodes_from_data(scene_id, scene_data.get('scene_graph', {}), actual_video_unique_id)
+            _progress(f"✅ 장면 생성 완료: {scene_id}")
             
-            # 10. 임베딩 덮어쓰기 처리
+            # 9. 임베딩 덮어쓰기 처리
             if overwrite_embeddings:
-                print("🔄 기존 임베딩 덮어쓰기 모드")
+                _progress("🔄 기존 임베딩 덮어쓰기 모드")
                 self.delete_scene_embeddings(scene_id)
             
-            # 11. 임베딩 데이터 저장
-            self._create_embeddings_from_pt_data(scene_id, pt_data, actual_video_unique_id)
+            # 10. 노드 데이터(objects, events, spatial, temporal)와 임베딩 데이터를 동시에 저장
+            self._create_nodes_from_data(
+                scene_id, scene_data.get('scene_graph', {}), actual_video_unique_id,
+                upload_embeddings=lambda: self._create_embeddings_from_pt_data(
+                    scene_id, pt_data, actual_video_unique_id, batch=pt_batch
+                )
+            )
             
-            print("\n" + "=" * 50)
-            print("✅ 장면그래프 데이터 업로드 완료!")
-            print(f"📺 비디오: {drama_name} {episode_number}")
-            print(f"🎭 장면: 프레임 {start_frame}-{end_frame}")
-            print(f"🆔 비디오 ID: {video_id}, 장면 ID: {scene_id}")
+            _progress("\n" + "=" * 50)
+            _progress("✅ 장면그래프 데이터 업로드 완료!")
+            _progress(f"📺 비디오: {drama_name} {episode_number}")
+            _progress(f"🎭 장면: 프레임 {start_frame}-{end_frame}")
+            _progress(f"🆔 비디오 ID: {video_id}, 장면 ID: {scene_id}")
             
             return True
             
@@ -258,9 +801,65 @@ class SceneGraphDBClient:
             print(f"❌ 업로드 실패: {e}")
             return False
     
+    def upload_scene_graphs(self, json_file_paths: List[str], max_workers: int = 8,
+                            overwrite_embeddings: bool = False, verbose: bool = False) -> Dict[str, bool]:
+        """
+        여러 장면그래프 JSON(+PT) 파일을 스레드 풀로 동시에 업로드
+        
+        업로드는 대부분 HTTP 대기이므로 같은 세션(커넥션 풀)을 공유하는 스레드로 나눠 처리합니다.
+        같은 비디오의 장면들이 동시에 비디오를 생성하지 않도록 비디오는 먼저 순서대로 준비합니다.
+        파일별 진행 로그는 생략하고 진행률 표시줄과 오류만 출력합니다.
+        
+        Args:
+            json_file_paths: 업로드할 JSON 파일 경로 리스트
+            max_workers: 동시에 업로드할 파일 수 (세션 pool_maxsize보다 작게 유지)
+            overwrite_embeddings: 기존 임베딩을 덮어쓸지 여부
+            verbose: 노드/임베딩 항목별 저장 로그 출력 여부 (워커 시작 전에 한 번만 설정)
+            
+        Returns:
+            Dict[str, bool]: 파일 경로별 업로드 성공 여부
+        """
+        from tqdm import tqdm
+        
+        if not json_file_paths:
+            return {}
+        if verbose:
+            _enable_verbose_logging()
+        if not self.health_check():
+            print("❌ API 서버에 연결할 수 없습니다.")
+            return {path: False for path in json_file_paths}
+        
+        # 1. 비디오 사전 생성 (드라마명+에피소드별 1회)
+        videos = set()
+        for path in json_file_paths:
+            match = _FILENAME_RE.match(os.path.basename(path))
+            if match:  # 파일명 오류는 개별 업로드에서 보고
+                videos.add(match.group(1, 2))
+        for drama_name, episode_number in sorted(videos):
+            self.create_video(drama_name, episode_number)
+        
+        # 2. 파일별 업로드 (완료 순서대로 진행률 표시)
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(json_file_paths)))) as executor:
+            futures = {
+                executor.submit(self.upload_scene_graph, path, overwrite_embeddings, quiet=True): path
+                for path in json_file_paths
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), desc="upload"):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    print(f"❌ 업로드 실패: {path} - {e}")
+                    results[path] = False
+        
+        succeeded = sum(results.values())
+        print(f"✅ 장면그래프 일괄 업로드 완료: {succeeded}/{len(results)} (실패 {len(results) - succeeded})")
+        return {path: results[path] for path in json_file_paths}
+    
     def upload_scene_graph_with_pt(self, scene_data: Dict[str, Any], embedding_info: Dict[str, Any], 
                                  video_unique_id: int, drama_name: str, episode_number: str,
-                                 start_frame: int, end_frame: int) -> bool:
+                                 start_frame: int, end_frame: int, verbose: bool = False) -> bool:
         """
         장면그래프 데이터와 임베딩 정보를 직접 입력받아 업로드
         
@@ -272,30 +871,25 @@ class SceneGraphDBClient:
             episode_number: 에피소드 번호
             start_frame: 시작 프레임
             end_frame: 종료 프레임
+            verbose: 노드/임베딩 항목별 저장 로그 출력 여부 (기본값: 요약만 출력)
         
         Returns:
             bool: 업로드 성공 여부
         """
+        if verbose:
+            _enable_verbose_logging()
+        self.invalidate_cache()
+        
         try:
-            print("🚀 장면그래프 데이터 직접 업로드 시작")
-            print("=" * 50)
+            _progress("🚀 장면그래프 데이터 직접 업로드 시작")
+            _progress("=" * 50)
             
             # 1. API 서버 헬스 체크
             if not self.health_check():
                 print("❌ API 서버에 연결할 수 없습니다.")
                 return False
             
-            # 2. 비디오 생성/조회
-            video_result = self.create_video(drama_name, episode_number, video_unique_id)
-            if not video_result:
-                print("❌ 비디오 생성 실패")
-                return False
-            
-            video_id = video_result.get('video_id')
-            actual_video_unique_id = video_result.get('video_unique_id')
-            print(f"✅ 비디오 준비 완료: {drama_name} {episode_number} (ID: {video_id})")
-            
-            # 3. 장면 메타데이터 생성 (임베딩 제외)
+            # 장면 메타데이터 (임베딩 제외)
             scene_meta = scene_data.get('scene_graph', {}).get('meta', {})
             scene_payload = {
                 "scene_number": f"{start_frame}-{end_frame}",
@@ -306,7 +900,36 @@ class SceneGraphDBClient:
                 "end_frame": end_frame
             }
             
-            # 장면 생성 API 호출 (임베딩 없이)
+            # 2. /scenes/full 단일 요청으로 업로드 (미지원 서버는 단계별 업로드로 대체)
+            node_info = embedding_info.get('node_info', [])
+            node_embeddings = _as_embedding_matrix(embedding_info.get('node_embeddings', []), len(node_info))
+            if node_embeddings is None:
+                embeddings = _EmbeddingBatch.empty()
+            else:
+                embeddings = _embedding_batch(node_info, node_embeddings, SCENE_PREFIX_TOKEN)
+            full_result = self._upload_full_scene(
+                scene_payload, scene_data.get('scene_graph', {}), embeddings,
+                video_unique_id, drama_name, episode_number
+            )
+            if full_result is not None:
+                _progress("\n" + "=" * 50)
+                _progress("✅ 장면그래프 데이터 업로드 완료!")
+                _progress(f"📺 비디오: {drama_name} {episode_number}")
+                _progress(f"🎭 장면: 프레임 {start_frame}-{end_frame}")
+                _progress(f"🆔 비디오 ID: {full_result.get('video_id')}, 장면 ID: {full_result.get('scene_id')}")
+                return True
+            
+            # 비디오 생성/조회
+            video_result = self.create_video(drama_name, episode_number, video_unique_id)
+            if not video_result:
+                print("❌ 비디오 생성 실패")
+                return False
+            
+            video_id = video_result.get('video_id')
+            actual_video_unique_id = video_result.get('video_unique_id')
+            _progress(f"✅ 비디오 준비 완료: {drama_name} {episode_number} (ID: {video_id})")
+            
+            # 3. 장면 생성 API 호출 (임베딩 없이)
             scene_request = {
                 "video_unique_id": actual_video_unique_id,
                 "scene_data": scene_payload,
@@ -322,19 +945,19 @@ class SceneGraphDBClient:
                 print("❌ 장면 생성 실패")
                 return False
             
-            print(f"✅ 장면 생성 완료: {scene_id}")
-            
-            # 4. 노드 데이터 저장 (objects, events, spatial, temporal)
-            self._create_nodes_from_data(scene_id, scene_data.get('scene_graph', {}), actual_video_unique_id)
+            _progress(f"✅ 장면 생성 완료: {scene_id}")
             
-            # 5. 임베딩 데이터 저장
-            self._create_embeddings_from_info(scene_id, embedding_info, actual_video_unique_id)
+            # 4. 노드 데이터(objects, events, spatial, temporal)와 임베딩 데이터를 동시에 저장
+            self._create_nodes_from_data(
+                scene_id, scene_data.get('scene_graph', {}), actual_video_unique_id,
+                upload_embeddings=lambda: self._create_embeddings_from_info(scene_id, embedding_info, actual_video_unique_id)
+            )
             
-            print("\n" + "=" * 50)
-            print("✅ 장면그래프 데이터 업로드 완료!")
-            print(f"📺 비디오: {drama_name} {episode_number}")
-            print(f"🎭 장면: 프레임 {start_frame}-{end_frame}")
-            print(f"🆔 비디오 ID: {video_id}, 장면 ID: {scene_id}")
+            _progress("\n" + "=" * 50)
+            _progress("✅ 장면그래프 데이터 업로드 완료!")
+            _progress(f"📺 비디오: {drama_name} {episode_number}")
+            _progress(f"🎭 장면: 프레임 {start_frame}-{end_frame}")
+            _progress(f"🆔 비디오 ID: {video_id}, 장면 ID: {scene_id}")
             
             return True
             
@@ -342,6 +965,64 @@ class SceneGraphDBClient:
             print(f"❌ 업로드 실패: {e}")
             return False
     
+    def _upload_full_scene(self, scene_payload: Dict[str, Any], scene_graph: Dict[str, Any],
+                           embeddings: _EmbeddingBatch,
+                           video_unique_id: Optional[int], drama_name: str,
+                           episode_number: str) -> Optional[Dict[str, Any]]:
+        """
+        비디오/장면/노드/임베딩을 /scenes/full 한 번의 요청으로 업로드
+        
+        node_id 접두사에는 SCENE_PREFIX_TOKEN을 넣고 서버가 생성된 scene_id로 치환합니다.
+        
+        Args:
+            embeddings: SCENE_PREFIX_TOKEN 접두사로 만든 임베딩 묶음
+        
+        Returns:
+            서버 응답 (video_id, scene_id, 종류별 결과), 서버가 엔드포인트를 지원하지 않으면 None
+        """
+        if self._full_scene_unsupported:
+            return None
+        
+        if video_unique_id is None:
+            video_unique_id = self._generate_video_id(drama_name, episode_number)
+        
+        objects = scene_graph.get('objects', [])
+        events = scene_graph.get('events', [])
+        spatial = scene_graph.get('spatial', [])
+        temporal = scene_graph.get('temporal', [])
+        body = {
+            "video": {
+                "video_unique_id": video_unique_id,
+                "drama_name": drama_name,
+                "episode_number": episode_number
+            },
+            "scene": scene_payload,
+            "objects": _object_items(objects, SCENE_PREFIX_TOKEN),
+            "events": _event_items(events, SCENE_PREFIX_TOKEN),
+            "spatial": _spatial_items(spatial, SCENE_PREFIX_TOKEN),
+            "temporal": _temporal_items(temporal, SCENE_PREFIX_TOKEN),
+            **_b64_embeddings(embeddings)
+        }
+        
+        response = self.session.post(f"{self.db_api_base_url}/scenes/full", **self._raw_body(_dumps(body)))
+        if response.status_code == 404:
+            response.close()
+            self._mark_unsupported("_full_scene_unsupported", "⚠️ /scenes/full 미지원 서버 - 단계별 업로드로 진행")
+            return None
+        response.raise_for_status()
+        result = _loads(response.content)
+        
+        results = result.get('results', {})
+        for key, id_field, labels, kind in (
+            ('objects', 'object_id', [obj.get('label') for obj in objects], "객체"),
+            ('events', 'event_id', [event.get('verb') for event in events], "이벤트"),
+            ('spatial', 'spatial_id', [rel.get('predicate') for rel in spatial], "공간 관계"),
+            ('temporal', 'temporal_id', [rel.get('predicate') for rel in temporal], "시간 관계"),
+            ('embeddings', 'node_id', embeddings.labels, "임베딩"),
+        ):
+            self._report_bulk_results(results.get(key, []), labels, id_field, kind)
+        return result
+    
     # ==================== 내부 헬퍼 메서드 ====================
     
     def _parse_filename(self, filename: str) -> Dict[str, Any]:
@@ -350,12 +1031,10 @@ class SceneGraphDBClient:
         
         예시: "Hospital.Playlist_EP01_visual_181-455_(00_00_06-00_00_15)_meta_info.json"
         """
-        import re
-        
-        print(f"📁 파일명 파싱: {filename}")
+        _progress(f"📁 파일명 파싱: {filename}")
         
         # 파일명에서 정보 추출 (괄호와 번호 포함 처리)
-        match = re.match(r'(.+)_(.+)_visual_(\d+)-(\d+)_.*_meta_info(?: \(\d+\))?\.json', filename)
+        match = _FILENAME_RE.match(filename)
         if not match:
             raise ValueError(f"파일명 형식이 올바르지 않습니다: {filename}")
         
@@ -368,18 +1047,18 @@ class SceneGraphDBClient:
             'end_frame': int(end_frame)
         }
         
-        print(f"✅ 파싱 결과: {result}")
+        _progress(f"✅ 파싱 결과: {result}")
         return result
     
     def _load_scene_graph_data(self, file_path: str) -> Dict[str, Any]:
         """JSON 파일에서 장면 그래프 데이터 로드"""
-        print(f"📖 JSON 파일 로드: {file_path}")
+        _progress(f"📖 JSON 파일 로드: {file_path}")
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            print(f"✅ JSON 데이터 로드 완료")
+            _progress(f"✅ JSON 데이터 로드 완료")
             return data
         except Exception as e:
             print(f"❌ JSON 파일 로드 실패: {e}")
@@ -387,322 +1066,273 @@ class SceneGraphDBClient:
     
     def _load_pt_data(self, file_path: str) -> Dict[str, Any]:
         """PT 파일에서 임베딩 데이터 로드"""
-        print(f"📖 PT 파일 로드: {file_path}")
+        _progress(f"📖 PT 파일 로드: {file_path}")
         
         try:
             import torch
             import numpy as np
-            pt_data = torch.load(file_path, map_location='cpu')
+            pt_data = load_pt_file(file_path)
             
-            print(f"✅ PT 데이터 로드 완료")
-            print(f"📊 PT 파일 키들: {list(pt_data.keys())}")
+            _progress(f"✅ PT 데이터 로드 완료")
+            _progress(f"📊 PT 파일 키들: {list(pt_data.keys())}")
             
-            # PyTorch 텐서를 JSON 직렬화 가능한 형태로 변환
+            # PyTorch 텐서는 numpy 배열로만 변환 (중첩 리스트 변환 없이 업로드 시 float32 바이트로 전송)
             processed_data = {}
             for key, value in pt_data.items():
-                if isinstance(value, torch.Tensor):
-                    # 텐서를 numpy 배열로 변환 후 리스트로 변환
-                    processed_data[key] = value.numpy().tolist()
+                if key == 'z' and isinstance(value, torch.Tensor):
+                    # 임베딩 행렬은 float32 연속 배열로 유지
+                    processed_data[key] = np.ascontiguousarray(value.detach().float().numpy())
+                elif isinstance(value, torch.Tensor):
+                    processed_data[key] = value.detach().numpy()
+                elif (isinstance(value, (list, tuple)) and value
+                      and all(isinstance(item, torch.Tensor) for item in value)
+                      and len({item.shape for item in value}) == 1):
+                    # 같은 모양의 텐서 리스트(일반적인 경우)는 한 번에 쌓아 하나의 배열로 변환
+                    processed_data[key] = torch.stack(list(value)).detach().numpy()
                 elif isinstance(value, (list, tuple)):
-                    # 리스트나 튜플의 각 요소가 텐서인지 확인
-                    processed_list = []
-                    for item in value:
-                        if isinstance(item, torch.Tensor):
-                            processed_list.append(item.numpy().tolist())
-                        else:
-                            processed_list.append(item)
-                    processed_data[key] = processed_list
+                    # 텐서와 다른 값이 섞였거나 모양이 다르면 요소별로 변환
+                    processed_data[key] = [
+                        item.detach().numpy() if isinstance(item, torch.Tensor) else item
+                        for item in value
+                    ]
                 else:
                     processed_data[key] = value
             
             if 'z' in processed_data:
-                embeddings = processed_data['z']
-                if isinstance(embeddings, list) and len(embeddings) > 0:
-                    print(f"✅ 임베딩 벡터 차원: {len(embeddings)} x {len(embeddings[0])}")
+                embeddings = np.asarray(processed_data['z'])
+                if embeddings.ndim == 2:
+                    _progress(f"✅ 임베딩 벡터 차원: {embeddings.shape[0]} x {embeddings.shape[1]}")
                 else:
-                    print(f"✅ 임베딩 타입: {type(embeddings)}")
+                    _progress(f"✅ 임베딩 타입: {type(processed_data['z'])}")
             
             return processed_data
         except Exception as e:
             print(f"❌ PT 파일 로드 실패: {e}")
             raise
     
-    def _create_embeddings_from_pt_data(self, scene_id: int, pt_data: Dict[str, Any], video_unique_id: int) -> None:
-        """PT 데이터에서 임베딩 정보를 생성하여 저장"""
-        print(f"🔗 PT 데이터에서 임베딩 생성 시작")
+    def _create_embeddings_from_pt_data(self, scene_id: int, pt_data: Dict[str, Any], video_unique_id: int,
+                                        batch: Optional[_EmbeddingBatch] = None) -> None:
+        """
+        PT 데이터에서 임베딩 정보를 생성하여 저장
+        
+        Args:
+            batch: 이미 만들어 둔 접두사 없는 임베딩 묶음 (없으면 pt_data에서 생성)
+        """
+        _progress(f"🔗 PT 데이터에서 임베딩 생성 시작")
         
         try:
-            if 'z' not in pt_data or 'orig_id' not in pt_data:
-                print("❌ PT 데이터에 임베딩 정보가 없습니다.")
+            if batch is None:
+                batch = _pt_embedding_batch(pt_data, "")
+            if batch is None:
                 return
             
-            embeddings = pt_data['z']
-            orig_ids = pt_data['orig_id']
-            node_types = pt_data.get('node_type', [])
-            
-            if len(embeddings) != len(orig_ids):
-                print(f"❌ 임베딩과 orig_id 개수가 일치하지 않음: {len(embeddings)} vs {len(orig_ids)}")
-                return
+            # 실제 node_id 생성: {video_unique_id}_{scene_id}_{node_type}_{orig_id}
+            batch = batch.with_prefix(f"{video_unique_id}_{scene_id}_")
             
-            # ID 0은 특별한 노드이므로 건너뛰기
-            for i, orig_id in enumerate(orig_ids):
-                if orig_id == 0:
-                    continue
-                
-                # 노드 타입 결정
-                if i < len(node_types):
-                    node_type_idx = node_types[i]
-                    if node_type_idx == 0:
-                        continue
-                    elif node_type_idx == 1:
-                        node_type = 'object'
-                    elif node_type_idx == 2:
-                        node_type = 'event'
-                    elif node_type_idx == 3:
-                        node_type = 'spatial'
-                    else:
-                        continue
-                else:
-                    # node_type 정보가 없으면 orig_id로 추정
-                    if 1000 <= orig_id < 2000:
-                        node_type = 'object'
-                    elif 2000 <= orig_id < 3000:
-                        node_type = 'temporal'
-                    elif 3000 <= orig_id < 4000:
-                        node_type = 'event'
-                    elif 11000 <= orig_id < 12000:
-                        node_type = 'spatial'
-                    else:
-                        continue
-                
-                # 실제 node_id 생성: {video_unique_id}_{scene_id}_{node_type}_{orig_id}
-                actual_node_id = f"{video_unique_id}_{scene_id}_{node_type}_{orig_id}"
-                
-                # 임베딩 벡터 가져오기
-                embedding_vector = embeddings[i]
-                
-                # 임베딩 데이터 저장
-                embedding_data = {
-                    "node_id": actual_node_id,
-                    "node_type": node_type,
-                    "embedding": embedding_vector
-                }
-                
-                # 임베딩 저장 API 호출
-                response = self.session.post(f"{self.db_api_base_url}/embeddings", json=embedding_data)
-                response.raise_for_status()
-                
-                print(f"  ✅ 임베딩 저장: {node_type}_{orig_id} -> {actual_node_id}")
+            # 임베딩 저장 API 호출 (한 번의 bulk 요청)
+            if self._post_embeddings(batch) is None:
+                raise RuntimeError("임베딩 일괄 저장 요청 실패")
             
-            print(f"✅ PT 데이터에서 임베딩 생성 완료: {len([id for id in orig_ids if id != 0])}개")
+            _progress(f"✅ PT 데이터에서 임베딩 생성 완료: {len(batch.node_ids)}개")
             
         except Exception as e:
             print(f"❌ PT 데이터 임베딩 생성 실패: {e}")
             raise
     
-    def _create_nodes_from_data(self, scene_id: int, scene_graph: Dict[str, Any], video_unique_id: int) -> None:
-        """장면그래프 데이터에서 노드들을 생성"""
-        print(f"🔗 노드 데이터 저장 시작: Scene ID {scene_id}")
+    def _create_nodes_from_data(self, scene_id: int, scene_graph: Dict[str, Any], video_unique_id: int,
+                                upload_embeddings: Optional[Callable[[], None]] = None) -> None:
+        """
+        장면그래프 데이터에서 노드들을 생성
+        
+        네 가지 노드 종류는 서로 다른 테이블에 저장되므로 스레드 풀에서 동시에 요청합니다.
+        (각 요청은 네트워크 대기이며 공유 세션의 커넥션 풀을 사용)
+        
+        Args:
+            upload_embeddings: 노드 업로드와 함께 실행할 임베딩 업로드 함수
+                (embeddings 테이블은 노드 테이블을 참조하지 않으므로 scene_id만 있으면 동시에 저장 가능)
+        """
+        _progress(f"🔗 노드 데이터 저장 시작: Scene ID {scene_id}")
+        
+        creators = (
+            ('objects', self._create_objects_from_data),    # 1. 객체 노드
+            ('events', self._create_events_from_data),      # 2. 이벤트 노드
+            ('spatial', self._create_spatial_from_data),    # 3. 공간 관계
+            ('temporal', self._create_temporal_from_data),  # 4. 시간 관계
+        )
+        
+        # 하위 스레드에도 호출한 스레드의 진행 로그 억제 여부를 그대로 적용
+        quiet = getattr(_upload_output, "quiet", False)
+        
+        def run(fn, *args):
+            _upload_output.quiet = quiet
+            return fn(*args)
         
         try:
-            # 1. 객체 노드 저장
-            objects = scene_graph.get('objects', [])
-            if objects:
-                self._create_objects_from_data(scene_id, objects, video_unique_id)
-            
-            # 2. 이벤트 노드 저장
-            events = scene_graph.get('events', [])
-            if events:
-                self._create_events_from_data(scene_id, events, video_unique_id)
-            
-            # 3. 공간 관계 저장
-            spatial = scene_graph.get('spatial', [])
-            if spatial:
-                self._create_spatial_from_data(scene_id, spatial, video_unique_id)
-            
-            # 4. 시간 관계 저장
-            temporal = scene_graph.get('temporal', [])
-            if temporal:
-                self._create_temporal_from_data(scene_id, temporal, video_unique_id)
-            
-            print(f"✅ 모든 노드 데이터 저장 완료")
+            with ThreadPoolExecutor(max_workers=len(creators) + 1) as executor:
+                futures = [
+                    executor.submit(run, create, scene_id, scene_graph[key], video_unique_id)
+                    for key, create in creators if scene_graph.get(key)
+                ]
+                if upload_embeddings is not None:
+                    futures.append(executor.submit(run, upload_embeddings))
+                for future in futures:
+                    future.result()
+            _progress(f"✅ 모든 노드 데이터 저장 완료")
             
         except Exception as e:
             print(f"❌ 노드 데이터 저장 실패: {e}")
             raise
     
-    def _create_objects_from_data(self, scene_id: int, objects: List[Dict[str, Any]], video_unique_id: int) -> None:
-        """객체 노드 데이터 저장"""
-        print(f"👥 객체 노드 저장: {len(objects)}개")
+    def _raw_body(self, data: bytes) -> Dict[str, bytes]:
+        """원시 바이트 요청 본문 인자 (requests는 data, httpx는 content)"""
+        return {"content": data} if self.http2 else {"data": data}
+    
+    def _post_bulk(self, endpoint: str, items: List[Dict[str, Any]], id_field: str,
+                   labels: List[str], kind: str, scene_id: int = None,
+                   binary_endpoint: str = None, binary_body: bytes = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        노드 목록을 한 번의 bulk POST로 저장하고 항목별 결과를 출력
         
-        for obj in objects:
-            try:
-                original_object_id = obj.get('object_id')
-                new_object_id = f"{video_unique_id}_{scene_id}_object_{original_object_id}"
-                
-                # label이 없으면 type of를 사용
-                label = obj.get('label')
-                if not label:
-                    label = obj.get('type of', 'unknown')
-                
-                object_data = {
-                    "scene_id": scene_id,
-                    "object_id": new_object_id,
-                    "super_type": obj.get('super_type', 'unknown'),
-                    "type_of": obj.get('type of', 'unknown'),
-                    "label": label,
-                    "attributes": obj.get('attributes', {})
-                }
-                
-                response = self.session.post(f"{self.db_api_base_url}/objects", json=object_data)
+        Args:
+            endpoint: bulk 엔드포인트 경로 (예: "/objects/bulk")
+            items: 저장할 항목 리스트
+            id_field: 결과에서 항목을 식별하는 필드명
+            labels: 로그 출력용 항목별 라벨
+            kind: 로그 출력용 노드 종류명
+            scene_id: 장면 ID (임베딩은 None)
+            binary_endpoint: 바이너리 본문을 받는 엔드포인트 (서버가 404면 JSON 엔드포인트로 재시도)
+            binary_body: binary_endpoint로 보낼 본문
+        
+        Returns:
+            항목별 결과 리스트, 요청 자체가 실패하면 None
+        """
+        body = {"items": items}
+        if scene_id is not None:
+            body["scene_id"] = scene_id
+        
+        try:
+            response = None
+            if binary_body is not None and not self._binary_bulk_unsupported:
+                response = self.session.post(
+                    f"{self.db_api_base_url}{binary_endpoint}",
+                    headers={"Content-Type": "application/octet-stream"},
+                    **self._raw_body(binary_body)
+                )
+                if response.status_code == 404:
+                    self._mark_unsupported("_binary_bulk_unsupported")
+                    response.close()
+                    response = None
+            
+            if response is None and not self._bulk_unsupported:
+                # 임베딩 등 큰 본문은 미리 직렬화해 전송 (requests의 json 인코더 생략)
+                response = self.session.post(f"{self.db_api_base_url}{endpoint}", **self._raw_body(_dumps(body)))
+                if response.status_code == 404:
+                    self._mark_unsupported("_bulk_unsupported")
+                    response.close()
+                    response = None
+            
+            if response is None:
+                # bulk 엔드포인트가 없는 서버는 항목별 POST로 대체 (예: /objects/bulk -> /objects)
+                results = self._post_each(endpoint[:-len("/bulk")], items, id_field, scene_id)
+            else:
                 response.raise_for_status()
-                print(f"  ✅ 객체 저장: {obj.get('label')} (ID: {new_object_id})")
-                
-            except Exception as e:
-                print(f"  ❌ 객체 저장 실패: {obj.get('label')} - {e}")
+                results = _loads(response.content)
+        except Exception as e:
+            print(f"  ❌ {kind} 일괄 저장 실패 ({len(items)}개): {e}")
+            return None
+        
+        self._report_bulk_results(results, labels, id_field, kind)
+        return results
     
-    def _create_events_from_data(self, scene_id: int, events: List[Dict[str, Any]], video_unique_id: int) -> None:
-        """이벤트 노드 데이터 저장"""
-        print(f"🎬 이벤트 노드 저장: {len(events)}개")
+    def _post_each(self, endpoint: str, items: List[Dict[str, Any]], id_field: str,
+                   scene_id: int = None) -> List[Dict[str, Any]]:
+        """
+        항목별 POST로 저장하고 bulk 응답과 같은 형식의 결과 리스트 반환
         
-        for i, event in enumerate(events):
+        응답 본문은 쓰지 않으므로 파싱하지 않고 상태 코드만 확인한 뒤 바로 닫습니다.
+        """
+        url = f"{self.db_api_base_url}{endpoint}"
+        results = []
+        for item in items:
+            body = item if scene_id is None else {"scene_id": scene_id, **item}
             try:
-                original_event_id = event.get('event_id', f"EVT_{i}")
-                new_event_id = f"{video_unique_id}_{scene_id}_event_{original_event_id}"
-                
-                # subject_id와 object_id를 새로운 객체 ID로 매핑
-                subject_id = str(event.get('subject', ''))
-                object_id = str(event.get('object', '')) if event.get('object') else None
-                
-                # 객체 ID 매핑 (간단한 매핑 로직)
-                if subject_id.isdigit():
-                    subject_id = f"{video_unique_id}_{scene_id}_object_{subject_id}"
-                if object_id and object_id.isdigit():
-                    object_id = f"{video_unique_id}_{scene_id}_object_{object_id}"
-                
-                event_data = {
-                    "scene_id": scene_id,
-                    "event_id": new_event_id,
-                    "subject_id": subject_id,
-                    "verb": event.get('verb', 'unknown_action'),
-                    "object_id": object_id,
-                    "attributes": {"attribute": event.get('attribute', '')}
-                }
-                
-                response = self.session.post(f"{self.db_api_base_url}/events", json=event_data)
-                response.raise_for_status()
-                print(f"  ✅ 이벤트 저장: {event.get('verb')} (ID: {new_event_id})")
-                
+                response = self.session.post(url, **self._raw_body(_dumps(body)))
+                try:
+                    response.raise_for_status()
+                finally:
+                    response.close()
+                results.append({"success": True, id_field: item.get(id_field)})
             except Exception as e:
-                print(f"  ❌ 이벤트 저장 실패: {event.get('verb')} - {e}")
+                results.append({"success": False, id_field: item.get(id_field), "error": str(e)})
+        return results
+    
+    @staticmethod
+    def _report_bulk_results(results: List[Dict[str, Any]], labels: List[str], id_field: str, kind: str) -> None:
+        """항목별 결과 요약 출력 (성공 항목은 카운트만, 항목별 로그는 verbose 모드에서만)"""
+        ok = 0
+        for label, result in zip(labels, results):
+            if result.get('success'):
+                ok += 1
+                logger.debug("  ✅ %s 저장: %s (ID: %s)", kind, label, result.get(id_field))
+            else:
+                print(f"  ❌ {kind} 저장 실패: {label} - {result.get('error')}")
+        _progress(f"  ✅ {kind} 저장: {ok}/{len(results)} (실패 {len(results) - ok})")
+    
+    def _post_embeddings(self, batch: _EmbeddingBatch) -> Optional[List[Dict[str, Any]]]:
+        """임베딩을 float32 바이너리 bulk 요청으로 저장 (바이너리 미지원 서버는 JSON bulk로 대체)"""
+        binary_body = _pack_embeddings(batch) if batch.node_ids else None
+        return self._post_bulk("/embeddings/bulk", batch.as_items(), "node_id", batch.labels, "임베딩",
+                               binary_endpoint="/embeddings/bulk/binary", binary_body=binary_body)
+    
+    def _create_objects_from_data(self, scene_id: int, objects: List[Dict[str, Any]], video_unique_id: int) -> None:
+        """객체 노드 데이터 저장 (한 번의 bulk 요청)"""
+        _progress(f"👥 객체 노드 저장: {len(objects)}개")
+        
+        payload = _object_items(objects, f"{video_unique_id}_{scene_id}_")
+        self._post_bulk("/objects/bulk", payload, "object_id",
+                        [obj.get('label') for obj in objects], "객체", scene_id)
+    
+    def _create_events_from_data(self, scene_id: int, events: List[Dict[str, Any]], video_unique_id: int) -> None:
+        """이벤트 노드 데이터 저장 (한 번의 bulk 요청)"""
+        _progress(f"🎬 이벤트 노드 저장: {len(events)}개")
+        
+        payload = _event_items(events, f"{video_unique_id}_{scene_id}_")
+        self._post_bulk("/events/bulk", payload, "event_id",
+                        [event.get('verb') for event in events], "이벤트", scene_id)
     
     def _create_spatial_from_data(self, scene_id: int, spatial: List[Dict[str, Any]], video_unique_id: int) -> None:
-        """공간 관계 데이터 저장"""
-        print(f"📍 공간 관계 저장: {len(spatial)}개")
+        """공간 관계 데이터 저장 (한 번의 bulk 요청)"""
+        _progress(f"📍 공간 관계 저장: {len(spatial)}개")
         
-        for i, rel in enumerate(spatial):
-            try:
-                original_spatial_id = rel.get('spatial_id', f"SPAT_{i}")
-                new_spatial_id = f"{video_unique_id}_{scene_id}_spatial_{original_spatial_id}"
-                
-                # subject_id와 object_id를 새로운 객체 ID로 매핑
-                subject_id = str(rel.get('subject', ''))
-                object_id = str(rel.get('object', ''))
-                
-                if subject_id.isdigit():
-                    subject_id = f"{video_unique_id}_{scene_id}_object_{subject_id}"
-                if object_id.isdigit():
-                    object_id = f"{video_unique_id}_{scene_id}_object_{object_id}"
-                
-                spatial_data = {
-                    "scene_id": scene_id,
-                    "spatial_id": new_spatial_id,
-                    "subject_id": subject_id,
-                    "predicate": rel.get('predicate', 'unknown_relation'),
-                    "object_id": object_id
-                }
-                
-                response = self.session.post(f"{self.db_api_base_url}/spatial", json=spatial_data)
-                response.raise_for_status()
-                print(f"  ✅ 공간 관계 저장: {rel.get('predicate')} (ID: {new_spatial_id})")
-                
-            except Exception as e:
-                print(f"  ❌ 공간 관계 저장 실패: {rel.get('predicate')} - {e}")
+        payload = _spatial_items(spatial, f"{video_unique_id}_{scene_id}_")
+        self._post_bulk("/spatial/bulk", payload, "spatial_id",
+                        [rel.get('predicate') for rel in spatial], "공간 관계", scene_id)
     
     def _create_temporal_from_data(self, scene_id: int, temporal: List[Dict[str, Any]], video_unique_id: int) -> None:
-        """시간 관계 데이터 저장"""
-        print(f"⏰ 시간 관계 저장: {len(temporal)}개")
+        """시간 관계 데이터 저장 (한 번의 bulk 요청)"""
+        _progress(f"⏰ 시간 관계 저장: {len(temporal)}개")
         
-        for i, rel in enumerate(temporal):
-            try:
-                original_temporal_id = rel.get('temporal_id', f"TEMP_{i}")
-                new_temporal_id = f"{video_unique_id}_{scene_id}_temporal_{original_temporal_id}"
-                
-                # subject_id와 object_id를 새로운 이벤트 ID로 매핑
-                subject_id = str(rel.get('subject', ''))
-                object_id = str(rel.get('object', ''))
-                
-                if subject_id.isdigit():
-                    subject_id = f"{video_unique_id}_{scene_id}_event_{subject_id}"
-                if object_id.isdigit():
-                    object_id = f"{video_unique_id}_{scene_id}_event_{object_id}"
-                
-                temporal_data = {
-                    "scene_id": scene_id,
-                    "temporal_id": new_temporal_id,
-                    "subject_id": subject_id,
-                    "predicate": rel.get('predicate', 'unknown_relation'),
-                    "object_id": object_id
-                }
-                
-                response = self.session.post(f"{self.db_api_base_url}/temporal", json=temporal_data)
-                response.raise_for_status()
-                print(f"  ✅ 시간 관계 저장: {rel.get('predicate')} (ID: {new_temporal_id})")
-                
-            except Exception as e:
-                print(f"  ❌ 시간 관계 저장 실패: {rel.get('predicate')} - {e}")
+        payload = _temporal_items(temporal, f"{video_unique_id}_{scene_id}_")
+        self._post_bulk("/temporal/bulk", payload, "temporal_id",
+                        [rel.get('predicate') for rel in temporal], "시간 관계", scene_id)
     
     def _create_embeddings_from_info(self, scene_id: int, embedding_info: Dict[str, Any], video_unique_id: int) -> None:
-        """임베딩 정보에서 임베딩 데이터 저장"""
-        print(f"🔗 임베딩 데이터 저장 시작")
+        """임베딩 정보에서 임베딩 데이터 저장 (한 번의 bulk 요청)"""
+        _progress(f"🔗 임베딩 데이터 저장 시작")
         
         try:
             node_info = embedding_info.get('node_info', [])
-            node_embeddings = embedding_info.get('node_embeddings', [])
-            
-            if len(node_info) != len(node_embeddings):
-                print(f"❌ 노드 정보와 임베딩 개수가 일치하지 않음: {len(node_info)} vs {len(node_embeddings)}")
+            node_embeddings = _as_embedding_matrix(embedding_info.get('node_embeddings', []), len(node_info))
+            if node_embeddings is None:
                 return
             
-            # scene 노드는 제외하고 처리
-            for i, node in enumerate(node_info):
-                node_type = node.get('node_type')
-                if node_type == 'scene':
-                    continue
-                
-                original_node_id = node.get('node_id')
-                node_label = node.get('node_label', 'unknown')
-                
-                # 실제 node_id 생성: {video_unique_id}_{scene_id}_{node_type}_{orig_id}
-                actual_node_id = f"{video_unique_id}_{scene_id}_{node_type}_{original_node_id}"
-                
-                # 임베딩 벡터 가져오기
-                embedding_vector = node_embeddings[i]
-                
-                # 임베딩 데이터 저장
-                embedding_data = {
-                    "node_id": actual_node_id,
-                    "node_type": node_type,
-                    "embedding": embedding_vector
-                }
-                
-                # 임베딩 저장 API 호출 (직접 데이터베이스에 저장)
-                response = self.session.post(f"{self.db_api_base_url}/embeddings", json=embedding_data)
-                response.raise_for_status()
-                
-                print(f"  ✅ 임베딩 저장: {node_label} ({node_type}) - {actual_node_id}")
+            batch = _embedding_batch(node_info, node_embeddings, f"{video_unique_id}_{scene_id}_")
             
-            print(f"✅ 임베딩 데이터 저장 완료: {len([n for n in node_info if n.get('node_type') != 'scene'])}개")
+            # 임베딩 저장 API 호출 (직접 데이터베이스에 저장)
+            if self._post_embeddings(batch) is None:
+                raise RuntimeError("임베딩 일괄 저장 요청 실패")
+            
+            _progress(f"✅ 임베딩 데이터 저장 완료: {len(batch.node_ids)}개")
             
         except Exception as e:
             print(f"❌ 임베딩 데이터 저장 실패: {e}")
@@ -710,7 +1340,8 @@ class SceneGraphDBClient:
 
     # ==================== 검색 기능 ====================
     
-    def vector_search(self, query: str, top_k: int = 5, tau: float = 0.30) -> Dict[str, Any]:
+    def vector_search(self, query: str, top_k: int = 5, tau: float = 0.30,
+                      verbose: bool = False) -> Dict[str, Any]:
         """
         사용자 질의를 triple로 변환하고 벡터 기반 유사도 검색 수행 (BERT 임베딩 사용)
         
@@ -718,39 +1349,56 @@ class SceneGraphDBClient:
             query: 사용자 질의 문자열
             top_k: 반환할 최대 결과 수
             tau: 유사도 임계값
+            verbose: 장면/노드별 매칭 과정 로그 출력 여부 (기본값: 요약만 출력)
         
         Returns:
             Dict: 검색 결과 (triples, search_results 포함)
         """
+        if verbose:
+            _enable_verbose_logging()
+        
         try:
             print(f"🔍 벡터 검색 시작: '{query}'")
             
-            # QueryToTriplesConverter import 및 초기화
-            from reference_query_to_triples_converter import QueryToTriplesConverter
-            import os
-            
-            # 1. 질문을 triples로 변환
-            converter = QueryToTriplesConverter(
-                qa_template_path="templates/qa_to_triple_template.txt",
-                api_key=os.getenv("OPENAI_API_KEY"),
-                model="gpt-4o-mini"
-            )
-            
-            triples = converter.convert_question(query)
-            if not triples:
-                print("❌ 질문을 triple로 변환할 수 없습니다.")
-                return {
-                    "question": query,
-                    "triples": [],
-                    "search_results": [],
-                    "success": False,
-                    "error": "질문을 triple로 변환할 수 없습니다."
-                }
-            
-            print(f"✅ {len(triples)}개 triple 생성 완료")
+            # 같은 질의(공백/대소문자 무시)는 triple 변환과 임베딩을 캐시에서 재사용
+            key = hashlib.sha1(query.strip().lower().encode('utf-8')).hexdigest()
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                triples, queries_emb = cached
+                print(f"✅ 캐시된 triple 사용: {len(triples)}개")
+            else:
+                # QueryToTriplesConverter import 및 초기화
+                from reference_query_to_triples_converter import get_converter
+                import os
+                
+                # 1. 질문을 triples로 변환
+                # 변환기는 모델별로 캐시되어 SBERT/템플릿을 매 호출마다 다시 로드하지 않음
+                converter = get_converter(
+                    qa_template_path="templates/qa_to_triple_template.txt",
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    model="gpt-4o-mini"
+                )
+                
+                triples = converter.convert_question(query)
+                if not triples:
+                    print("❌ 질문을 triple로 변환할 수 없습니다.")
+                    return {
+                        "question": query,
+                        "triples": [],
+                        "search_results": [],
+                        "success": False,
+                        "error": "질문을 triple로 변환할 수 없습니다."
+                    }
+                
+                print(f"✅ {len(triples)}개 triple 생성 완료")
+                queries_emb = self._embed_triples(triples)
+                self._query_cache[key] = (triples, queries_emb)
+                if len(self._query_cache) > QUERY_CACHE_MAXSIZE:
+                    self._query_cache.popitem(last=False)
             
             # 2. DB에서 triple 기반 검색 수행 (BERT만 사용)
-            search_results = self._search_triples_in_db(triples, tau, top_k)
+            search_results = self._search_triples_in_db(triples, tau, top_k, queries_emb)
             
             print(f"✅ 검색 완료: {len(search_results)}개 결과")
             
@@ -773,7 +1421,78 @@ class SceneGraphDBClient:
                 "error": str(e)
             }
     
-    def _search_triples_in_db(self, triples: List[List[str]], tau: float, top_k: int) -> List[Dict[str, Any]]:
+    def _get_bert(self):
+        """검색용 SBERT 모델 반환 (최초 호출 시 로드)"""
+        if self._bert is None:
+            import torch
+            import search_core
+            print(f"🚀 SBERT 모델 로드: {search_core.BERT_NAME} ({search_core.DEVICE})")
+            # 프로세스 전역 SBERT를 공유 (다른 클라이언트/SearchIndex가 이미 로드했다면 재사용)
+            self._bert = search_core.get_sbert()
+            sbert = self._bert
+            
+            @torch.no_grad()
+            def encode(texts: List[str]) -> torch.Tensor:
+                return sbert.encode(texts, batch_size=min(len(texts), 64), normalize_embeddings=True,
+                                    convert_to_tensor=True, show_progress_bar=False).float()
+            
+            # 서버에 저장된 객체 타입/동사 문장을 한 번에 인코딩해 두어 검색 시 encode를 생략
+            self._sentence_cache = search_core.SentenceEmbeddingCache(encode)
+            vocabulary = self.get_vocabulary()
+            if vocabulary:
+                warmed = self._sentence_cache.warm(search_core.vocabulary_sentences(
+                    vocabulary.get('objects', []), vocabulary.get('verbs', [])))
+                print(f"✅ 어휘 문장 임베딩 캐시 로드: {warmed}개")
+        return self._bert
+    
+    def get_vocabulary(self) -> Dict[str, List[str]]:
+        """서버에 저장된 객체 타입("super_type:type_of")과 동사 목록 조회 (미지원 서버는 빈 딕셔너리)"""
+        try:
+            response = self.session.get(f"{self.db_api_base_url}/vocabulary")
+            if response.status_code == 404:
+                response.close()
+                return {}
+            response.raise_for_status()
+            return _loads(response.content)
+        except Exception as e:
+            print(f"⚠️ 어휘 목록 조회 실패: {e}")
+            return {}
+    
+    def clear_models(self) -> None:
+        """캐시된 검색 모델과 질의 임베딩 캐시 해제 (메모리가 부족한 환경에서 사용)"""
+        self._query_cache.clear()
+        if self._bert is None:
+            return
+        self._bert = None
+        self._sentence_cache = None
+        import torch
+        import search_core
+        search_core.release_sbert()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        print("✅ 검색 모델 캐시 해제 완료")
+    
+    def _embed_triples(self, triples: List[List[str]]) -> List[Tuple]:
+        """triple 리스트를 (subject, verb, object) BERT 임베딩 튜플 리스트로 변환"""
+        import search_core
+        
+        # SBERT 모델과 문장 캐시 (클라이언트에 캐시되어 두 번째 검색부터는 로드 생략)
+        self._get_bert()
+        
+        print(f"🔍 변환할 triples: {triples}")
+        # 모든 triple의 subject/verb/object 문장을 모아 캐시에 없는 문장만 한 번의 encode 호출로 임베딩
+        queries_emb = search_core.embed_queries(self._sentence_cache, triples)
+        # 유사도는 서버(pgvector)에서 계산되므로 쿼리 벡터는 CPU로 한 번만 옮겨 두고
+        # 노드별 검색 요청마다 디바이스->호스트 복사/동기화가 반복되지 않도록 함
+        queries_emb = [tuple(e.cpu() if e is not None else None for e in q) for q in queries_emb]
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, (t, emb) in enumerate(zip(triples, queries_emb)):
+                logger.debug("  Triple %d: %s -> %s", i + 1, t,
+                             [type(e).__name__ if e is not None else 'None' for e in emb])
+        return queries_emb
+    
+    def _search_triples_in_db(self, triples: List[List[str]], tau: float, top_k: int,
+                              queries_emb: Optional[List[Tuple]] = None) -> List[Dict[str, Any]]:
         """
         2단계 pgvector 기반 triple 검색 수행 (BERT 임베딩 사용)
         
@@ -784,64 +1503,15 @@ class SceneGraphDBClient:
             triples: 검색할 triple 리스트
             tau: 유사도 임계값
             top_k: 반환할 최대 결과 수
+            queries_emb: 미리 계산된 triple 임베딩 (None이면 새로 계산)
         
         Returns:
             List[Dict]: 검색 결과
         """
         try:
-            BERT_NAME = "sentence-transformers/all-MiniLM-L6-v2"
-            # CUDA 오류 방지를 위해 CPU 강제 사용
-            DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
-            
-            # SBERT 모델 초기화
-            sbert = SentenceTransformer(BERT_NAME, device=DEVICE).eval()
-            
-            @torch.no_grad()
-            def vec(txt: str) -> torch.Tensor:
-                return sbert.encode(txt, normalize_embeddings=True, convert_to_tensor=True).float()
-            
-            def token_to_sentence(tok: str | None) -> str:
-                """
-                토큰을 문장 형태로 변환
-                "person:man" -> "A man which is a kind of person."
-                """
-                if not tok:
-                    return ""
-                if ":" in tok:
-                    super_type, type_of = tok.split(":", 1)
-                    return f"A {type_of} which is a kind of {super_type}."
-                else:
-                    # ":"가 없는 경우 그대로 반환
-                    return tok
-            
-            def embed_query(tokens: List[str]) -> Tuple[torch.Tensor|None, ...]:
-                """BERT를 사용한 쿼리 임베딩"""
-                s_tok, v_tok, o_tok = (tokens + [None, None])[:3]
-                
-                # Subject와 Object는 문장 형태로 변환하여 임베딩
-                q_s = vec(token_to_sentence(s_tok)) if s_tok and s_tok != "None" else None
-                # Predicate는 그대로 임베딩
-                q_v = vec(v_tok) if v_tok and v_tok != "None" else None
-                # Object는 문장 형태로 변환하여 임베딩
-                q_o = (
-                    vec(token_to_sentence(o_tok))
-                    if o_tok and o_tok not in (None, "", "none", "None") else None
-                )
-                return q_s, q_v, q_o
-            
             # 1. triples를 임베딩으로 변환
-            print(f"🔍 변환할 triples: {triples}")
-            queries_emb = []
-            for i, t in enumerate(triples):
-                print(f"  Triple {i+1}: {t}")
-                try:
-                    # BERT 임베딩 사용
-                    emb = embed_query(t)
-                    print(f"  BERT 임베딩 성공: {[type(e).__name__ if e is not None else 'None' for e in emb]}")
-                    queries_emb.append(emb)
-                except Exception as e:
-                    print(f"  ❌ 임베딩 실패: {e}")
-                    raise
+            if queries_emb is None:
+                queries_emb = self._embed_triples(triples)
             total_q = len(queries_emb)
             
             # 2. 입력 검증
@@ -875,12 +1545,20 @@ class SceneGraphDBClient:
         try:
             # 1. 각 triple별로 유사한 노드들 찾기
             all_triple_results = []
+            # 같은 triple이 반복되면 서버 노드 검색은 처음 한 번만 수행하고 결과를 재사용
+            nodes_by_triple: Dict[Tuple, Dict[str, List]] = {}
             
             for query_idx, (s_emb, v_emb, o_emb) in enumerate(queries_emb):
                 print(f"🔍 Triple {query_idx + 1} 검색 중...")
                 
                 # 1단계: 우선순위에 따라 노드 검색
-                similar_nodes = self._find_similar_nodes_by_priority(s_emb, v_emb, o_emb, tau)
+                triple_key = tuple(triples[query_idx])
+                similar_nodes = nodes_by_triple.get(triple_key)
+                if similar_nodes is None:
+                    similar_nodes = self._find_similar_nodes_by_priority(s_emb, v_emb, o_emb, tau)
+                    nodes_by_triple[triple_key] = similar_nodes
+                else:
+                    print(f"  ✅ 중복 triple: 이전 노드 검색 결과 재사용")
                 
                 print(f"  📊 검색된 노드: Subject {len(similar_nodes['subjects'])}개, Verb {len(similar_nodes['verbs'])}개, Object {len(similar_nodes['objects'])}개")
                 
@@ -941,16 +1619,15 @@ class SceneGraphDBClient:
             print(f"  📊 Event 노드: {len(event_nodes)}개, Spatial 노드: {len(spatial_nodes)}개")
             
             # 각 predicate 노드에 대해 연결된 노드들을 DB에서 유사도 계산하여 검색
-            for predicate_node in event_nodes + spatial_nodes:
-                scene_id = predicate_node.get('scene_id')
-                if not scene_id:
-                    continue
-                
-                # 연결된 노드들을 DB에서 유사도 계산하여 검색
-                connected_nodes = self._find_connected_nodes_with_similarity(
-                    scene_id, predicate_node, s_emb, o_emb, tau
-                )
-                
+            # (노드마다 장면 내 검색 요청을 보내는 네트워크 대기이므로 스레드 풀로 동시에 요청하고 결과는 원래 순서대로 합침)
+            predicate_nodes = [node for node in event_nodes + spatial_nodes if node.get('scene_id')]
+            with ThreadPoolExecutor(max_workers=max(1, min(SCENE_SEARCH_MAX_WORKERS, len(predicate_nodes)))) as executor:
+                connected_list = list(executor.map(
+                    lambda node: self._find_connected_nodes_with_similarity(node['scene_id'], node, s_emb, o_emb, tau),
+                    predicate_nodes
+                ))
+            
+            for predicate_node, connected_nodes in zip(predicate_nodes, connected_list):
                 # 결과 추가
                 similar_nodes['subjects'].extend(connected_nodes['subjects'])
                 similar_nodes['objects'].extend(connected_nodes['objects'])
@@ -1018,9 +1695,9 @@ class SceneGraphDBClient:
                 subject_id = predicate_node.get('subject_id')
                 object_id = predicate_node.get('object_id')
                 
-                print(f"  🔍 Event {predicate_node.get('event_id')} 매칭 시도:")
-                print(f"    - Subject ID: {subject_id}")
-                print(f"    - Object ID: {object_id}")
+                logger.debug("  🔍 Event %s 매칭 시도:", predicate_node.get('event_id'))
+                logger.debug("    - Subject ID: %s", subject_id)
+                logger.debug("    - Object ID: %s", object_id)
                 
                 # Subject 노드 유사도 검색 (DB에서 계산)
                 if s_emb is not None and subject_id:
@@ -1034,12 +1711,12 @@ class SceneGraphDBClient:
                     # 검색된 Subject 중에서 Event의 subject_id와 일치하는 것만 필터링
                     matching_subjects = [s for s in subject_results if s['object_id'] == subject_id]
                     connected_nodes['subjects'].extend(matching_subjects)
-                    print(f"  📊 Subject 검색 결과: {len(subject_results)}개 (장면 내)")
-                    print(f"    - 매칭된 Subject: {len(matching_subjects)}개")
+                    logger.debug("  📊 Subject 검색 결과: %s개 (장면 내)", len(subject_results))
+                    logger.debug("    - 매칭된 Subject: %s개", len(matching_subjects))
                     if matching_subjects:
-                        print(f"    - 찾은 Subject: {[s['object_id'] for s in matching_subjects]}")
+                        logger.debug("    - 찾은 Subject: %s", _LazyIds(matching_subjects, 'object_id'))
                     else:
-                        print(f"    - Subject 매칭 실패: {subject_id}")
+                        logger.debug("    - Subject 매칭 실패: %s", subject_id)
                 
                 # Object 노드 유사도 검색 (DB에서 계산)
                 if object_id:
@@ -1055,12 +1732,12 @@ class SceneGraphDBClient:
                         # 검색된 Object 중에서 Event의 object_id와 일치하는 것만 필터링
                         matching_objects = [o for o in object_results if o['object_id'] == object_id]
                         connected_nodes['objects'].extend(matching_objects)
-                        print(f"  📊 Object 검색 결과: {len(object_results)}개 (장면 내)")
-                        print(f"    - 매칭된 Object: {len(matching_objects)}개")
+                        logger.debug("  📊 Object 검색 결과: %s개 (장면 내)", len(object_results))
+                        logger.debug("    - 매칭된 Object: %s개", len(matching_objects))
                         if matching_objects:
-                            print(f"    - 찾은 Object: {[o['object_id'] for o in matching_objects]}")
+                            logger.debug("    - 찾은 Object: %s", _LazyIds(matching_objects, 'object_id'))
                         else:
-                            print(f"    - Object 매칭 실패: {object_id}")
+                            logger.debug("    - Object 매칭 실패: %s", object_id)
                     else:
                         # o_emb가 None인 경우, object_id만으로 검색 (유사도 계산 없이)
                         # 장면 내에서 해당 object_id를 가진 객체를 찾기
@@ -1070,19 +1747,19 @@ class SceneGraphDBClient:
                         )
                         if object_results:
                             connected_nodes['objects'].extend(object_results)
-                            print(f"  📊 Object 검색 결과: {len(object_results)}개 (장면 내)")
-                            print(f"    - 찾은 Object: {[o['object_id'] for o in object_results]}")
+                            logger.debug("  📊 Object 검색 결과: %s개 (장면 내)", len(object_results))
+                            logger.debug("    - 찾은 Object: %s", _LazyIds(object_results, 'object_id'))
                         else:
-                            print(f"    - Object 매칭 실패: {object_id}")
+                            logger.debug("    - Object 매칭 실패: %s", object_id)
             
             # Spatial 노드인 경우
             elif 'spatial_id' in predicate_node:
                 subject_id = predicate_node.get('subject_id')
                 object_id = predicate_node.get('object_id')
                 
-                print(f"  🔍 Spatial {predicate_node.get('spatial_id')} 매칭 시도:")
-                print(f"    - Subject ID: {subject_id}")
-                print(f"    - Object ID: {object_id}")
+                logger.debug("  🔍 Spatial %s 매칭 시도:", predicate_node.get('spatial_id'))
+                logger.debug("    - Subject ID: %s", subject_id)
+                logger.debug("    - Object ID: %s", object_id)
                 
                 # Subject 노드 유사도 검색 (DB에서 계산)
                 if s_emb is not None and subject_id:
@@ -1095,12 +1772,12 @@ class SceneGraphDBClient:
                     # 검색된 Subject 중에서 Spatial의 subject_id와 일치하는 것만 필터링
                     matching_subjects = [s for s in subject_results if s['object_id'] == subject_id]
                     connected_nodes['subjects'].extend(matching_subjects)
-                    print(f"  📊 Subject 검색 결과: {len(subject_results)}개 (장면 내)")
-                    print(f"    - 매칭된 Subject: {len(matching_subjects)}개")
+                    logger.debug("  📊 Subject 검색 결과: %s개 (장면 내)", len(subject_results))
+                    logger.debug("    - 매칭된 Subject: %s개", len(matching_subjects))
                     if matching_subjects:
-                        print(f"    - 찾은 Subject: {[s['object_id'] for s in matching_subjects]}")
+                        logger.debug("    - 찾은 Subject: %s", _LazyIds(matching_subjects, 'object_id'))
                     else:
-                        print(f"    - Subject 매칭 실패: {subject_id}")
+                        logger.debug("    - Subject 매칭 실패: %s", subject_id)
                 
                 # Object 노드 유사도 검색 (DB에서 계산)
                 if object_id:
@@ -1115,12 +1792,12 @@ class SceneGraphDBClient:
                         # 검색된 Object 중에서 Spatial의 object_id와 일치하는 것만 필터링
                         matching_objects = [o for o in object_results if o['object_id'] == object_id]
                         connected_nodes['objects'].extend(matching_objects)
-                        print(f"  📊 Object 검색 결과: {len(object_results)}개 (장면 내)")
-                        print(f"    - 매칭된 Object: {len(matching_objects)}개")
+                        logger.debug("  📊 Object 검색 결과: %s개 (장면 내)", len(object_results))
+                        logger.debug("    - 매칭된 Object: %s개", len(matching_objects))
                         if matching_objects:
-                            print(f"    - 찾은 Object: {[o['object_id'] for o in matching_objects]}")
+                            logger.debug("    - 찾은 Object: %s", _LazyIds(matching_objects, 'object_id'))
                         else:
-                            print(f"    - Object 매칭 실패: {object_id}")
+                            logger.debug("    - Object 매칭 실패: %s", object_id)
                     else:
                         # o_emb가 None인 경우, object_id만으로 검색 (유사도 계산 없이)
                         # 장면 내에서 해당 object_id를 가진 객체를 찾기
@@ -1130,18 +1807,56 @@ class SceneGraphDBClient:
                         )
                         if object_results:
                             connected_nodes['objects'].extend(object_results)
-                            print(f"  📊 Object 검색 결과: {len(object_results)}개 (장면 내)")
-                            print(f"    - 찾은 Object: {[o['object_id'] for o in object_results]}")
+                            logger.debug("  📊 Object 검색 결과: %s개 (장면 내)", len(object_results))
+                            logger.debug("    - 찾은 Object: %s", _LazyIds(object_results, 'object_id'))
                         else:
-                            print(f"    - Object 매칭 실패: {object_id}")
+                            logger.debug("    - Object 매칭 실패: %s", object_id)
             
-            print(f"  📊 연결된 노드: Subject {len(connected_nodes['subjects'])}개, Object {len(connected_nodes['objects'])}개")
+            logger.debug("  📊 연결된 노드: Subject %s개, Object %s개", len(connected_nodes['subjects']), len(connected_nodes['objects']))
             
         except Exception as e:
             print(f"❌ 연결된 노드 검색 실패: {e}")
         
         return connected_nodes
 
+    def _post_vector_search(self, query_emb: torch.Tensor, node_type: str, tau: float, top_k: int,
+                            scene_id: int = None, specific_node_id: str = None):
+        """
+        쿼리 임베딩을 float32 원시 바이트로 /search/vector/binary에 전송 (JSON 직렬화 생략)
+        
+        서버에 바이너리 엔드포인트가 없으면(404) 기존 JSON 엔드포인트로 재시도합니다.
+        
+        Returns:
+            requests.Response
+        """
+        params = {"node_type": node_type, "tau": tau, "top_k": top_k}
+        if scene_id is not None:
+            params["scene_id"] = scene_id
+        if specific_node_id is not None:
+            params["specific_node_id"] = specific_node_id
+        
+        if not self._binary_search_unsupported:
+            # CPU float32 텐서면 복사 없이 numpy 뷰에서 바로 바이트로 변환
+            body = query_emb.detach().cpu().float().numpy().astype('<f4', copy=False).tobytes()
+            response = self.session.post(
+                f"{self.db_api_base_url}/search/vector/binary",
+                params=params,
+                **self._raw_body(body),
+                headers={"Content-Type": "application/octet-stream"},
+                timeout=30
+            )
+            if response.status_code != 404:
+                return response
+            response.close()
+            self._mark_unsupported("_binary_search_unsupported")
+        
+        request_data = dict(params, query_embedding=query_emb.detach().float().numpy())
+        return self.session.post(
+            f"{self.db_api_base_url}/search/vector",
+            **self._raw_body(_dumps(request_data)),
+            timeout=30
+        )
+
     def _search_similarity_in_db(self, query_emb: torch.Tensor, node_type: str, tau: float, 
                                scene_id: int = None, specific_node_id: str = None) -> List[Dict[str, Any]]:
         """
@@ -1183,33 +1898,32 @@ class SceneGraphDBClient:
                 print(f"❌ specific_node_id 검색 실패: {e}")
                 return []
         
-        # 벡터를 리스트로 변환
-        query_vector = query_emb.tolist()
-        
-        # API 요청 데이터 구성
-        request_data = {
-            "query_embedding": query_vector,
-            "node_type": node_type,
-            "tau": tau,
-            "top_k": 10
-        }
-        
-        # 선택적 파라미터 추가
-        if scene_id is not None:
-            request_data["scene_id"] = scene_id
-        if specific_node_id is not None:
-            request_data["specific_node_id"] = specific_node_id
+        # 장면 내 검색은 같은 (쿼리, 장면)이 predicate 노드마다 반복되므로 결과를 캐시
+        cache_key = None
+        if scene_id is not None and specific_node_id is None:
+            digest = hashlib.sha1(query_emb.detach().cpu().float().numpy().tobytes()).hexdigest()
+            cache_key = (digest, node_type, scene_id, round(tau, 6))
+            with self._scene_search_lock:
+                cached = self._scene_search_cache.get(cache_key)
+                if cached is not None:
+                    self._scene_search_cache.move_to_end(cache_key)
+                    return list(cached)
         
         try:
-            # API 호출 (서버에서 pgvector로 유사도 계산)
-            response = self.session.post(
-                f"{self.db_api_base_url}/search/vector",
-                json=request_data,
-                timeout=30
+            # API 호출 (서버에서 pgvector로 유사도 계산, 쿼리 벡터는 바이너리로 전송)
+            response = self._post_vector_search(
+                query_emb, node_type, tau, 10,
+                scene_id=scene_id, specific_node_id=specific_node_id
             )
             
             if response.status_code == 200:
-                results = response.json()
+                results = _loads(response.content)
+                if cache_key is not None:
+                    with self._scene_search_lock:
+                        self._scene_search_cache[cache_key] = results
+                        if len(self._scene_search_cache) > SCENE_SEARCH_CACHE_MAXSIZE:
+                            self._scene_search_cache.popitem(last=False)
+                    return list(results)
                 return results
             else:
                 print(f"❌ {node_type} 노드 검색 실패: {response.status_code} - {response.text}")
@@ -1232,7 +1946,7 @@ class SceneGraphDBClient:
             노드 정보 딕셔너리 또는 None
         """
         try:
-            print(f"🔍 노드 검색: node_id={node_id}, node_type={node_type}, scene_id={scene_id}")
+            logger.debug("🔍 노드 검색: node_id=%s, node_type=%s, scene_id=%s", node_id, node_type, scene_id)
             
             # API를 통해 특정 노드 검색
             if node_type == 'object':
@@ -1246,18 +1960,18 @@ class SceneGraphDBClient:
             
             if response.status_code == 200:
                 nodes = response.json()
-                print(f"📊 {node_type} 노드 개수: {len(nodes)}")
+                logger.debug("📊 %s 노드 개수: %s", node_type, len(nodes))
                 
                 for node in nodes:
                     node_key = 'object_id' if node_type == 'object' else 'event_id' if node_type == 'event' else 'spatial_id'
                     if node.get(node_key) == node_id:
                         if node.get('scene_id') == scene_id:
-                            print(f"✅ 노드 찾음: {node_id}")
+                            logger.debug("✅ 노드 찾음: %s", node_id)
                             return node
                         else:
-                            print(f"⚠️ 노드는 있지만 다른 장면: {node_id} (scene_id: {node.get('scene_id')})")
+                            logger.debug("⚠️ 노드는 있지만 다른 장면: %s (scene_id: %s)", node_id, node.get('scene_id'))
                 
-                print(f"❌ 노드를 찾을 수 없음: {node_id}")
+                logger.debug("❌ 노드를 찾을 수 없음: %s", node_id)
                 return None
             else:
                 print(f"❌ 노드 검색 API 호출 실패: {response.status_code}")
@@ -1283,27 +1997,27 @@ class SceneGraphDBClient:
                     subject_match = None
                     object_match = None
                     
-                    print(f"    🔍 Event {verb_node.get('event_id')} 매칭 시도:")
-                    print(f"      - Subject ID: {verb_node.get('subject_id')}")
-                    print(f"      - Object ID: {verb_node.get('object_id')}")
-                    print(f"      - Available subjects: {[s['object_id'] for s in similar_nodes['subjects']]}")
-                    print(f"      - Available objects: {[o['object_id'] for o in similar_nodes['objects']]}")
+                    logger.debug("    🔍 Event %s 매칭 시도:", verb_node.get('event_id'))
+                    logger.debug("      - Subject ID: %s", verb_node.get('subject_id'))
+                    logger.debug("      - Object ID: %s", verb_node.get('object_id'))
+                    logger.debug("      - Available subjects: %s", _LazyIds(similar_nodes['subjects'], 'object_id'))
+                    logger.debug("      - Available objects: %s", _LazyIds(similar_nodes['objects'], 'object_id'))
                     
                     for subject in similar_nodes['subjects']:
                         if subject['object_id'] == verb_node.get('subject_id'):
                             subject_match = subject
-                            print(f"      ✅ Subject 매칭 성공: {subject['object_id']} (유사도: {subject['similarity']:.3f})")
+                            logger.debug("      ✅ Subject 매칭 성공: %s (유사도: %.3f)", subject['object_id'], subject['similarity'])
                             break
                     
                     # Subject 매칭이 실패한 경우 디버깅 정보 출력
                     if not subject_match:
-                        print(f"      ❌ Subject 매칭 실패: {verb_node.get('subject_id')}")
-                        print(f"        - Available subjects: {[s['object_id'] for s in similar_nodes['subjects']]}")
+                        logger.debug("      ❌ Subject 매칭 실패: %s", verb_node.get('subject_id'))
+                        logger.debug("        - Available subjects: %s", _LazyIds(similar_nodes['subjects'], 'object_id'))
                     
                     for obj in similar_nodes['objects']:
                         if obj['object_id'] == verb_node.get('object_id'):
                             object_match = obj
-                            print(f"      ✅ Object 매칭 성공: {obj['object_id']} (유사도: {obj['similarity']:.3f})")
+                            logger.debug("      ✅ Object 매칭 성공: %s (유사도: %.3f)", obj['object_id'], obj['similarity'])
                             break
                     
                     # Subject가 매칭되어야만 결과 생성 (Subject 매칭이 실패한 경우는 제외)
@@ -1479,27 +2193,12 @@ class SceneGraphDBClient:
         if query_emb is None:
             return []
         
-        # 벡터를 리스트로 변환
-        query_vector = query_emb.tolist()
-        
-        # API 요청 데이터 구성
-        request_data = {
-            "query_embedding": query_vector,
-            "node_type": node_type,
-            "tau": tau,
-            "top_k": 100
-        }
-        
         try:
-            # API 호출
-            response = self.session.post(
-                f"{self.db_api_base_url}/search/vector",
-                json=request_data,
-                timeout=30
-            )
+            # API 호출 (쿼리 벡터는 바이너리로 전송)
+            response = self._post_vector_search(query_emb, node_type, tau, 100)
             
             if response.status_code == 200:
-                results = response.json()
+                results = _loads(response.content)
                 return results
             else:
                 print(f"❌ {node_type} 노드 검색 실패: {response.status_code} - {response.text}")
@@ -1553,17 +2252,23 @@ class SceneGraphDBClient:
                     video_groups[video_id] = {'subjects': [], 'verbs': [], 'objects': []}
                 video_groups[video_id]['objects'].append(obj)
             
+            # 관계 확인 대상 비디오의 모든 장면 이벤트를 한 번의 요청으로 미리 조회
+            scenes_by_video = {video_id: self.get_scenes(video_id)
+                               for video_id, groups in video_groups.items()
+                               if groups['subjects'] and groups['verbs']}
+            bundles = self.get_bulk_scene_data(
+                [scene['id'] for scenes in scenes_by_video.values() for scene in scenes],
+                include_embeddings=False
+            )
+            
             # 각 비디오별로 관계 확인
-            for video_id, groups in video_groups.items():
-                if not groups['subjects'] or not groups['verbs']:
-                    continue
+            for video_id, scenes in scenes_by_video.items():
+                groups = video_groups[video_id]
                 
                 # 해당 비디오의 모든 장면에서 이벤트 확인
-                scenes = self.get_scenes(video_id)
-                
                 for scene in scenes:
                     scene_id = scene['id']
-                    events = self.get_scene_events(scene_id)
+                    events = bundles.get(scene_id, {}).get('events', [])
                     
                     for event in events:
                         event_id = event['event_id']
@@ -1638,28 +2343,12 @@ class SceneGraphDBClient:
         if query_emb is None:
             return []
         
-        # 벡터를 리스트로 변환
-        query_vector = query_emb.tolist()
-        
-        # API 요청 데이터 구성
-        request_data = {
-            "query_embedding": query_vector,
-            "node_type": node_type,
-            "tau": tau,
-            "top_k": 50,
-            "scene_id": scene_id  # 특정 장면으로 제한
-        }
-        
         try:
-            # API 호출
-            response = self.session.post(
-                f"{self.db_api_base_url}/search/vector",
-                json=request_data,
-                timeout=30
-            )
+            # API 호출 (특정 장면으로 제한, 쿼리 벡터는 바이너리로 전송)
+            response = self._post_vector_search(query_emb, node_type, tau, 50, scene_id=scene_id)
             
             if response.status_code == 200:
-                results = response.json()
+                results = _loads(response.content)
                 return results
             else:
                 print(f"❌ 장면 내 벡터 검색 실패: {response.status_code} - {response.text}")
@@ -1764,7 +2453,7 @@ class SceneGraphDBClient:
                 "top_k": top_k
             }
             
-            response = self.session.post(f"{self.db_api_base_url}/search/hybrid", json=search_data)
+            response = self.session.post(f"{self.db_api_base_url}/search/hybrid", **self._raw_body(_dumps(search_data)))
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -1797,51 +2486,52 @@ class SceneGraphDBClient:
         """인덱스 정보 조회"""
         return self.schema_checker.get_index_info()
     
-    def get_data_summary(self) -> Dict[str, Any]:
-        """데이터베이스 요약 정보 조회"""
+    def get_data_summary(self, detailed: bool = False) -> Dict[str, Any]:
+        """
+        데이터베이스 요약 정보 조회 (서버 /summary 집계 한 번 호출)
+        
+        Args:
+            detailed: True이면 서버 집계 대신 장면별 API를 직접 조회하여 클라이언트에서 집계
+        """
         try:
-            videos = self.get_videos()
-            total_scenes = 0
-            total_objects = 0
-            total_events = 0
-            total_embeddings = 0
-            
-            for video in videos:
-                scenes = self.get_scenes(video['id'])
-                total_scenes += len(scenes)
-                
-                for scene in scenes:
-                    objects = self.get_scene_objects(scene['id'])
-                    events = self.get_scene_events(scene['id'])
-                    embeddings = self.get_scene_embeddings(scene['id'])
-                    
-                    total_objects += len(objects)
-                    total_events += len(events)
-                    total_embeddings += len(embeddings)
+            if detailed:
+                return self._aggregate_data_summary()
             
-            return {
-                "total_videos": len(videos),
-                "total_scenes": total_scenes,
-                "total_objects": total_objects,
-                "total_events": total_events,
-                "total_embeddings": total_embeddings,
-                "videos": videos
-            }
+            response = self.session.get(f"{self.db_api_base_url}/summary")
+            if response.status_code == 404:
+                # /summary를 지원하지 않는 서버는 클라이언트에서 집계
+                return self._aggregate_data_summary()
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             print(f"❌ 데이터 요약 조회 실패: {e}")
             return {}
     
+    def _aggregate_data_summary(self, max_workers: int = 16) -> Dict[str, Any]:
+        """장면 데이터를 일괄 조회하여 클라이언트에서 요약 정보 집계"""
+        videos = self.get_videos()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scene_lists = list(executor.map(lambda video: self.get_scenes(video['id']), videos))
+        scene_ids = [scene['id'] for scenes in scene_lists for scene in scenes]
+        
+        bundles = self.get_bulk_scene_data(scene_ids, max_workers=max_workers)
+        totals = {kind: sum(len(bundle.get(kind, [])) for bundle in bundles.values())
+                  for kind in ("objects", "events", "embeddings")}
+        
+        return {
+            "total_videos": len(videos),
+            "total_scenes": len(scene_ids),
+            "total_objects": totals["objects"],
+            "total_events": totals["events"],
+            "total_embeddings": totals["embeddings"],
+            "videos": videos
+        }
+    
     # ==================== 유틸리티 함수 ====================
     
     def _generate_video_id(self, drama_name: str, episode_number: str) -> int:
         """비디오 고유 ID 생성 (32비트 정수 범위 내)"""
-        # 간단한 해시 기반 ID 생성 (32비트 정수 범위 내)
-        import hashlib
-        content = f"{drama_name}_{episode_number}"
-        hash_obj = hashlib.md5(content.encode())
-        # 32비트 정수 범위: -2,147,483,648 ~ 2,147,483,647
-        # 양수 범위: 0 ~ 2,147,483,647
-        return int(hash_obj.hexdigest()[:7], 16) % 2000000000  # 20억 미만으로 제한
+        return _video_unique_id(drama_name, episode_number)
     
     def export_scene_data(self, scene_id: int, output_file: str = None) -> bool:
         """
@@ -1855,16 +2545,38 @@ class SceneGraphDBClient:
             bool: 내보내기 성공 여부
         """
         try:
+            if output_file is None:
+                output_file = f"scene_{scene_id}.json"
+            
+            # 스트리밍 엔드포인트 응답을 파싱 없이 파일로 바로 기록
+            stream_url = f"{self.db_api_base_url}/scenes/{scene_id}/stream"
+            if self.http2:
+                stream_ctx = self.session.stream("GET", stream_url)
+            else:
+                stream_ctx = self.session.get(stream_url, stream=True)
+            with stream_ctx as response:
+                if response.status_code == 200:
+                    chunks = response.iter_bytes(65536) if self.http2 else response.iter_content(chunk_size=65536)
+                    with open(output_file, 'wb') as f:
+                        for chunk in chunks:
+                            f.write(chunk)
+                    print(f"✅ 장면 데이터 내보내기 완료: {output_file}")
+                    return True
+                if response.status_code != 404:
+                    response.raise_for_status()
+            
+            # 스트리밍을 지원하지 않는 서버(404)는 전체 조회 후 기록
             scene_data = self.get_scene_graph(scene_id)
             if not scene_data:
                 print(f"❌ 장면 {scene_id} 데이터를 찾을 수 없습니다.")
                 return False
             
-            if output_file is None:
-                output_file = f"scene_{scene_id}.json"
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(scene_data, f, ensure_ascii=False, indent=2)
+            # 문자열을 거치지 않고 UTF-8 바이트로 바로 기록 (orjson이 있으면 사용)
+            with open(output_file, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(scene_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    f.write(json.dumps(scene_data, ensure_ascii=False, indent=2).encode('utf-8'))
             
             print(f"✅ 장면 데이터 내보내기 완료: {output_file}")
             return True
@@ -0,0 +1,1029 @@
+#!/usr/bin/env python3
+"""
+Triple 검색 공통 모듈
+쿼리 임베딩, 장면 triple 추출, Z_CACHE 샤드 기반 top-k 검색을 한 곳에서 제공합니다.
+SBERT 인스턴스와 샤드 캐시는 SearchIndex 싱글턴으로 공유됩니다.
+"""
+
+import os
+import copy
+import json
+import heapq
+import threading
+import torch
+import numpy as np
+import torch.nn.functional as F
+from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple, Any
+from tqdm import tqdm
+from sentence_transformers import SentenceTransformer
+
+from util.pt_io import load_pt_file
+
+try:
+    import numba
+except ImportError:  # numba 미설치 시 numpy 점수화 사용
+    numba = None
+
+# 검색 관련 상수
+DATASET = "drama_media_data"  # "dummy" or "media_data" or "drama_media_data"
+JSON_ROOT = Path(f"output/{DATASET}/scene_graph_class/gpt-4o")
+Z_CACHE = Path(f"cache/cached_graphs_{DATASET}_embed_fixed_z_ver1+2")
+BERT_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+# CUDA에서는 SBERT 가중치와 샤드 임베딩을 FP16으로 유지 (CPU는 FP16/BF16 행렬곱 이득이 없어 FP32 유지)
+COMPUTE_DTYPE = torch.float16 if DEVICE == "cuda" else torch.float32
+TOP_K = 5
+# 샤드 임베딩을 행 단위 int8로 양자화해 보관 (메모리 1/4, 유사도는 근사값)
+QUANTIZE_INT8 = False
+# 모델별 ONNX export 디렉토리 (search_core와 rgcn_model이 같은 파일/세션을 공유)
+ONNX_DIR = Path("cache/onnx")
+# 문장 임베딩 LRU 캐시 최대 크기 (어휘 사전 로드 포함)
+SENTENCE_CACHE_MAXSIZE = 16384
+
+# 빈 값으로 취급하는 토큰
+_EMPTY_TOKENS = (None, "", "none", "None")
+
+
+def onnx_path_for(model_name: str) -> Path:
+    """모델 이름별 ONNX 파일 경로 (다른 모델로 바꿨을 때 이전 모델의 export를 재사용하지 않도록 이름에 포함)"""
+    return ONNX_DIR / f"{model_name.replace('/', '__')}.onnx"
+
+
+class OnnxSentenceEncoder:
+    """
+    SBERT transformer를 ONNX Runtime으로 실행하는 인코더 (기본 CPUExecutionProvider).
+    토크나이저는 SBERT 것을 그대로 사용하고, pooling과 정규화는 SBERT 모듈 구성을 읽어 numpy로 수행합니다.
+    """
+
+    def __init__(self, sbert: SentenceTransformer, onnx_path: Path,
+                 providers: Optional[List[str]] = None, quantize: bool = False):
+        import onnxruntime as ort
+
+        self.tokenizer = sbert.tokenizer
+        self.max_length = sbert.max_seq_length
+        self.pooling_modes, self.normalize = self._read_pipeline(sbert)
+        self.onnx_path = Path(onnx_path)
+        if not self.onnx_path.exists():
+            self._export(sbert)
+        if quantize:
+            self.onnx_path = self._quantize(self.onnx_path)
+        # 설치된 onnxruntime에서 지원하는 provider만 사용
+        available = set(ort.get_available_providers())
+        providers = [p for p in (providers or ["CPUExecutionProvider"]) if p in available]
+        self.session = ort.InferenceSession(
+            str(self.onnx_path), providers=providers or ["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    @staticmethod
+    def _read_pipeline(sbert: SentenceTransformer) -> Tuple[List[str], bool]:
+        """
+        SBERT 모듈 구성(Transformer -> Pooling -> [Normalize])에서 pooling 방식과 정규화 여부를 읽습니다.
+        numpy로 재현할 수 없는 모듈(Dense 등)이 있으면 ValueError를 발생시킵니다.
+        """
+        from sentence_transformers.models import Normalize, Pooling, Transformer
+
+        pooling_modes: List[str] = []
+        normalize = False
+        for module in sbert._modules.values():
+            if isinstance(module, Transformer):
+                continue
+            if isinstance(module, Pooling):
+                # Pooling 모듈이 출력을 이어붙이는 순서와 동일하게 유지
+                flags = [("cls", module.pooling_mode_cls_token),
+                         ("max", module.pooling_mode_max_tokens),
+                         ("mean", module.pooling_mode_mean_tokens),
+                         ("mean_sqrt_len", module.pooling_mode_mean_sqrt_len_tokens)]
+                if getattr(module, "pooling_mode_weightedmean_tokens", False) or \
+                        getattr(module, "pooling_mode_lasttoken", False):
+                    raise ValueError("ONNX 인코더가 지원하지 않는 pooling 방식입니다 (weightedmean/lasttoken)")
+                pooling_modes = [name for name, on in flags if on]
+            elif isinstance(module, Normalize):
+                normalize = True
+            else:
+                raise ValueError(f"ONNX 인코더가 지원하지 않는 SBERT 모듈: {type(module).__name__}")
+        if not pooling_modes:
+            raise ValueError("ONNX 인코더가 지원하는 pooling 방식이 없습니다")
+        return pooling_modes, normalize
+
+    @torch.no_grad()
+    def _export(self, sbert: SentenceTransformer) -> None:
+        """SBERT의 transformer 모듈을 ONNX 파일로 내보냅니다."""
+        # 사용 중인 SBERT의 디바이스/dtype을 바꾸지 않도록 복사본을 FP32 CPU로 내보냄
+        model = copy.deepcopy(sbert._first_module().auto_model).float().to("cpu").eval()
+        dummy = self.tokenizer(["dummy"], return_tensors="pt")
+        names = ["input_ids", "attention_mask", "token_type_ids"]
+        names = [n for n in names if n in dummy]
+        dynamic = {n: {0: "batch", 1: "seq"} for n in names}
+        dynamic["last_hidden_state"] = {0: "batch", 1: "seq"}
+        self.onnx_path.parent.mkdir(parents=True, exist_ok=True)
+        torch.onnx.export(
+            model, tuple(dummy[n] for n in names), str(self.onnx_path),
+            input_names=names, output_names=["last_hidden_state"],
+            dynamic_axes=dynamic, opset_version=14,
+        )
+        print(f"✅ ONNX 모델 내보내기 완료: {self.onnx_path}")
+
+    @staticmethod
+    def _quantize(onnx_path: Path) -> Path:
+        """FP32 ONNX 그래프의 가중치를 int8로 동적 양자화한 파일(*.int8.onnx)을 만들어 경로를 반환합니다."""
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        int8_path = onnx_path.with_suffix(".int8.onnx")
+        if not int8_path.exists():
+            quantize_dynamic(str(onnx_path), str(int8_path), weight_type=QuantType.QInt8)
+            print(f"✅ ONNX int8 동적 양자화 완료: {int8_path}")
+        return int8_path
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        문장들을 SBERT와 같은 pooling/정규화를 거친 임베딩으로 변환합니다.
+
+        Args:
+            texts (List[str]): 변환할 문장 리스트
+
+        Returns:
+            np.ndarray: [N, D] float32 임베딩
+        """
+        enc = self.tokenizer(texts, padding=True, truncation=True,
+                             max_length=self.max_length, return_tensors="np")
+        feeds = {k: v.astype(np.int64) for k, v in enc.items() if k in self.input_names}
+        hidden = self.session.run(None, feeds)[0]
+        mask = enc["attention_mask"][..., None].astype(np.float32)
+        lengths = np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled = []
+        for mode in self.pooling_modes:
+            if mode == "cls":
+                pooled.append(hidden[:, 0])
+            elif mode == "max":
+                pooled.append(np.where(mask > 0, hidden, -1e9).max(axis=1))
+            elif mode == "mean":
+                pooled.append((hidden * mask).sum(axis=1) / lengths)
+            else:
+                pooled.append((hidden * mask).sum(axis=1) / np.sqrt(lengths))
+        emb = pooled[0] if len(pooled) == 1 else np.concatenate(pooled, axis=1)
+        if self.normalize:
+            emb = emb / np.clip(np.linalg.norm(emb, axis=1, keepdims=True), 1e-12, None)
+        return emb.astype(np.float32)
+
+
+class SentenceEmbeddingCache:
+    """
+    문장 -> 정규화된 임베딩 LRU 캐시.
+    같은 문장("A man which is a kind of person." 등)은 쿼리/검색이 바뀌어도 반복되므로,
+    캐시에 없는 문장만 모아 한 번의 배치로 인코딩합니다.
+    """
+
+    def __init__(self, encode, maxsize: int = SENTENCE_CACHE_MAXSIZE):
+        """
+        Args:
+            encode: 텍스트 리스트 -> (N, dim) 벡터 변환 함수
+            maxsize (int): 캐시할 최대 문장 수
+        """
+        self._encode = encode
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __call__(self, texts: List[str]) -> torch.Tensor:
+        """텍스트 리스트를 (N, dim) 벡터로 변환합니다. (캐시 미스만 인코딩)"""
+        found: Dict[str, torch.Tensor] = {}
+        with self._lock:
+            for text in texts:
+                row = self._cache.get(text)
+                if row is not None:
+                    self._cache.move_to_end(text)
+                    found[text] = row
+
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            emb = self._encode(missing)
+            with self._lock:
+                for text, row in zip(missing, emb):
+                    # 배치 텐서 전체가 캐시에 묶여 있지 않도록 행을 복사해 보관
+                    found[text] = self._cache[text] = row.clone()
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return torch.stack([found[text] for text in texts])
+
+    def warm(self, texts: List[str], batch_size: int = 1024) -> int:
+        """
+        문장들을 미리 인코딩해 캐시에 채웁니다.
+
+        Args:
+            texts (List[str]): 미리 인코딩할 문장 리스트 (maxsize개까지만 사용)
+            batch_size (int): 한 번에 인코딩할 문장 수
+
+        Returns:
+            int: 캐시에 채운 문장 수
+        """
+        texts = [text for text in dict.fromkeys(texts) if text][:self.maxsize]
+        for start in range(0, len(texts), batch_size):
+            self(texts[start:start + batch_size])
+        return len(texts)
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._cache.clear()
+
+
+def compile_sbert(sbert: SentenceTransformer) -> SentenceTransformer:
+    """
+    CUDA에서 SBERT transformer를 torch.compile로 컴파일하고 짧은 문장으로 워밍업합니다.
+    (CPU는 ONNX Runtime 인코더를 사용하므로 그대로 반환, 컴파일 실패 시 eager 모델 유지)
+
+    Args:
+        sbert (SentenceTransformer): 로드된 SBERT 모델
+
+    Returns:
+        SentenceTransformer: transformer가 컴파일된 (또는 원래의) 모델
+    """
+    if DEVICE != "cuda" or not hasattr(torch, "compile"):
+        return sbert
+    module = sbert._first_module()
+    eager = module.auto_model
+    try:
+        # 쿼리 길이(seq)가 매번 달라지므로 dynamic shape로 컴파일해 재컴파일을 줄임
+        module.auto_model = torch.compile(eager, dynamic=True)
+        with torch.no_grad():
+            sbert.encode(["warmup", "a person which is a kind of person."], convert_to_tensor=True,
+                         show_progress_bar=False)
+        print("✅ SBERT transformer 컴파일 완료")
+    except Exception as e:
+        module.auto_model = eager
+        print(f"⚠️ SBERT torch.compile 실패, eager 모드 사용: {e}")
+    return sbert
+
+
+def token_to_sentence(tok: Optional[str], pad_plain: bool = False) -> str:
+    """
+    토큰을 문장 형태로 변환합니다.
+    "person:man" -> "A man which is a kind of person."
+
+    Args:
+        tok (str | None): 변환할 토큰
+        pad_plain (bool): ":"가 없는 토큰도 "A x which is a kind of x." 형태로 변환할지 여부
+
+    Returns:
+        str: 변환된 문장
+    """
+    if not tok:
+        return ""
+    if ":" in tok:
+        sup, typ = tok.split(":", 1)
+    elif pad_plain:
+        sup, typ = tok, tok
+    else:
+        # ":"가 없는 경우 그대로 반환
+        return tok
+    return f"A {typ} which is a kind of {sup}."
+
+
+def vocabulary_sentences(objects: List[str], verbs: List[str], pad_plain: bool = False) -> List[str]:
+    """
+    DB 어휘(객체 "super_type:type_of" 토큰, 이벤트 동사)를 쿼리 임베딩과 같은 규칙의 문장으로 변환합니다.
+
+    Args:
+        objects (List[str]): 객체 토큰 리스트
+        verbs (List[str]): 동사 리스트
+        pad_plain (bool): token_to_sentence의 pad_plain 옵션
+
+    Returns:
+        List[str]: SentenceEmbeddingCache.warm에 넘길 문장 리스트
+    """
+    sentences = [token_to_sentence(tok, pad_plain) for tok in objects if tok not in _EMPTY_TOKENS]
+    return sentences + [verb for verb in verbs if verb not in _EMPTY_TOKENS]
+
+
+def embed_query(vec, tokens: List[str], pad_plain: bool = False) -> Tuple[Optional[torch.Tensor], ...]:
+    """
+    (subject, verb, object) 토큰을 임베딩합니다.
+    subject/object는 문장 형태로, verb는 그대로 임베딩합니다.
+
+    Args:
+        vec: 텍스트 -> 벡터 변환 함수
+        tokens (List[str]): 임베딩할 토큰 리스트
+        pad_plain (bool): token_to_sentence의 pad_plain 옵션
+
+    Returns:
+        Tuple[torch.Tensor|None, ...]: (q_s, q_v, q_o)
+    """
+    s_tok, v_tok, o_tok = (list(tokens) + [None, None])[:3]
+    q_s = vec(token_to_sentence(s_tok, pad_plain)) if s_tok not in _EMPTY_TOKENS else None
+    q_v = vec(v_tok) if v_tok not in _EMPTY_TOKENS else None
+    q_o = vec(token_to_sentence(o_tok, pad_plain)) if o_tok not in _EMPTY_TOKENS else None
+    return q_s, q_v, q_o
+
+
+def embed_queries(encode, triples: List[List[str]], pad_plain: bool = False) -> List[Tuple[Optional[torch.Tensor], ...]]:
+    """
+    여러 (subject, verb, object) 토큰을 한 번의 배치 인코딩으로 임베딩합니다.
+    embed_query와 같은 규칙으로 문장을 만들되, 모든 triple의 문장을 모아 encode를 한 번만 호출합니다.
+
+    Args:
+        encode: 텍스트 리스트 -> (N, dim) 벡터 변환 함수
+        triples (List[List[str]]): 임베딩할 토큰 리스트들
+        pad_plain (bool): token_to_sentence의 pad_plain 옵션
+
+    Returns:
+        List[Tuple[torch.Tensor|None, ...]]: triple별 (q_s, q_v, q_o)
+    """
+    texts: List[str] = []
+    slots: List[List[Optional[int]]] = []
+    for tokens in triples:
+        s_tok, v_tok, o_tok = (list(tokens) + [None, None])[:3]
+        row = []
+        for tok, text in ((s_tok, token_to_sentence(s_tok, pad_plain)), (v_tok, v_tok),
+                          (o_tok, token_to_sentence(o_tok, pad_plain))):
+            if tok in _EMPTY_TOKENS:
+                row.append(None)
+            else:
+                row.append(len(texts))
+                texts.append(text)
+        slots.append(row)
+
+    emb = encode(texts) if texts else None
+    return [tuple(emb[i] if i is not None else None for i in row) for row in slots]
+
+
+def triples_in_scene(js) -> List[Tuple[int, int, Optional[int], str]]:
+    """
+    장면 그래프에서 (subject, event, object, verb) triples를 추출합니다.
+
+    Args:
+        js: 장면 그래프 JSON 객체
+
+    Returns:
+        List[Tuple[int, int, Optional[int], str]]: 추출된 triples
+    """
+    out, g = [], js["scene_graph"]
+    for ev in g.get("events", []):
+        s, o = ev.get("subject"), ev.get("object")
+        if s is None:
+            continue
+        # object가 정수 ID가 아닐 경우 None 처리
+        o = o if isinstance(o, int) else None
+        out.append((s, ev["event_id"], o, ev.get("verb", "")))
+    return out
+
+
+def build_id2idx(orig_ids) -> Dict[Any, int]:
+    """
+    샤드의 orig_id 목록으로 노드 ID -> 행 인덱스 매핑을 생성합니다.
+
+    Args:
+        orig_ids: 샤드에 저장된 orig_id (list 또는 tensor)
+
+    Returns:
+        Dict[Any, int]: 노드 ID -> z 행 인덱스
+    """
+    if isinstance(orig_ids, torch.Tensor):
+        orig_ids = orig_ids.tolist()
+    return {nid: i for i, nid in enumerate(orig_ids)}
+
+
+def quant_i8(t: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    [N, D] 벡터를 행 단위 대칭 int8로 양자화합니다. (v ≈ v_i8 * scale)
+
+    Args:
+        t (torch.Tensor): 양자화할 벡터 [N, D]
+
+    Returns:
+        Tuple[torch.Tensor, torch.Tensor]: (int8 벡터 [N, D], 행별 scale [N])
+    """
+    scale = t.abs().amax(dim=1).clamp_min(1e-12) / 127
+    return (t / scale[:, None]).round().to(torch.int8), scale.to(COMPUTE_DTYPE)
+
+
+def scaled_matmul(q: torch.Tensor, z: torch.Tensor, z_scale: Optional[torch.Tensor] = None) -> torch.Tensor:
+    """
+    q [Q, D] @ z [N, D].T 유사도 행렬 [Q, N]을 계산합니다.
+    int8로 양자화된 z는 계산 dtype으로 올려 곱한 뒤 행별 scale을 열 방향으로 곱합니다.
+    """
+    sims = q.to(z.device, COMPUTE_DTYPE) @ z.to(COMPUTE_DTYPE).T
+    return sims if z_scale is None else sims * z_scale
+
+
+def scaled_matmul_np(q: np.ndarray, z: np.ndarray, z_scale: Optional[np.ndarray] = None) -> np.ndarray:
+    """scaled_matmul의 numpy 버전 (CPU에서 torch 연산 디스패치 없이 BLAS SGEMM 한 번으로 계산)"""
+    sims = q @ (z if z.dtype == np.float32 else z.astype(np.float32)).T
+    return sims if z_scale is None else sims * z_scale
+
+
+def scaled_bmm(q: torch.Tensor, z: torch.Tensor, z_scale: Optional[torch.Tensor] = None) -> torch.Tensor:
+    """
+    성분별 유사도 q [3, Q, D] @ z [3, T, D].T -> [3, Q, T]를 배치 행렬곱 한 번으로 계산합니다.
+    성분마다 행렬곱 결과를 따로 만든 뒤 쌓지 않으므로 샤드당 출력 할당은 한 번입니다.
+    """
+    sims = torch.bmm(q.to(z.device, COMPUTE_DTYPE), z.to(COMPUTE_DTYPE).transpose(1, 2))
+    return sims if z_scale is None else sims * z_scale[:, None, :]
+
+
+def scaled_bmm_np(q: np.ndarray, z: np.ndarray, z_scale: Optional[np.ndarray] = None) -> np.ndarray:
+    """scaled_bmm의 numpy 버전"""
+    sims = np.matmul(q, (z if z.dtype == np.float32 else z.astype(np.float32)).transpose(0, 2, 1))
+    return sims if z_scale is None else sims * z_scale[:, None, :]
+
+
+def migrate_z_cache(cache_dir: Path = Z_CACHE) -> int:
+    """
+    Z_CACHE 샤드 파일에 id2idx 매핑("id2idx_dict")과 단위 벡터로 정규화한 z("z_unit")를 추가하는 1회성 마이그레이션입니다.
+    원본 "z"는 그대로 두므로 다른 소비자(학습/분석 스크립트)에는 영향이 없고, 이미 마이그레이션된 샤드는 건너뜁니다.
+    샤드마다 z 사본이 하나 더 저장되므로 파일 크기는 약 2배가 됩니다.
+
+    실행: python search_core.py --migrate-z-cache [--cache-dir DIR]
+
+    Args:
+        cache_dir (Path): 샤드(.pt) 파일이 있는 디렉토리
+
+    Returns:
+        int: 갱신된 샤드 수
+    """
+    updated = 0
+    for pt_fp in tqdm(list(Path(cache_dir).rglob("*.pt")), desc="migrate"):
+        blob = load_pt_file(pt_fp)
+        if "id2idx_dict" in blob and "z_unit" in blob:
+            continue
+        blob = dict(blob)
+        blob["id2idx_dict"] = build_id2idx(blob["orig_id"])
+        # 검색 시 매번 정규화하지 않도록 미리 정규화해 저장 (작은 norm은 NaN 방지를 위해 clamp)
+        z = blob["z"].float()
+        blob["z_unit"] = z / z.norm(dim=1, keepdim=True).clamp_min(1e-12)
+        # mmap으로 열린 원본을 덮어쓰지 않도록 임시 파일에 저장한 뒤 교체
+        tmp_fp = pt_fp.with_suffix(".pt.tmp")
+        torch.save(blob, tmp_fp)
+        del blob, z
+        os.replace(tmp_fp, pt_fp)
+        updated += 1
+    print(f"✅ 샤드 마이그레이션 완료: {updated}개 갱신")
+    return updated
+
+
+class SearchIndex:
+    """
+    Z_CACHE 샤드 기반 triple 검색 인덱스.
+    SBERT 인코더와 로드된 샤드를 보관하여 여러 진입점에서 공유합니다.
+    """
+
+    def __init__(self, cache_dir: Path = Z_CACHE, json_root: Path = JSON_ROOT,
+                 quantize: bool = QUANTIZE_INT8):
+        self.cache_dir = Path(cache_dir)
+        self.json_root = Path(json_root)
+        self.quantize = quantize
+        self._sbert: Optional[SentenceTransformer] = None
+        self.onnx_encoder: Optional[OnnxSentenceEncoder] = None
+        self.sentence_cache = SentenceEmbeddingCache(self._encode_batch)
+        self._shards: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def sbert(self) -> SentenceTransformer:
+        """SBERT 모델 (최초 접근 시 로드)"""
+        if self._sbert is None:
+            self._sbert = get_sbert()
+            # CPU 환경에서는 ONNX Runtime 인코더를 우선 사용 (실패 시 SBERT 사용)
+            if DEVICE == "cpu":
+                try:
+                    self.onnx_encoder = get_onnx_encoder(self._sbert, BERT_NAME)
+                except Exception as e:
+                    print(f"⚠️ ONNX Runtime 사용 불가, SBERT로 대체합니다: {e}")
+        return self._sbert
+
+    def vec(self, txt: str) -> torch.Tensor:
+        """
+        텍스트를 정규화된 벡터로 변환합니다. (문장 캐시 사용)
+
+        Args:
+            txt (str): 변환할 텍스트
+
+        Returns:
+            torch.Tensor: 변환된 벡터
+        """
+        return self.encode([txt])[0]
+
+    def embed_query(self, tokens: List[str], pad_plain: bool = True) -> Tuple[Optional[torch.Tensor], ...]:
+        """쿼리 토큰을 임베딩합니다. (s, v, o 문장을 토큰별로 나누지 않고 한 번의 encode로 처리)"""
+        return embed_queries(self.encode, [tokens], pad_plain)[0]
+
+    def encode(self, texts: List[str]) -> torch.Tensor:
+        """텍스트 리스트를 정규화된 (N, dim) 벡터로 변환합니다. (캐시에 없는 문장만 인코딩)"""
+        return self.sentence_cache(texts)
+
+    @torch.no_grad()
+    def _encode_batch(self, texts: List[str]) -> torch.Tensor:
+        """텍스트 리스트를 한 번에 정규화된 (N, dim) 벡터로 변환합니다."""
+        sbert = self.sbert
+        if self.onnx_encoder is not None:
+            return torch.from_numpy(self.onnx_encoder.encode(texts))
+        return sbert.encode(texts, batch_size=min(len(texts), 64), normalize_embeddings=True,
+                            convert_to_tensor=True, show_progress_bar=False).float()
+
+    def warm_vocabulary(self, objects: List[str], verbs: List[str], pad_plain: bool = True) -> int:
+        """
+        알려진 어휘(객체 토큰, 동사)의 문장 임베딩을 미리 캐시에 채웁니다.
+
+        Args:
+            objects (List[str]): 객체 "super_type:type_of" 토큰 리스트
+            verbs (List[str]): 동사 리스트
+            pad_plain (bool): token_to_sentence의 pad_plain 옵션
+
+        Returns:
+            int: 캐시에 채운 문장 수
+        """
+        return self.sentence_cache.warm(vocabulary_sentences(objects, verbs, pad_plain))
+
+    def embed_queries(self, triples: List[List[str]], pad_plain: bool = True) -> List[Tuple[Optional[torch.Tensor], ...]]:
+        """여러 쿼리 triple을 한 번의 배치 인코딩으로 임베딩합니다."""
+        return embed_queries(self.encode, triples, pad_plain)
+
+    def _load_shards(self) -> List[Dict[str, Any]]:
+        """
+        샤드 파일과 대응하는 장면 JSON을 한 번만 읽어 메모리에 보관합니다.
+
+        Returns:
+            List[Dict]: 샤드별 z, id2idx, 상대 경로, 장면 triples
+        """
+        if self._shards is not None:
+            return self._shards
+
+        shards = []
+        for pt_fp in tqdm(list(self.cache_dir.rglob("*.pt")), desc="load shards"):
+            blob = load_pt_file(pt_fp)
+            rel_path = Path(blob["path"])
+            js_fp = self.json_root / rel_path
+            if not js_fp.exists():
+                continue
+            with js_fp.open() as f:
+                scene_triples = triples_in_scene(json.load(f))
+            if not scene_triples:
+                continue
+
+            shard = self._build_shard(blob, scene_triples)
+            if shard is not None:
+                shards.append(shard)
+        self._shards = shards
+        return shards
+
+    def _build_shard(self, blob: Dict[str, Any], scene_triples: List[Tuple]) -> Optional[Dict[str, Any]]:
+        """
+        샤드의 triple 성분 벡터를 접근 순서대로 [3, T, D] 텐서 Z(s/v/o)에 미리 쌓아 둡니다.
+        object가 없는 triple은 0번 패딩 행(영벡터)을 가리키고 has_o 마스크로 구분합니다.
+
+        Args:
+            blob (Dict): 샤드 파일 내용
+            scene_triples (List[Tuple]): 장면 triples
+
+        Returns:
+            Dict | None: 유효한 triple이 없으면 None
+        """
+        # 마이그레이션된 샤드(migrate_z_cache)는 정규화된 z_unit과 id2idx를 함께 보관
+        z = blob["z_unit"].float() if "z_unit" in blob else F.normalize(blob["z"].float(), dim=1)
+        id2idx = blob.get("id2idx_dict")
+        if id2idx is None:
+            id2idx = build_id2idx(blob["orig_id"])
+
+        sid_idx, eid_idx, oid_idx, triple_ids = [], [], [], []
+        for sid, eid, oid, _ in scene_triples:
+            # triple의 각 요소가 list인 경우 스킵
+            if any(isinstance(x, list) for x in (sid, eid, oid)):
+                continue
+            if sid not in id2idx or eid not in id2idx:
+                continue
+            sid_idx.append(id2idx[sid])
+            eid_idx.append(id2idx[eid])
+            oid_idx.append(id2idx[oid] + 1 if (oid is not None and oid in id2idx) else 0)
+            triple_ids.append((sid, eid, oid))
+        if not triple_ids:
+            return None
+
+        # s/v/o 성분을 한 텐서 [3, T, D]에 모아 두어 검색 시 샤드마다 torch.stack 없이 bmm 한 번으로 점수화
+        # (z_pad의 0번 행은 object 없는 triple용 영벡터 패딩)
+        comp_idx = torch.stack([torch.as_tensor(sid_idx) + 1, torch.as_tensor(eid_idx) + 1,
+                                torch.as_tensor(oid_idx)])
+        tensors = {"has_o": comp_idx[2] > 0}
+        if self.quantize:
+            # 성분 행렬은 z의 양자화 결과에서 뽑아 상한 계산과 같은 값을 쓰도록 함 (패딩 행은 scale 0)
+            z, z_scale = quant_i8(z)
+            scale_pad = torch.cat([z_scale.new_zeros(1), z_scale])
+            tensors.update({"z_scale": z_scale, "Z_scale": scale_pad[comp_idx]})
+        z_pad = torch.cat([z.new_zeros(1, z.shape[1]), z])
+        tensors.update({"z": z, "Z": z_pad[comp_idx]})
+        for name, t in tensors.items():
+            if t.is_floating_point():
+                t = t.to(COMPUTE_DTYPE)
+            t = t.contiguous()
+            if DEVICE != "cpu":
+                # pinned 메모리에서 한 번만 디바이스로 복사해 캐시
+                t = t.pin_memory().to(DEVICE, non_blocking=True)
+            tensors[name] = t
+        # 성분별 [T, D] 행렬은 Z의 연속 뷰 (numba 커널 등에서 사용, 추가 메모리 없음)
+        for i, name in enumerate(("Zs", "Zv", "Zo")):
+            tensors[name] = tensors["Z"][i]
+            if "Z_scale" in tensors:
+                tensors[f"{name}_scale"] = tensors["Z_scale"][i]
+
+        shard = {
+            **tensors,
+            "rel_path": Path(blob["path"]),
+            "triple_ids": triple_ids,
+        }
+        if DEVICE == "cpu":
+            # CPU에서는 메모리를 공유하는 numpy 뷰로 점수화 (복사 없음)
+            shard["np"] = {name: t.numpy() for name, t in tensors.items()}
+        return shard
+
+    def reload(self) -> None:
+        """샤드 캐시를 비워 다음 검색 시 다시 로드하도록 합니다."""
+        self._shards = None
+
+    @torch.no_grad()
+    def shard_upper_bound(self, z: torch.Tensor, queries: Dict[str, Any], tau: float,
+                          z_scale: Optional[torch.Tensor] = None) -> Tuple[int, float]:
+        """
+        샤드가 얻을 수 있는 (match_cnt, avg_sim)의 상한을 계산합니다.
+        각 쿼리 성분(s/v/o)에 대해 샤드 전체 노드와의 최대 유사도를 한 번의 행렬곱으로 구합니다.
+
+        Args:
+            z (torch.Tensor | np.ndarray): 정규화된 샤드 임베딩 [N, D] (quantize 시 int8, CPU에서는 numpy 뷰)
+            queries (Dict): stack_queries 결과 (디바이스에 올라간 성분 행렬 comps 사용)
+            tau (float): 유사도 임계값
+            z_scale (torch.Tensor | np.ndarray, optional): int8 z의 행별 scale [N]
+
+        Returns:
+            Tuple[int, float]: (매칭 가능한 쿼리 수 상한, 평균 유사도 상한)
+        """
+        if z.shape[0] == 0:
+            return 0, 0.0
+        if isinstance(z, np.ndarray):
+            col_max = scaled_matmul_np(queries["np"]["comps"], z, z_scale).max(axis=1).tolist()
+        else:
+            col_max = scaled_matmul(queries["comps"], z, z_scale).max(dim=1).values.float().tolist()
+
+        upper_match, upper_avg, pos = 0, 0.0, 0
+        for n, dup in zip(queries["comp_counts"], queries["dup_counts"]):
+            bounds = col_max[pos:pos + n]
+            pos += n
+            if not bounds or min(bounds) < tau:
+                continue
+            upper_match += dup
+            upper_avg = max(upper_avg, sum(bounds) / len(bounds))
+        return upper_match, upper_avg
+
+    def _score_shard(self, shard: Dict[str, Any], queries: Dict[str, Any], tau: float,
+                     floor: Optional[Tuple[int, float]]) -> Optional[Tuple]:
+        """
+        샤드 하나를 점수화하여 힙 항목을 반환합니다.
+
+        Args:
+            shard (Dict): 로드된 샤드
+            queries (Dict): stack_queries 결과
+            tau (float): 유사도 임계값
+            floor (Tuple | None): 힙이 가득 찼을 때의 최저 (match_cnt, avg_sim)
+
+        Returns:
+            Tuple | None: (match_cnt, avg_sim, matched, drama, rel_path, total_q), 매칭이 없거나 가지치기되면 None
+        """
+        rel_path = shard["rel_path"]
+
+        # 힙이 가득 찬 뒤에는 상한이 힙 최저값을 넘지 못하는 샤드를 건너뜀
+        if floor is not None:
+            arrays = shard.get("np", shard)
+            upper_match, upper_avg = self.shard_upper_bound(arrays["z"], queries, tau, arrays.get("z_scale"))
+            if (upper_match, upper_avg) <= floor:
+                return None
+
+        # 모든 고유 쿼리 x 샤드 triple 유사도를 성분별 행렬곱 한 번씩으로 계산 ([3, Q, T])
+        best, rows, comps = best_triple_per_query(queries, shard, tau)
+        unique_matched = {}
+        for u_idx, (best_sim, r) in enumerate(zip(best, rows)):
+            if best_sim == float("-inf"):
+                continue
+            comp = [comps[i][u_idx] if queries["present"][i][u_idx] else None for i in range(3)]
+            unique_matched[u_idx] = (best_sim, comp[0], comp[1], comp[2], shard["triple_ids"][r])
+
+        # 중복 쿼리는 고유 쿼리의 결과를 원래 쿼리 순번으로 펼쳐 기존과 같은 matched/점수를 만듦
+        matched = [(q_idx, *unique_matched[u_idx]) for q_idx, u_idx in enumerate(queries["inverse"])
+                   if u_idx in unique_matched]
+        if not matched:
+            return None
+        match_cnt = len(matched)
+        avg_sim = sum(m[1] for m in matched) / match_cnt
+        return (match_cnt, avg_sim, matched, rel_path.parts[0], rel_path, len(queries["inverse"]))
+
+    def search_topk_multi(self, queries_emb: List[Tuple], tau: float, k: int = TOP_K,
+                          max_workers: Optional[int] = None):
+        """
+        여러 쿼리에 대해 top-k 장면 검색을 수행합니다.
+        CPU에서는 샤드 점수화를 스레드 풀로 병렬 수행합니다 (torch 연산 중에는 GIL이 해제됨).
+
+        Args:
+            queries_emb (List[Tuple]): 임베딩된 쿼리들
+            tau (float): 유사도 임계값
+            k (int): 반환할 최대 결과 수
+            max_workers (int, optional): 스레드 수 (기본값: CPU 코어 수 // torch intra-op 스레드 수, CUDA에서는 1)
+
+        Returns:
+            List: (match_cnt, avg_sim, matched, drama, rel_path, total_q) 결과 리스트
+        """
+        heap = []
+        if not any(q is not None for q_emb in queries_emb for q in q_emb):
+            return []
+        queries = stack_queries(queries_emb)
+        shards = self._load_shards()
+        if max_workers is None:
+            # 전역 intra-op 스레드 수는 건드리지 않고, 워커 수 x intra-op 스레드 수가 코어 수를 넘지 않게 맞춤
+            max_workers = 1 if DEVICE != "cpu" else max(1, (os.cpu_count() or 1) // torch.get_num_threads())
+        lock = threading.Lock()
+
+        def score(idx: int, shard: Dict[str, Any]) -> None:
+            # 힙 최저값은 단조 증가하므로 오래된 값으로 가지치기해도 결과는 같음 (덜 건너뛸 뿐)
+            with lock:
+                floor = (heap[0][0], heap[0][1]) if len(heap) >= k else None
+            entry = self._score_shard(shard, queries, tau, floor)
+            if entry is None:
+                return
+            # 힙은 (match_cnt, avg_sim, -샤드 순번)으로만 비교 (동점이면 앞 샤드 우선, matched 리스트 비교 없음)
+            item = (entry[0], entry[1], -idx, entry)
+            with lock:
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                else:
+                    heapq.heappushpop(heap, item)
+
+        if max_workers <= 1 or len(shards) <= 1:
+            for idx, shard in enumerate(tqdm(shards, desc="search")):
+                score(idx, shard)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(score, idx, shard) for idx, shard in enumerate(shards)]
+                for future in tqdm(as_completed(futures), total=len(futures), desc="search"):
+                    future.result()
+
+        return [item[-1] for item in sorted(heap, reverse=True)]
+
+
+def stack_queries(queries_emb: List[Tuple]) -> Dict[str, Any]:
+    """
+    쿼리 임베딩 (q_s, q_v, q_o) 목록을 성분별 [Q, D] 행렬로 한 번만 쌓아 디바이스로 옮깁니다.
+    없는 성분은 영벡터로 채우고 present 마스크로 구분합니다.
+    샤드 루프 안에서는 더 이상 쿼리를 디바이스로 복사하지 않습니다.
+    같은 임베딩의 중복 쿼리는 한 번만 쌓고, inverse로 원래 쿼리 순번에 대응시킵니다.
+
+    Args:
+        queries_emb (List[Tuple]): 임베딩된 쿼리들 (하나 이상의 성분이 있어야 함)
+
+    Returns:
+        Dict: 고유 쿼리 Q개 기준 Q [3, Q, D], present [3, Q] (bool 텐서와 파이썬 리스트), n_present [Q],
+              comps [C, D] (쿼리 순서대로 있는 성분만), comp_counts [Q], dup_counts [Q] (고유 쿼리별 중복 수),
+              inverse [원래 쿼리 수] (원래 쿼리 -> 고유 쿼리 순번)
+    """
+    unique: Dict[Tuple, int] = {}
+    unique_emb: List[Tuple] = []
+    inverse: List[int] = []
+    for q_emb in queries_emb:
+        key = tuple(q.float().cpu().numpy().tobytes() if q is not None else None for q in q_emb)
+        if key not in unique:
+            unique[key] = len(unique_emb)
+            unique_emb.append(q_emb)
+        inverse.append(unique[key])
+    dup_counts = [inverse.count(u_idx) for u_idx in range(len(unique_emb))]
+    queries_emb = unique_emb
+
+    roles = list(zip(*queries_emb))
+    dim = next(q.shape[-1] for role in roles for q in role if q is not None)
+    zero = torch.zeros(dim)
+    Q = torch.stack([torch.stack([q.float().cpu() if q is not None else zero for q in role])
+                     for role in roles])
+    present = torch.tensor([[q is not None for q in role] for role in roles], dtype=torch.bool)
+    comps = torch.stack([q.float().cpu() for q_emb in queries_emb for q in q_emb if q is not None])
+
+    def to_device(t: torch.Tensor) -> torch.Tensor:
+        t = t.contiguous()
+        return t.pin_memory().to(DEVICE, non_blocking=True) if DEVICE != "cpu" else t
+
+    queries = {
+        "Q": to_device(Q.to(COMPUTE_DTYPE)),
+        "present_t": to_device(present),
+        "present": present.tolist(),
+        "n_present": to_device(present.sum(dim=0)),
+        "comps": to_device(comps.to(COMPUTE_DTYPE)),
+        "comp_counts": [sum(q is not None for q in q_emb) for q_emb in queries_emb],
+        "dup_counts": dup_counts,
+        "inverse": inverse,
+    }
+    if DEVICE == "cpu":
+        queries["np"] = {name: queries[name].numpy() for name in ("Q", "present_t", "n_present", "comps")}
+    return queries
+
+
+@torch.no_grad()
+def best_triple_per_query(queries: Dict[str, Any], shard: Dict[str, Any],
+                          tau: float) -> Tuple[List[float], List[int], List[List[float]]]:
+    """
+    샤드의 모든 triple에 대해 쿼리별 최고 점수 triple을 찾습니다.
+    성분별 유사도는 [3, Q, D] @ [3, D, T] 배치 행렬곱 한 번으로 계산하고,
+    임계치/객체 필수 조건과 평균은 마스크 연산으로 처리해 동기화는 샤드당 한 번입니다.
+
+    Args:
+        queries (Dict): stack_queries 결과
+        shard (Dict): Z [3, T, D], has_o (quantize 시 Z_scale 포함)를 가진 샤드
+        tau (float): 유사도 임계값
+
+    Returns:
+        Tuple: 쿼리별 (최고 평균 유사도(-inf면 매칭 없음), triple 행 번호, 성분별 유사도 [3][Q])
+    """
+    if "np" in shard and "np" in queries:
+        queries_np, shard_np = queries["np"], shard["np"]
+        # numba 커널은 FP32 샤드만 계산 (int8 샤드는 numpy 경로)
+        if _score_scene_numba is not None and "z_scale" not in shard_np:
+            best, rows, comps = _score_scene_numba(shard_np["Zs"], shard_np["Zv"], shard_np["Zo"], shard_np["has_o"],
+                                                   queries_np["Q"], queries_np["present_t"], tau)
+            return best.tolist(), rows.tolist(), comps.tolist()
+        return _best_triple_per_query_np(queries_np, shard_np, tau)
+
+    Q, present, n_present = queries["Q"], queries["present_t"], queries["n_present"]
+    # 행렬곱은 계산 dtype(CUDA면 FP16)으로, 임계치 비교와 평균은 FP32로 수행
+    sims = scaled_bmm(Q, shard["Z"], shard.get("Z_scale")).float()  # [3, Q, T]
+
+    # 있는 성분은 모두 tau 이상, object가 있는 쿼리는 object가 있는 triple만 허용
+    ok = ((sims >= tau) | ~present[:, :, None]).all(dim=0)
+    ok &= ~present[2][:, None] | shard["has_o"][None, :]
+    ok &= (n_present > 0)[:, None]
+    avg = (sims * present[:, :, None]).sum(dim=0) / n_present.clamp(min=1)[:, None]
+    avg = avg.masked_fill(~ok, float("-inf"))
+
+    best, rows = avg.max(dim=1)
+    comps = sims.gather(2, rows.view(1, -1, 1).expand(3, -1, 1)).squeeze(2)
+    return best.tolist(), rows.tolist(), comps.tolist()
+
+
+def _best_triple_per_query_np(queries: Dict[str, np.ndarray], shard: Dict[str, np.ndarray],
+                              tau: float) -> Tuple[List[float], List[int], List[List[float]]]:
+    """best_triple_per_query의 numpy 버전 (CPU 전용, 샤드/쿼리의 numpy 뷰 사용)"""
+    Q, present, n_present = queries["Q"], queries["present_t"], queries["n_present"]
+    sims = scaled_bmm_np(Q, shard["Z"], shard.get("Z_scale"))  # [3, Q, T]
+
+    ok = ((sims >= tau) | ~present[:, :, None]).all(axis=0)
+    ok &= ~present[2][:, None] | shard["has_o"][None, :]
+    ok &= (n_present > 0)[:, None]
+    avg = (sims * present[:, :, None]).sum(axis=0) / np.maximum(n_present, 1)[:, None]
+    avg[~ok] = -np.inf
+
+    rows = avg.argmax(axis=1)
+    cols = np.arange(len(rows))
+    return avg[cols, rows].tolist(), rows.tolist(), sims[:, cols, rows].tolist()
+
+
+def _score_scene(Zs: np.ndarray, Zv: np.ndarray, Zo: np.ndarray, has_o: np.ndarray,
+                 Q: np.ndarray, present: np.ndarray, tau: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    _best_triple_per_query_np와 같은 점수화를 쿼리 x triple 루프로 수행합니다. (numba로 컴파일해 사용)
+    [3, Q, T] 유사도 행렬을 만들지 않고, 성분 하나라도 tau 미만이면 나머지 내적을 생략합니다.
+
+    Args:
+        Zs, Zv, Zo (np.ndarray): 샤드 triple 성분 벡터 [T, D] (FP32)
+        has_o (np.ndarray): triple별 object 유무 [T]
+        Q (np.ndarray): 쿼리 성분 벡터 [3, Q, D]
+        present (np.ndarray): 쿼리 성분 유무 [3, Q]
+        tau (float): 유사도 임계값
+
+    Returns:
+        Tuple: 쿼리별 (최고 평균 유사도(-inf면 매칭 없음) [Q], triple 행 번호 [Q], 성분별 유사도 [3, Q])
+    """
+    Z = (Zs, Zv, Zo)
+    n_q, n_t, dim = Q.shape[1], Zs.shape[0], Zs.shape[1]
+    best = np.full(n_q, -np.inf)
+    rows = np.zeros(n_q, dtype=np.int64)
+    comps = np.zeros((3, n_q))
+    for q in range(n_q):
+        n_present = 0
+        for i in range(3):
+            if present[i, q]:
+                n_present += 1
+        if n_present == 0:
+            continue
+        for t in range(n_t):
+            if present[2, q] and not has_o[t]:
+                continue
+            total = 0.0
+            ok = True
+            for i in range(3):
+                if not present[i, q]:
+                    continue
+                sim = 0.0
+                for d in range(dim):
+                    sim += Q[i, q, d] * Z[i][t, d]
+                if sim < tau:
+                    ok = False
+                    break
+                total += sim
+            if ok and total / n_present > best[q]:
+                best[q] = total / n_present
+                rows[q] = t
+        for i in range(3):
+            sim = 0.0
+            for d in range(dim):
+                sim += Q[i, q, d] * Z[i][rows[q], d]
+            comps[i, q] = sim
+    return best, rows, comps
+
+
+# nogil로 컴파일해 search_topk_multi의 샤드 스레드들이 GIL 없이 동시에 점수화하도록 함
+# fastmath는 내적 벡터화에 필요한 플래그만 사용 (ninf/nnan은 -inf("매칭 없음") 비교를 정의되지 않게 하므로 제외)
+_SCORE_SCENE_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+_score_scene_numba = (numba.njit(nogil=True, fastmath=_SCORE_SCENE_FASTMATH, cache=True)(_score_scene)
+                      if numba is not None else None)
+
+
+_sbert: Optional[SentenceTransformer] = None
+_sbert_lock = threading.Lock()
+
+
+def get_sbert() -> SentenceTransformer:
+    """
+    프로세스 전역 SBERT 모델을 반환합니다. (최초 호출 시 한 번만 로드, CUDA에서는 FP16 + torch.compile)
+    SearchIndex와 SceneGraphDBClient가 같은 인스턴스를 공유해 모델을 두 번 올리지 않습니다.
+
+    Returns:
+        SentenceTransformer: 공유 SBERT 모델 (eval 모드)
+    """
+    global _sbert
+    with _sbert_lock:
+        if _sbert is None:
+            sbert = SentenceTransformer(BERT_NAME, device=DEVICE).eval()
+            _sbert = compile_sbert(sbert.half()) if DEVICE == "cuda" else sbert
+    return _sbert
+
+
+def release_sbert() -> None:
+    """공유 SBERT 참조를 해제합니다. (다른 곳에서 잡고 있지 않으면 메모리가 반환됨, 다음 get_sbert에서 다시 로드)"""
+    global _sbert
+    with _sbert_lock:
+        _sbert = None
+
+
+_onnx_encoders: Dict[Tuple[str, Tuple[str, ...], bool], OnnxSentenceEncoder] = {}
+_onnx_lock = threading.Lock()
+
+
+def get_onnx_encoder(sbert: SentenceTransformer, model_name: str,
+                     providers: Optional[List[str]] = None, quantize: bool = False) -> OnnxSentenceEncoder:
+    """
+    모델별 공유 ONNX 인코더를 반환합니다. (같은 모델/provider 조합은 export와 세션을 한 번만 만듦)
+
+    Args:
+        sbert (SentenceTransformer): export와 토크나이저/pooling 구성에 쓸 SBERT 모델
+        model_name (str): SBERT 모델명 (ONNX 파일 경로 결정)
+        providers (List[str], optional): ONNX Runtime provider 우선순위 (기본값: CPU)
+        quantize (bool): int8 동적 양자화한 ONNX 그래프를 사용할지 여부 (CPU용)
+
+    Returns:
+        OnnxSentenceEncoder: 공유 인코더
+    """
+    providers = list(providers or ["CPUExecutionProvider"])
+    onnx_path = onnx_path_for(model_name)
+    key = (str(onnx_path), tuple(providers), quantize)
+    with _onnx_lock:
+        encoder = _onnx_encoders.get(key)
+        if encoder is None:
+            encoder = OnnxSentenceEncoder(sbert, onnx_path, providers=providers, quantize=quantize)
+            _onnx_encoders[key] = encoder
+    return encoder
+
+
+_search_index: Optional[SearchIndex] = None
+
+
+def get_search_index() -> SearchIndex:
+    """
+    프로세스 전역 SearchIndex 인스턴스를 반환합니다.
+
+    Returns:
+        SearchIndex: 공유 검색 인덱스
+    """
+    global _search_index
+    if _search_index is None:
+        _search_index = SearchIndex()
+    return _search_index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="검색 인덱스 유틸리티")
+    parser.add_argument("--migrate-z-cache", action="store_true",
+                        help="Z_CACHE 샤드에 id2idx_dict/z_unit을 추가 (원본 z는 유지)")
+    parser.add_argument("--cache-dir", type=Path, default=Z_CACHE, help="샤드(.pt) 디렉토리")
+    args = parser.parse_args()
+
+    if args.migrate_z_cache:
+        migrate_z_cache(args.cache_dir)
+    else:
+        parser.print_help()
@@ -6,9 +6,13 @@
 from .delete_video_data import VideoDataDeleter
 from .check_stored_data import SceneGraphDataChecker
 from .scene_graph_api_uploader import SceneGraphAPIUploader
+from .http_session import create_http_session
+from .pt_io import load_pt_file
 
 __all__ = [
     'VideoDataDeleter',
     'SceneGraphDataChecker', 
-    'SceneGraphAPIUploader'
+    'SceneGraphAPIUploader',
+    'create_http_session',
+    'load_pt_file'
 ]
@@ -4,16 +4,44 @@
 """
 
 import requests
-import json
 import os
-from typing import Dict, List, Any
+import numpy as np
+from typing import Dict, List, Any, Optional
+
+try:
+    from .http_session import create_http_session
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from http_session import create_http_session
+
+
+def parse_embedding(embedding_data: Any) -> np.ndarray:
+    """
+    임베딩 값을 float32 배열로 변환
+    
+    pgvector 텍스트("[0.1,0.2,...]")는 JSON 파서 대신 numpy의 C 파서로 한 번에 읽습니다.
+    
+    Raises:
+        ValueError: 숫자 배열로 해석할 수 없는 경우
+    """
+    if isinstance(embedding_data, str):
+        text = embedding_data.strip()
+        if not (text.startswith('[') and text.endswith(']')):
+            raise ValueError(f"pgvector 형식이 아닙니다: {text[:20]}...")
+        body = text[1:-1]
+        vector = np.fromstring(body, sep=',', dtype=np.float32)
+        if vector.size != body.count(',') + 1 and body.strip():
+            raise ValueError("숫자가 아닌 값이 포함되어 있습니다")
+        return vector
+    return np.asarray(embedding_data, dtype=np.float32).ravel()
+
 
 class SceneGraphDataChecker:
     """저장된 장면그래프 데이터 확인 클래스"""
     
-    def __init__(self, api_base_url: str = None):
+    def __init__(self, api_base_url: str = None, session: Optional[requests.Session] = None):
         self.api_base_url = api_base_url or os.getenv("API_URL", "http://localhost:8000")
-        self.session = requests.Session()
+        # 상위 클라이언트가 넘겨준 세션이 있으면 커넥션 풀을 공유
+        self.session = session or create_http_session()
     
     def check_connection(self) -> bool:
         """API 서버 연결 확인"""
@@ -173,19 +201,13 @@ class SceneGraphDataChecker:
                 embeddings = self.get_embeddings(scene['id'])
                 print(f"\n     🔗 임베딩 정보 ({len(embeddings)}개):")
                 for emb in embeddings:
-                    embedding_data = emb.get('embedding', [])
-                    # embedding이 문자열인 경우 파싱
-                    if isinstance(embedding_data, str):
-                        try:
-                            import json
-                            embedding_vector = json.loads(embedding_data)
-                            vector_length = len(embedding_vector)
-                        except:
-                            embedding_vector = []
-                            vector_length = "파싱 실패"
-                    else:
-                        embedding_vector = embedding_data
-                        vector_length = len(embedding_vector) if isinstance(embedding_vector, list) else 0
+                    # embedding이 pgvector 문자열이어도 float32 배열로 한 번에 파싱
+                    try:
+                        embedding_vector = parse_embedding(emb.get('embedding', []))
+                        vector_length = int(embedding_vector.size)
+                    except (TypeError, ValueError):
+                        embedding_vector = []
+                        vector_length = "파싱 실패"
                     
                     print(f"       - 노드 ID: {emb.get('node_id', 'N/A')}, 타입: {emb.get('node_type', 'N/A')}, 벡터 차원: {vector_length}")
                     if isinstance(vector_length, int) and vector_length > 0:
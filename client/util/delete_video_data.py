@@ -6,15 +6,20 @@
 
 import requests
 import os
-import json
 from typing import Dict, List, Any, Optional
 
+try:
+    from .http_session import create_http_session
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from http_session import create_http_session
+
 class VideoDataDeleter:
     """비디오 데이터 삭제 클래스"""
     
-    def __init__(self, api_base_url: str = None):
+    def __init__(self, api_base_url: str = None, session: Optional[requests.Session] = None):
         self.api_base_url = api_base_url or os.getenv("API_URL", "http://localhost:8000")
-        self.session = requests.Session()
+        # 상위 클라이언트가 넘겨준 세션이 있으면 커넥션 풀을 공유
+        self.session = session or create_http_session()
     
     def health_check(self) -> bool:
         """API 서버 헬스 체크"""
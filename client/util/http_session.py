@@ -0,0 +1,42 @@
+"""
+HTTP 세션 생성 유틸리티
+API 서버 요청에 공통으로 사용하는 커넥션 풀/재시도/헤더 설정을 제공합니다.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_http_session(pool_maxsize: int = 64) -> requests.Session:
+    """
+    커넥션 풀/재시도/압축이 설정된 requests 세션 생성
+    
+    Args:
+        pool_maxsize: 동시 요청용 최대 연결 수
+        
+    Returns:
+        requests.Session: keep-alive로 연결을 재사용하는 세션
+    """
+    session = requests.Session()
+    # API 서버 하나만 사용하므로 호스트 풀은 1개, 동시 업로드용 연결은 최대 pool_maxsize개
+    # 업로드는 upsert라 재전송해도 안전하므로 POST도 일시적 5xx에 재시도
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        pool_block=False,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET", "POST"]
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
+    return session
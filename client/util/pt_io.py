@@ -0,0 +1,30 @@
+"""
+PT 파일 로드 유틸리티
+장면그래프 임베딩(.pt) 파일을 mmap/weights_only로 안전하고 가볍게 로드합니다.
+"""
+
+import pickle
+from typing import Any
+
+
+def load_pt_file(file_path, map_location: str = 'cpu') -> Any:
+    """
+    PT 파일 로드 (weights_only + mmap 우선)
+    
+    mmap은 텐서 저장소를 파일에 매핑해 전체 파일을 한 번에 메모리로 읽지 않으며,
+    weights_only는 텐서/기본 타입만 복원하므로 임의 코드 실행이 없습니다.
+    구버전 torch나 구 포맷(비 zip)·사용자 객체가 들어 있는 파일은 기존 방식으로 로드합니다.
+    
+    Args:
+        file_path: PT 파일 경로
+        map_location: 텐서를 올릴 디바이스
+        
+    Returns:
+        torch.load 결과
+    """
+    import torch
+    
+    try:
+        return torch.load(file_path, map_location=map_location, weights_only=True, mmap=True)
+    except (TypeError, RuntimeError, pickle.UnpicklingError):
+        return torch.load(file_path, map_location=map_location)
@@ -5,25 +5,58 @@ JSON 파일에서 장면 그래프 데이터를 읽어와서 API를 통해 저
 """
 
 import json
+import hashlib
+import functools
+import logging
 import os
 import re
 import sys
-import torch
 import numpy as np
 import requests
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 
+try:
+    from .http_session import create_http_session
+    from .pt_io import load_pt_file
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from http_session import create_http_session
+    from pt_io import load_pt_file
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
 # 환경 변수 로드
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+def _dumps(obj: Any) -> bytes:
+    """요청 본문 JSON 직렬화 (orjson이 있으면 사용, numpy 배열도 그대로 직렬화)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, default=lambda o: o.tolist()).encode('utf-8')
+
+# 장면그래프 파일명 패턴: "{drama}_{episode}_visual_{start}-{end}_..._meta_info[ (n)].json"
+_FILENAME_RE = re.compile(r'(.+)_(.+)_visual_(\d+)-(\d+)_.*_meta_info(?: \(\d+\))?\.json')
+
+@functools.lru_cache(maxsize=4096)
+def _video_unique_id(drama_name: str, episode_number: str) -> int:
+    """(드라마명, 에피소드) -> video_unique_id (같은 입력은 해시를 다시 계산하지 않음)"""
+    # SHA256 상위 32비트를 8자리 숫자로 제한 (hexdigest()[:8]을 16진수로 파싱한 값과 동일)
+    digest = hashlib.sha256(f"{drama_name}_{episode_number}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') % 100000000
+
 class SceneGraphAPIUploader:
     """장면 그래프 데이터 API 업로더 클래스"""
     
-    def __init__(self, api_base_url: str = None):
+    def __init__(self, api_base_url: str = None, session: Optional[requests.Session] = None):
         """초기화"""
         self.api_base_url = api_base_url or os.getenv("API_URL", "http://localhost:8000")
-        self.session = requests.Session()
+        # 상위 클라이언트가 넘겨준 세션이 있으면 커넥션 풀을 공유
+        self.session = session or create_http_session()
         print(f"🌐 API 서버 URL: {self.api_base_url}")
     
     def health_check(self) -> bool:
@@ -49,7 +82,7 @@ class SceneGraphAPIUploader:
         print(f"📁 파일명 파싱: {filename}")
         
         # 파일명에서 정보 추출 (괄호와 번호 포함 처리)
-        match = re.match(r'(.+)_(.+)_visual_(\d+)-(\d+)_.*_meta_info(?: \(\d+\))?\.json', filename)
+        match = _FILENAME_RE.match(filename)
         if not match:
             raise ValueError(f"파일명 형식이 올바르지 않습니다: {filename}")
         
@@ -127,13 +160,12 @@ class SceneGraphAPIUploader:
         pt_data = None
         if pt_file_path and os.path.exists(pt_file_path):
             try:
-                pt_data = torch.load(pt_file_path, map_location='cpu')
+                pt_data = load_pt_file(pt_file_path)
                 
-                # PyTorch 텐서를 JSON 직렬화 가능한 형태로 변환
-                if 'z' in pt_data and hasattr(pt_data['z'], 'tolist'):
-                    pt_data['z'] = pt_data['z'].tolist()
-                if 'node_type' in pt_data and hasattr(pt_data['node_type'], 'tolist'):
-                    pt_data['node_type'] = pt_data['node_type'].tolist()
+                # PyTorch 텐서는 numpy 배열로만 변환 (중첩 리스트 없이 _dumps가 바로 직렬화)
+                for key in ('z', 'node_type'):
+                    if key in pt_data and hasattr(pt_data[key], 'numpy'):
+                        pt_data[key] = np.ascontiguousarray(pt_data[key].detach().numpy())
                 
                 print(f"✅ 임베딩 데이터 로드 완료: {len(pt_data.get('z', []))}개 벡터")
             except Exception as e:
@@ -159,7 +191,7 @@ class SceneGraphAPIUploader:
             }
             
             # API 호출
-            response = self.session.post(f"{self.api_base_url}/scenes", json=scene_request)
+            response = self.session.post(f"{self.api_base_url}/scenes", data=_dumps(scene_request))
             response.raise_for_status()
             
             result = response.json()
@@ -213,6 +245,7 @@ class SceneGraphAPIUploader:
         
         # 객체 ID 매핑 저장 (원본 ID -> 새로운 ID)
         object_id_mapping = {}
+        payloads, labels = [], []
         
         for obj in objects:
             try:
@@ -243,17 +276,13 @@ class SceneGraphAPIUploader:
                     "attributes": obj.get('attributes', {})
                 }
                 
-                response = self.session.post(f"{self.api_base_url}/objects", json=object_data)
-                response.raise_for_status()
-                
-                result = response.json()
-                print(f"  ✅ 객체 저장: {obj.get('label')} (ID: {new_object_id})")
+                payloads.append(object_data)
+                labels.append(obj.get('label'))
                 
-            except requests.exceptions.RequestException as e:
-                print(f"  ❌ 객체 저장 API 오류: {obj.get('label')} - {e}")
             except Exception as e:
                 print(f"  ❌ 객체 저장 오류: {obj.get('label')} - {e}")
         
+        self._post_nodes("/objects", scene_id, payloads, labels, "object_id", "객체")
         return object_id_mapping
     
     def _create_events_via_api(self, scene_id: int, events: List[Dict[str, Any]], video_unique_id: int, object_id_mapping: Dict[str, str]):
@@ -262,6 +291,7 @@ class SceneGraphAPIUploader:
         
         # 이벤트 ID 매핑 저장 (원본 ID -> 새로운 ID)
         event_id_mapping = {}
+        payloads, labels = [], []
         
         for i, event in enumerate(events):
             try:
@@ -294,23 +324,20 @@ class SceneGraphAPIUploader:
                     "attributes": {"attribute": event.get('attribute', '')}
                 }
                 
-                response = self.session.post(f"{self.api_base_url}/events", json=event_data)
-                response.raise_for_status()
-                
-                result = response.json()
-                print(f"  ✅ 이벤트 저장: {event.get('verb')} (ID: {new_event_id})")
+                payloads.append(event_data)
+                labels.append(event.get('verb'))
                 
-            except requests.exceptions.RequestException as e:
-                print(f"  ❌ 이벤트 저장 API 오류: {event.get('verb')} - {e}")
             except Exception as e:
                 print(f"  ❌ 이벤트 저장 오류: {event.get('verb')} - {e}")
         
+        self._post_nodes("/events", scene_id, payloads, labels, "event_id", "이벤트")
         return event_id_mapping
     
     def _create_spatial_via_api(self, scene_id: int, spatial: List[Dict[str, Any]], video_unique_id: int, object_id_mapping: Dict[str, str]):
         """API를 통해 공간 관계 저장"""
         print(f"📍 API를 통한 공간 관계 저장: {len(spatial)}개")
         
+        payloads, labels = [], []
         for i, rel in enumerate(spatial):
             try:
                 # 새로운 유니크한 spatial_id 생성
@@ -340,21 +367,19 @@ class SceneGraphAPIUploader:
                     "object_id": object_id
                 }
                 
-                response = self.session.post(f"{self.api_base_url}/spatial", json=spatial_data)
-                response.raise_for_status()
-                
-                result = response.json()
-                print(f"  ✅ 공간 관계 저장: {rel.get('predicate')} (ID: {new_spatial_id})")
+                payloads.append(spatial_data)
+                labels.append(rel.get('predicate'))
                 
-            except requests.exceptions.RequestException as e:
-                print(f"  ❌ 공간 관계 저장 API 오류: {rel.get('predicate')} - {e}")
             except Exception as e:
                 print(f"  ❌ 공간 관계 저장 오류: {rel.get('predicate')} - {e}")
+        
+        self._post_nodes("/spatial", scene_id, payloads, labels, "spatial_id", "공간 관계")
     
     def _create_temporal_via_api(self, scene_id: int, temporal: List[Dict[str, Any]], video_unique_id: int, event_id_mapping: Dict[str, str]):
         """API를 통해 시간 관계 저장"""
         print(f"⏰ API를 통한 시간 관계 저장: {len(temporal)}개")
         
+        payloads, labels = [], []
         for i, rel in enumerate(temporal):
             try:
                 # 새로운 유니크한 temporal_id 생성
@@ -384,28 +409,71 @@ class SceneGraphAPIUploader:
                     "object_id": object_id
                 }
                 
-                response = self.session.post(f"{self.api_base_url}/temporal", json=temporal_data)
-                response.raise_for_status()
-                
-                result = response.json()
-                print(f"  ✅ 시간 관계 저장: {rel.get('predicate')} (ID: {new_temporal_id})")
+                payloads.append(temporal_data)
+                labels.append(rel.get('predicate'))
                 
-            except requests.exceptions.RequestException as e:
-                print(f"  ❌ 시간 관계 저장 API 오류: {rel.get('predicate')} - {e}")
             except Exception as e:
                 print(f"  ❌ 시간 관계 저장 오류: {rel.get('predicate')} - {e}")
+        
+        self._post_nodes("/temporal", scene_id, payloads, labels, "temporal_id", "시간 관계")
     
-    def _generate_video_id(self, drama_name: str, episode_number: str) -> int:
-        """비디오 고유 ID 생성 (간단한 방식)"""
-        import hashlib
+    def _post_nodes(self, endpoint: str, scene_id: int, payloads: List[Dict[str, Any]],
+                    labels: List[str], id_field: str, kind: str) -> None:
+        """
+        노드 목록을 {endpoint}/bulk 한 번의 요청으로 저장
         
-        # SHA256 해시 사용 (충돌 확률 매우 낮음)
-        combined = f"{drama_name}_{episode_number}".encode('utf-8')
-        hash_value = hashlib.sha256(combined).hexdigest()
+        bulk 엔드포인트가 없는 서버(404)에서는 기존처럼 항목별 POST로 저장합니다.
+        """
+        if not payloads:
+            return
         
-        # 8자리 숫자로 제한
-        video_id = int(hash_value[:8], 16) % 100000000
+        if not getattr(self, "_bulk_unsupported", False):
+            try:
+                response = self.session.post(
+                    f"{self.api_base_url}{endpoint}/bulk",
+                    json={"scene_id": scene_id, "items": payloads},
+                    timeout=30
+                )
+                if response.status_code == 404:
+                    self._bulk_unsupported = True
+                    response.close()
+                else:
+                    response.raise_for_status()
+                    ok = 0
+                    for label, result in zip(labels, response.json()):
+                        if result.get('success'):
+                            ok += 1
+                            logger.debug("  ✅ %s 저장: %s (ID: %s)", kind, label, result.get(id_field))
+                        else:
+                            print(f"  ❌ {kind} 저장 오류: {label} - {result.get('error')}")
+                    print(f"  ✅ {kind} 저장: {ok}/{len(payloads)} (실패 {len(payloads) - ok})")
+                    return
+            except requests.exceptions.RequestException as e:
+                print(f"  ❌ {kind} 일괄 저장 API 오류 ({len(payloads)}개): {e}")
+                return
         
+        url = f"{self.api_base_url}{endpoint}"
+        ok = 0
+        for label, payload in zip(labels, payloads):
+            try:
+                self._post_noreturn(url, payload)
+                ok += 1
+                logger.debug("  ✅ %s 저장: %s (ID: %s)", kind, label, payload[id_field])
+            except requests.exceptions.RequestException as e:
+                print(f"  ❌ {kind} 저장 API 오류: {label} - {e}")
+        print(f"  ✅ {kind} 저장: {ok}/{len(payloads)} (실패 {len(payloads) - ok})")
+    
+    def _post_noreturn(self, url: str, body: Dict[str, Any]) -> None:
+        """응답 본문이 필요 없는 POST (상태 코드만 확인하고 JSON은 파싱하지 않음, 응답은 바로 닫음)"""
+        with self.session.post(url, data=_dumps(body)) as response:
+            if response.status_code >= 400:
+                raise requests.exceptions.HTTPError(
+                    f"{response.status_code} Error: {response.text}", response=response
+                )
+    
+    def _generate_video_id(self, drama_name: str, episode_number: str) -> int:
+        """비디오 고유 ID 생성 (SHA256 기반, 결과는 모듈 수준에서 캐시)"""
+        video_id = _video_unique_id(drama_name, episode_number)
         print(f"🔑 생성된 video_unique_id: {video_id}")
         return video_id
     
@@ -0,0 +1,36 @@
+"""add_embedding_hnsw_indexes
+
+Revision ID: b7d41e2a6c10
+Revises: 9151d2c9d3bc
+Create Date: 2026-10-17 10:12:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d41e2a6c10'
+down_revision = '9151d2c9d3bc'
+branch_labels = None
+depends_on = None
+
+# 벡터 검색 대상 노드 타입 (검색 쿼리가 항상 node_type으로 한정되므로 타입별 부분 인덱스 생성)
+NODE_TYPES = ('object', 'event', 'spatial')
+
+
+def upgrade() -> None:
+    for node_type in NODE_TYPES:
+        op.create_index(
+            f'idx_embeddings_hnsw_{node_type}', 'embeddings', ['embedding'],
+            unique=False,
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_where=sa.text(f"node_type = '{node_type}'"),
+        )
+
+
+def downgrade() -> None:
+    for node_type in NODE_TYPES:
+        op.drop_index(f'idx_embeddings_hnsw_{node_type}', table_name='embeddings')
@@ -6,17 +6,22 @@ FastAPI를 사용한 REST API 서버
 
 import os
 import sys
-from fastapi import FastAPI, HTTPException, Depends
+import json
+import base64
+import numpy as np
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.database_manager import SceneGraphDatabaseManager
 from models.api_schemas import (
-    VideoCreate, SceneCreate, SearchQuery, VectorSearchQuery,
+    VideoCreate, SceneCreate, SearchQuery, VectorSearchQuery, BulkSceneDataQuery,
     VideoResponse, SceneResponse, SearchResult
 )
 
@@ -55,6 +60,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 1KB 이상 응답은 gzip으로 압축 (장면 그래프/검색 결과 JSON 전송량 감소)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 def get_db_manager() -> SceneGraphDatabaseManager:
     """데이터베이스 매니저 의존성 주입"""
     if db_manager is None:
@@ -242,6 +250,22 @@ async def get_video_summary(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"비디오 요약 조회 실패: {str(e)}")
 
+@app.get("/summary", response_model=Dict[str, Any])
+async def get_data_summary(db: SceneGraphDatabaseManager = Depends(get_db_manager)):
+    """전체 데이터 요약 조회 (비디오별 장면/객체/이벤트/임베딩 수 포함)"""
+    try:
+        return db.get_data_summary()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 요약 조회 실패: {str(e)}")
+
+@app.get("/vocabulary", response_model=Dict[str, List[str]])
+async def get_vocabulary(db: SceneGraphDatabaseManager = Depends(get_db_manager)):
+    """저장된 객체 타입("super_type:type_of")과 이벤트 동사의 고유 목록 조회"""
+    try:
+        return db.get_vocabulary()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"어휘 목록 조회 실패: {str(e)}")
+
 @app.delete("/videos/{video_unique_id}")
 async def delete_video(
     video_unique_id: int,
@@ -336,6 +360,155 @@ async def create_scene(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"장면 생성 실패: {str(e)}")
 
+@app.post("/scenes/full", response_model=Dict[str, Any])
+async def create_full_scene(
+    full_data: Dict[str, Any],
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """
+    비디오/장면/노드/임베딩을 한 번의 요청·트랜잭션으로 저장
+    
+    본문: {"video", "scene", "objects", "events", "spatial", "temporal", "embeddings"}
+    임베딩은 "embeddings" 목록 대신 base64 float32 행렬로 보낼 수 있습니다:
+    {"embedding_ids", "embedding_types", "embedding_dim", "embeddings_b64"}
+    ID 값의 "$SCENE_PREFIX_" 접두사는 서버에서 "{video_unique_id}_{scene_id}_"로 치환됩니다.
+    """
+    try:
+        embeddings = list(full_data.get('embeddings', []))
+        if full_data.get('embeddings_b64'):
+            node_ids, node_types = full_data['embedding_ids'], full_data['embedding_types']
+            vectors = np.frombuffer(base64.b64decode(full_data['embeddings_b64']), dtype='<f4')
+            dim = full_data['embedding_dim']
+            if len(node_ids) != len(node_types) or vectors.size != len(node_ids) * dim:
+                raise ValueError(f"임베딩 ID({len(node_ids)}개 x {dim}차원)와 벡터 크기({vectors.size})가 일치하지 않습니다")
+            embeddings.extend(
+                {"node_id": node_id, "node_type": node_type, "embedding": vector}
+                for node_id, node_type, vector in zip(node_ids, node_types, vectors.reshape(len(node_ids), dim))
+            )
+    except (ValueError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 임베딩 형식: {str(e)}")
+    
+    try:
+        result = db.insert_full_scene(
+            full_data['video'],
+            full_data.get('scene', {}),
+            {key: full_data.get(key, []) for key in ('objects', 'events', 'spatial', 'temporal')},
+            embeddings
+        )
+        return {"success": True, **result, "message": "장면 전체 업로드 완료"}
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"필수 필드 누락: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"장면 전체 업로드 실패: {str(e)}")
+
+# 장면 그래프 조회 쿼리 (전체 조회와 스트리밍 조회에서 공통 사용)
+_SCENE_INFO_QUERY = """
+    SELECT s.id, s.scene_number, s.scene_place, s.scene_time, 
+           s.scene_atmosphere, s.start_frame, s.end_frame, s.created_at,
+           v.drama_name, v.episode_number, v.video_unique_id
+    FROM scenes s 
+    JOIN video v ON s.video_id = v.id
+    WHERE s.id = :scene_id
+"""
+
+# (응답 키, SQL, row -> dict 변환 함수)
+_SCENE_SECTIONS = [
+    ("objects", """
+        SELECT o.id, o.object_id, o.super_type, o.type_of, 
+               o.label, o.attributes, o.created_at
+        FROM objects o 
+        WHERE o.scene_id = :scene_id 
+        ORDER BY o.object_id
+    """, lambda row: {
+        "id": row.id,
+        "object_id": row.object_id,
+        "super_type": row.super_type,
+        "type_of": row.type_of,
+        "label": row.label,
+        "attributes": row.attributes,
+        "created_at": str(row.created_at)
+    }),
+    ("events", """
+        SELECT e.id, e.event_id, e.subject_id, e.verb, 
+               e.object_id, e.attributes, e.created_at
+        FROM events e 
+        WHERE e.scene_id = :scene_id 
+        ORDER BY e.event_id
+    """, lambda row: {
+        "id": row.id,
+        "event_id": row.event_id,
+        "subject_id": row.subject_id,
+        "verb": row.verb,
+        "object_id": row.object_id,
+        "attributes": row.attributes,
+        "created_at": str(row.created_at)
+    }),
+    ("spatial", """
+        SELECT s.id, s.spatial_id, s.subject_id, s.predicate, 
+               s.object_id, s.created_at
+        FROM spatial s 
+        WHERE s.scene_id = :scene_id 
+        ORDER BY s.spatial_id
+    """, lambda row: {
+        "id": row.id,
+        "spatial_id": row.spatial_id,
+        "subject_id": row.subject_id,
+        "predicate": row.predicate,
+        "object_id": row.object_id,
+        "created_at": str(row.created_at)
+    }),
+    ("temporal", """
+        SELECT t.id, t.temporal_id, t.subject_id, t.predicate, 
+               t.object_id, t.created_at
+        FROM temporal t 
+        WHERE t.scene_id = :scene_id 
+        ORDER BY t.temporal_id
+    """, lambda row: {
+        "id": row.id,
+        "temporal_id": row.temporal_id,
+        "subject_id": row.subject_id,
+        "predicate": row.predicate,
+        "object_id": row.object_id,
+        "created_at": str(row.created_at)
+    }),
+    ("embeddings", """
+        SELECT e.node_id, e.node_type, e.embedding, e.created_at
+        FROM embeddings e 
+        WHERE e.node_id IN (
+            SELECT DISTINCT o.object_id FROM objects o WHERE o.scene_id = :scene_id
+            UNION
+            SELECT DISTINCT e2.event_id FROM events e2 WHERE e2.scene_id = :scene_id
+            UNION
+            SELECT DISTINCT s.spatial_id FROM spatial s WHERE s.scene_id = :scene_id
+            UNION
+            SELECT DISTINCT t.temporal_id FROM temporal t WHERE t.scene_id = :scene_id
+        )
+        ORDER BY e.node_type, e.node_id
+    """, lambda row: {
+        "node_id": row.node_id,
+        "node_type": row.node_type,
+        "embedding": row.embedding,
+        "vector_length": len(row.embedding) if row.embedding else 0,
+        "created_at": str(row.created_at)
+    }),
+]
+
+def _scene_info_to_dict(scene_row) -> Dict[str, Any]:
+    """장면 기본 정보 row를 dict로 변환"""
+    return {
+        "id": scene_row.id,
+        "scene_number": scene_row.scene_number,
+        "scene_place": scene_row.scene_place,
+        "scene_time": scene_row.scene_time,
+        "scene_atmosphere": scene_row.scene_atmosphere,
+        "start_frame": scene_row.start_frame,
+        "end_frame": scene_row.end_frame,
+        "created_at": str(scene_row.created_at),
+        "drama_name": scene_row.drama_name,
+        "episode_number": scene_row.episode_number,
+        "video_unique_id": scene_row.video_unique_id
+    }
+
 @app.get("/scenes/{scene_id}", response_model=Dict[str, Any])
 async def get_scene_graph(
     scene_id: int,
@@ -349,156 +522,21 @@ async def get_scene_graph(
             from sqlalchemy import text
             
             # 1. 장면 기본 정보
-            scene_result = session.execute(text("""
-                SELECT s.id, s.scene_number, s.scene_place, s.scene_time, 
-                       s.scene_atmosphere, s.start_frame, s.end_frame, s.created_at,
-                       v.drama_name, v.episode_number, v.video_unique_id
-                FROM scenes s 
-                JOIN video v ON s.video_id = v.id
-                WHERE s.id = :scene_id
-            """), {"scene_id": scene_id})
-            
-            scene_row = scene_result.fetchone()
+            scene_row = session.execute(text(_SCENE_INFO_QUERY), {"scene_id": scene_id}).fetchone()
             if not scene_row:
                 raise HTTPException(status_code=404, detail="장면을 찾을 수 없습니다")
             
-            # 2. 객체 노드들
-            objects_result = session.execute(text("""
-                SELECT o.id, o.object_id, o.super_type, o.type_of, 
-                       o.label, o.attributes, o.created_at
-                FROM objects o 
-                WHERE o.scene_id = :scene_id 
-                ORDER BY o.object_id
-            """), {"scene_id": scene_id})
-            
-            objects = []
-            for row in objects_result:
-                objects.append({
-                    "id": row.id,
-                    "object_id": row.object_id,
-                    "super_type": row.super_type,
-                    "type_of": row.type_of,
-                    "label": row.label,
-                    "attributes": row.attributes,
-                    "created_at": str(row.created_at)
-                })
-            
-            # 3. 이벤트 노드들
-            events_result = session.execute(text("""
-                SELECT e.id, e.event_id, e.subject_id, e.verb, 
-                       e.object_id, e.attributes, e.created_at
-                FROM events e 
-                WHERE e.scene_id = :scene_id 
-                ORDER BY e.event_id
-            """), {"scene_id": scene_id})
-            
-            events = []
-            for row in events_result:
-                events.append({
-                    "id": row.id,
-                    "event_id": row.event_id,
-                    "subject_id": row.subject_id,
-                    "verb": row.verb,
-                    "object_id": row.object_id,
-                    "attributes": row.attributes,
-                    "created_at": str(row.created_at)
-                })
-            
-            # 4. 공간관계들
-            spatial_result = session.execute(text("""
-                SELECT s.id, s.spatial_id, s.subject_id, s.predicate, 
-                       s.object_id, s.created_at
-                FROM spatial s 
-                WHERE s.scene_id = :scene_id 
-                ORDER BY s.spatial_id
-            """), {"scene_id": scene_id})
-            
-            spatial = []
-            for row in spatial_result:
-                spatial.append({
-                    "id": row.id,
-                    "spatial_id": row.spatial_id,
-                    "subject_id": row.subject_id,
-                    "predicate": row.predicate,
-                    "object_id": row.object_id,
-                    "created_at": str(row.created_at)
-                })
-            
-            # 5. 시간관계들
-            temporal_result = session.execute(text("""
-                SELECT t.id, t.temporal_id, t.subject_id, t.predicate, 
-                       t.object_id, t.created_at
-                FROM temporal t 
-                WHERE t.scene_id = :scene_id 
-                ORDER BY t.temporal_id
-            """), {"scene_id": scene_id})
-            
-            temporal = []
-            for row in temporal_result:
-                temporal.append({
-                    "id": row.id,
-                    "temporal_id": row.temporal_id,
-                    "subject_id": row.subject_id,
-                    "predicate": row.predicate,
-                    "object_id": row.object_id,
-                    "created_at": str(row.created_at)
-                })
-            
-            # 6. 임베딩 정보들
-            embeddings_result = session.execute(text("""
-                SELECT e.node_id, e.node_type, e.embedding, e.created_at
-                FROM embeddings e 
-                WHERE e.node_id IN (
-                    SELECT DISTINCT o.object_id FROM objects o WHERE o.scene_id = :scene_id
-                    UNION
-                    SELECT DISTINCT e2.event_id FROM events e2 WHERE e2.scene_id = :scene_id
-                    UNION
-                    SELECT DISTINCT s.spatial_id FROM spatial s WHERE s.scene_id = :scene_id
-                    UNION
-                    SELECT DISTINCT t.temporal_id FROM temporal t WHERE t.scene_id = :scene_id
-                )
-                ORDER BY e.node_type, e.node_id
-            """), {"scene_id": scene_id})
-            
-            embeddings = []
-            for row in embeddings_result:
-                embedding_vector = row.embedding
-                vector_length = len(embedding_vector) if embedding_vector else 0
-                embeddings.append({
-                    "node_id": row.node_id,
-                    "node_type": row.node_type,
-                    "embedding": embedding_vector,
-                    "vector_length": vector_length,
-                    "created_at": str(row.created_at)
-                })
+            # 2. 객체/이벤트/공간관계/시간관계/임베딩
+            sections = {}
+            for key, query, to_dict in _SCENE_SECTIONS:
+                result = session.execute(text(query), {"scene_id": scene_id})
+                sections[key] = [to_dict(row) for row in result]
             
             # 완전한 장면 그래프 정보 반환
             return {
-                "scene": {
-                    "id": scene_row.id,
-                    "scene_number": scene_row.scene_number,
-                    "scene_place": scene_row.scene_place,
-                    "scene_time": scene_row.scene_time,
-                    "scene_atmosphere": scene_row.scene_atmosphere,
-                    "start_frame": scene_row.start_frame,
-                    "end_frame": scene_row.end_frame,
-                    "created_at": str(scene_row.created_at),
-                    "drama_name": scene_row.drama_name,
-                    "episode_number": scene_row.episode_number,
-                    "video_unique_id": scene_row.video_unique_id
-                },
-                "objects": objects,
-                "events": events,
-                "spatial": spatial,
-                "temporal": temporal,
-                "embeddings": embeddings,
-                "summary": {
-                    "total_objects": len(objects),
-                    "total_events": len(events),
-                    "total_spatial": len(spatial),
-                    "total_temporal": len(temporal),
-                    "total_embeddings": len(embeddings)
-                }
+                "scene": _scene_info_to_dict(scene_row),
+                **sections,
+                "summary": {f"total_{key}": len(items) for key, items in sections.items()}
             }
         finally:
             session.close()
@@ -507,6 +545,45 @@ async def get_scene_graph(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"장면 그래프 조회 실패: {str(e)}")
 
+@app.get("/scenes/{scene_id}/stream")
+async def stream_scene_graph(
+    scene_id: int,
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """장면 그래프를 JSON으로 스트리밍 (전체 응답을 메모리에 만들지 않고 row 단위로 전송)"""
+    from sqlalchemy import text
+    
+    session = db.get_session()
+    try:
+        scene_row = session.execute(text(_SCENE_INFO_QUERY), {"scene_id": scene_id}).fetchone()
+    except Exception as e:
+        session.close()
+        raise HTTPException(status_code=500, detail=f"장면 그래프 조회 실패: {str(e)}")
+    if not scene_row:
+        session.close()
+        raise HTTPException(status_code=404, detail="장면을 찾을 수 없습니다")
+    
+    def generate():
+        try:
+            yield '{"scene": ' + json.dumps(_scene_info_to_dict(scene_row), ensure_ascii=False)
+            counts = {}
+            for key, query, to_dict in _SCENE_SECTIONS:
+                yield f', "{key}": ['
+                result = session.execute(
+                    text(query).execution_options(stream_results=True), {"scene_id": scene_id}
+                )
+                count = 0
+                for row in result:
+                    yield ("," if count else "") + json.dumps(to_dict(row), ensure_ascii=False, default=str)
+                    count += 1
+                counts[f"total_{key}"] = count
+                yield "]"
+            yield ', "summary": ' + json.dumps(counts) + "}"
+        finally:
+            session.close()
+    
+    return StreamingResponse(generate(), media_type="application/json")
+
 @app.get("/videos/{video_id}/scenes", response_model=List[Dict[str, Any]])
 async def get_video_scenes(
     video_id: int,
@@ -740,6 +817,17 @@ async def get_scene_embeddings(
 
 # === 검색 관련 엔드포인트 ===
 
+@app.post("/search/bulk_scene_data", response_model=Dict[int, Dict[str, Any]])
+async def get_bulk_scene_data(
+    query: BulkSceneDataQuery,
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """여러 장면의 객체/이벤트/공간/시간관계/임베딩을 장면 ID별로 한 번에 조회"""
+    try:
+        return db.get_bulk_scene_data(query.scene_ids, query.include_embeddings)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"장면 데이터 일괄 조회 실패: {str(e)}")
+
 @app.post("/search/vector", response_model=List[Dict[str, Any]])
 async def vector_search(
     search_query: VectorSearchQuery,
@@ -759,6 +847,34 @@ async def vector_search(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"벡터 검색 실패: {str(e)}")
 
+@app.post("/search/vector/binary", response_model=List[Dict[str, Any]])
+async def vector_search_binary(
+    request: Request,
+    node_type: str,
+    top_k: int = 5,
+    tau: float = 0.0,
+    scene_id: Optional[int] = None,
+    specific_node_id: Optional[str] = None,
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """벡터 기반 유사도 검색 (본문: little-endian float32 원시 바이트)"""
+    body = await request.body()
+    if not body or len(body) % 4 != 0:
+        raise HTTPException(status_code=400, detail="쿼리 임베딩은 float32 바이트 배열이어야 합니다")
+    try:
+        query_embedding = np.frombuffer(body, dtype='<f4').tolist()
+        results = db.search_similar_nodes(
+            query_embedding,
+            node_type,
+            top_k,
+            scene_id,
+            tau,
+            specific_node_id
+        )
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"벡터 검색 실패: {str(e)}")
+
 @app.post("/search/hybrid", response_model=List[Dict[str, Any]])
 async def hybrid_search(
     search_query: SearchQuery,
@@ -870,6 +986,50 @@ async def create_temporal(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"시간 관계 생성 실패: {str(e)}")
 
+@app.post("/objects/bulk", response_model=List[Dict[str, Any]])
+async def create_objects_bulk(
+    bulk_data: Dict[str, Any],
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """객체 노드 일괄 생성 ({"scene_id": ..., "items": [...]}, 항목별 결과 반환)"""
+    try:
+        return db.insert_objects_bulk(bulk_data['scene_id'], bulk_data.get('items', []))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"객체 일괄 생성 실패: {str(e)}")
+
+@app.post("/events/bulk", response_model=List[Dict[str, Any]])
+async def create_events_bulk(
+    bulk_data: Dict[str, Any],
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """이벤트 노드 일괄 생성 ({"scene_id": ..., "items": [...]}, 항목별 결과 반환)"""
+    try:
+        return db.insert_events_bulk(bulk_data['scene_id'], bulk_data.get('items', []))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"이벤트 일괄 생성 실패: {str(e)}")
+
+@app.post("/spatial/bulk", response_model=List[Dict[str, Any]])
+async def create_spatial_bulk(
+    bulk_data: Dict[str, Any],
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """공간 관계 일괄 생성 ({"scene_id": ..., "items": [...]}, 항목별 결과 반환)"""
+    try:
+        return db.insert_spatial_bulk(bulk_data['scene_id'], bulk_data.get('items', []))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"공간 관계 일괄 생성 실패: {str(e)}")
+
+@app.post("/temporal/bulk", response_model=List[Dict[str, Any]])
+async def create_temporal_bulk(
+    bulk_data: Dict[str, Any],
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """시간 관계 일괄 생성 ({"scene_id": ..., "items": [...]}, 항목별 결과 반환)"""
+    try:
+        return db.insert_temporal_bulk(bulk_data['scene_id'], bulk_data.get('items', []))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"시간 관계 일괄 생성 실패: {str(e)}")
+
 @app.post("/embeddings", response_model=Dict[str, Any])
 async def create_embedding(
     embedding_data: Dict[str, Any],
@@ -925,6 +1085,48 @@ async def create_embedding(
         print(f"❌ 임베딩 저장 실패: {embedding_data.get('node_id', 'unknown')} - {str(e)}")
         raise HTTPException(status_code=500, detail=f"임베딩 생성 실패: {str(e)}")
 
+@app.post("/embeddings/bulk", response_model=List[Dict[str, Any]])
+async def create_embeddings_bulk(
+    bulk_data: Dict[str, Any],
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """임베딩 데이터 일괄 생성 ({"items": [{"node_id", "node_type", "embedding"}, ...]}, 항목별 결과 반환)"""
+    try:
+        return db.insert_embeddings_bulk(bulk_data.get('items', []))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"임베딩 일괄 생성 실패: {str(e)}")
+
+@app.post("/embeddings/bulk/binary", response_model=List[Dict[str, Any]])
+async def create_embeddings_bulk_binary(
+    request: Request,
+    db: SceneGraphDatabaseManager = Depends(get_db_manager)
+):
+    """
+    임베딩 데이터 일괄 생성 (바이너리 본문, 항목별 결과 반환)
+    
+    본문: [헤더 길이 4바이트 little-endian][JSON 헤더 {node_ids, node_types, dim}][float32 행렬]
+    """
+    body = await request.body()
+    try:
+        header_len = int.from_bytes(body[:4], 'little')
+        header = json.loads(body[4:4 + header_len])
+        node_ids, node_types, dim = header['node_ids'], header['node_types'], header['dim']
+        vectors = np.frombuffer(body, dtype='<f4', offset=4 + header_len)
+        if len(node_ids) != len(node_types) or vectors.size != len(node_ids) * dim:
+            raise ValueError(f"헤더({len(node_ids)}개 x {dim}차원)와 벡터 크기({vectors.size})가 일치하지 않습니다")
+        vectors = vectors.reshape(len(node_ids), dim)
+    except (ValueError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 임베딩 바이너리 형식: {str(e)}")
+    
+    try:
+        items = [
+            {"node_id": node_id, "node_type": node_type, "embedding": vector}
+            for node_id, node_type, vector in zip(node_ids, node_types, vectors)
+        ]
+        return db.insert_embeddings_bulk(items)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"임베딩 일괄 생성 실패: {str(e)}")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
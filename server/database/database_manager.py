@@ -4,6 +4,8 @@ SQLAlchemy 기반 데이터베이스 관리 클래스
 """
 
 import os
+import io
+import csv
 import json
 import torch
 import numpy as np
@@ -12,6 +14,7 @@ from typing import List, Dict, Any, Tuple, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from dotenv import load_dotenv
 
 from models.orm_models import (
@@ -21,6 +24,23 @@ from models.orm_models import (
 
 load_dotenv()
 
+# PT node_type 값 -> 노드 타입 (0=scene 등 나머지는 임베딩 저장 제외)
+_NODE_TYPE_BY_INDEX = {1: 'object', 2: 'event', 3: 'spatial'}
+
+# node_type 정보가 없을 때 orig_id // 1000 -> 노드 타입 (1xxx=object, 2xxx=temporal, 3xxx=event, 11xxx=spatial)
+_ORIG_ID_TYPE_TABLE = {1: 'object', 2: 'temporal', 3: 'event', 11: 'spatial'}
+
+# 장면 일괄 조회 대상: 응답 키 -> (모델, 노드 ID 컬럼, 반환 필드)
+_BULK_NODE_TABLES = {
+    'objects': (Object, 'object_id', ('id', 'object_id', 'super_type', 'type_of', 'label', 'attributes', 'created_at')),
+    'events': (Event, 'event_id', ('id', 'event_id', 'subject_id', 'verb', 'object_id', 'attributes', 'created_at')),
+    'spatial': (Spatial, 'spatial_id', ('id', 'spatial_id', 'subject_id', 'predicate', 'object_id', 'created_at')),
+    'temporal': (Temporal, 'temporal_id', ('id', 'temporal_id', 'subject_id', 'predicate', 'object_id', 'created_at')),
+}
+
+# HNSW 검색 후보 수 하한 (pgvector 기본값). 인덱스 스캔은 ef_search개까지만 반환하므로 top_k 이상으로 올림
+HNSW_EF_SEARCH_MIN = 40
+
 class SceneGraphDatabaseManager:
     """
     SQLAlchemy ORM을 이용한 장면 그래프 데이터베이스 관리 클래스
@@ -169,33 +189,14 @@ class SceneGraphDatabaseManager:
                     if orig_id == 0:
                         continue
                     
-                    # 노드 타입 결정 (node_type 정보 활용)
+                    # 노드 타입 결정 (node_type 정보 활용, 없으면 orig_id 범위로 추정)
+                    # 특별한 노드(node_type=0)와 알 수 없는 타입은 건너뛰기
                     if 'node_type' in pt_data and i < len(pt_data['node_type']):
-                        node_type_idx = pt_data['node_type'][i]
-                        if node_type_idx == 0:
-                            # 특별한 노드 (ID=0)는 건너뛰기
-                            continue
-                        elif node_type_idx == 1:
-                            node_type = 'object'
-                        elif node_type_idx == 2:
-                            node_type = 'event'
-                        elif node_type_idx == 3:
-                            node_type = 'spatial'
-                        else:
-                            # 알 수 없는 노드 타입은 건너뛰기
-                            continue
+                        node_type = _NODE_TYPE_BY_INDEX.get(int(pt_data['node_type'][i]))
                     else:
-                        # node_type 정보가 없으면 orig_id로 추정 (fallback)
-                        if 1000 <= orig_id < 2000:
-                            node_type = 'object'
-                        elif 2000 <= orig_id < 3000:
-                            node_type = 'temporal'
-                        elif 3000 <= orig_id < 4000:
-                            node_type = 'event'
-                        elif 11000 <= orig_id < 12000:
-                            node_type = 'spatial'
-                        else:
-                            continue
+                        node_type = _ORIG_ID_TYPE_TABLE.get(int(orig_id) // 1000)
+                    if node_type is None:
+                        continue
                     
                     # 실제 node_id 찾기: {video_unique_id}_{scene_id}_{node_type}_{orig_id}
                     actual_node_id = f"{video_unique_id}_{scene_db_id}_{node_type}_{orig_id}"
@@ -267,6 +268,21 @@ class SceneGraphDatabaseManager:
         finally:
             session.close()
     
+    def _vector_order_by(self, session: Session, column: str, vector_str: str, top_k: int,
+                         scene_id: int = None, specific_node_id: str = None) -> str:
+        """
+        벡터 검색의 ORDER BY 절 생성
+        
+        전체 검색은 거리 연산자(<=>) 정렬로 HNSW 인덱스를 타도록 하고 ef_search를 top_k 이상으로 설정.
+        장면/노드로 한정된 검색은 후보가 적고, 인덱스 스캔 후 필터링하면 결과가 누락될 수 있으므로
+        인덱스를 쓰지 않는 유사도 정렬로 정확하게 계산.
+        """
+        if scene_id is not None or specific_node_id is not None:
+            return "similarity DESC"
+        ef_search = max(HNSW_EF_SEARCH_MIN, int(top_k))
+        session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+        return f"{column} <=> '{vector_str}'::vector"
+    
     def search_similar_nodes(self, query_embedding: Optional[List[float]] = None, node_type: str = None, top_k: int = 5, scene_id: int = None, tau: float = 0.0, specific_node_id: str = None) -> List[Dict]:
         """
         특정 타입의 노드 중에서 유사한 노드를 벡터 검색으로 찾기
@@ -314,6 +330,7 @@ class SceneGraphDatabaseManager:
                     scene_filter = "AND s.id = :scene_id" if scene_id is not None else ""
                     # specific_node_id 필터 조건 추가
                     node_filter = "AND o.object_id = :specific_node_id" if specific_node_id is not None else ""
+                    order_by = self._vector_order_by(session, "e.embedding", vector_str, top_k, scene_id, specific_node_id)
                     
                     results = session.execute(text(f"""
                         SELECT o.id, o.object_id, o.super_type, o.type_of, o.label, o.attributes,
@@ -325,7 +342,7 @@ class SceneGraphDatabaseManager:
                         JOIN embeddings e ON o.object_id = e.node_id AND e.node_type = 'object'
                         WHERE 1=1 {scene_filter} {node_filter}
                         AND 1 - (e.embedding <=> '{vector_str}'::vector) >= :tau
-                        ORDER BY e.embedding <=> '{vector_str}'::vector
+                        ORDER BY {order_by}
                         LIMIT :top_k
                     """), {
                         'top_k': top_k,
@@ -358,6 +375,7 @@ class SceneGraphDatabaseManager:
                 scene_filter = "AND s.id = :scene_id" if scene_id is not None else ""
                 # specific_node_id 필터 조건 추가
                 node_filter = "AND e.event_id = :specific_node_id" if specific_node_id is not None else ""
+                order_by = self._vector_order_by(session, "emb.embedding", vector_str, top_k, scene_id, specific_node_id)
                 
                 results = session.execute(text(f"""
                     SELECT e.id, e.event_id, e.subject_id, e.verb, e.object_id, e.attributes,
@@ -369,7 +387,7 @@ class SceneGraphDatabaseManager:
                     JOIN embeddings emb ON e.event_id = emb.node_id AND emb.node_type = 'event'
                     WHERE 1=1 {scene_filter} {node_filter}
                     AND 1 - (emb.embedding <=> '{vector_str}'::vector) >= :tau
-                    ORDER BY emb.embedding <=> '{vector_str}'::vector
+                    ORDER BY {order_by}
                     LIMIT :top_k
                 """), {
                     'top_k': top_k,
@@ -400,6 +418,7 @@ class SceneGraphDatabaseManager:
                 scene_filter = "AND s.id = :scene_id" if scene_id is not None else ""
                 # specific_node_id 필터 조건 추가
                 node_filter = "AND sp.spatial_id = :specific_node_id" if specific_node_id is not None else ""
+                order_by = self._vector_order_by(session, "emb.embedding", vector_str, top_k, scene_id, specific_node_id)
                 
                 results = session.execute(text(f"""
                     SELECT sp.id, sp.spatial_id, sp.subject_id, sp.predicate, sp.object_id,
@@ -411,7 +430,7 @@ class SceneGraphDatabaseManager:
                     JOIN embeddings emb ON sp.spatial_id = emb.node_id AND emb.node_type = 'spatial'
                     WHERE 1=1 {scene_filter} {node_filter}
                     AND 1 - (emb.embedding <=> '{vector_str}'::vector) >= :tau
-                    ORDER BY emb.embedding <=> '{vector_str}'::vector
+                    ORDER BY {order_by}
                     LIMIT :top_k
                 """), {
                     'top_k': top_k,
@@ -617,6 +636,60 @@ class SceneGraphDatabaseManager:
         finally:
             session.close()
     
+    def get_bulk_scene_data(self, scene_ids: Optional[List[int]] = None,
+                            include_embeddings: bool = True) -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
+        """
+        여러 장면의 노드/관계/임베딩을 테이블당 한 번의 쿼리로 조회하여 장면별로 묶기
+        
+        Args:
+            scene_ids: 조회할 장면 ID 리스트 (None이면 모든 장면)
+            include_embeddings: 임베딩 벡터 포함 여부
+            
+        Returns:
+            Dict[int, Dict]: scene_id -> {'objects', 'events', 'spatial', 'temporal', 'embeddings'}
+        """
+        if scene_ids is not None and not scene_ids:
+            return {}
+        
+        kinds = list(_BULK_NODE_TABLES) + (['embeddings'] if include_embeddings else [])
+        session = self.get_session()
+        try:
+            scene_query = session.query(Scene.id)
+            if scene_ids is not None:
+                scene_query = scene_query.filter(Scene.id.in_(scene_ids))
+            bundles = {scene_id: {kind: [] for kind in kinds} for (scene_id,) in scene_query.all()}
+            
+            for kind, (model, id_field, fields) in _BULK_NODE_TABLES.items():
+                query = session.query(model)
+                if scene_ids is not None:
+                    query = query.filter(model.scene_id.in_(scene_ids))
+                for node in query.order_by(model.scene_id, getattr(model, id_field)):
+                    bundles[node.scene_id][kind].append({field: getattr(node, field) for field in fields})
+                
+                if include_embeddings:
+                    query = session.query(Embedding, model.scene_id).join(
+                        model, getattr(model, id_field) == Embedding.node_id
+                    )
+                    if scene_ids is not None:
+                        query = query.filter(model.scene_id.in_(scene_ids))
+                    for emb, scene_id in query:
+                        vector = emb.embedding.tolist() if emb.embedding is not None else []
+                        bundles[scene_id]['embeddings'].append({
+                            'node_id': emb.node_id,
+                            'node_type': emb.node_type,
+                            'embedding': vector,
+                            'vector_length': len(vector),
+                            'created_at': emb.created_at
+                        })
+            
+            return bundles
+            
+        except SQLAlchemyError as e:
+            print(f"❌ 장면 데이터 일괄 조회 실패: {e}")
+            raise
+        finally:
+            session.close()
+    
     def get_video_summary(self, video_unique_id: int) -> Dict[str, Any]:
         """
         특정 비디오의 요약 정보 조회
@@ -660,6 +733,84 @@ class SceneGraphDatabaseManager:
         finally:
             session.close()
     
+    def get_data_summary(self) -> Dict[str, Any]:
+        """
+        전체 데이터베이스 요약 정보 조회 (SQL 집계 한 번으로 비디오별 개수 계산)
+        
+        Returns:
+            Dict[str, Any]: 전체 합계 및 비디오별 장면/객체/이벤트/임베딩 수
+        """
+        session = self.get_session()
+        try:
+            results = session.execute(text("""
+                WITH scene_counts AS (
+                    SELECT video_id, COUNT(*) AS cnt FROM scenes GROUP BY video_id
+                ),
+                object_counts AS (
+                    SELECT s.video_id, COUNT(*) AS cnt
+                    FROM objects o JOIN scenes s ON s.id = o.scene_id
+                    GROUP BY s.video_id
+                ),
+                event_counts AS (
+                    SELECT s.video_id, COUNT(*) AS cnt
+                    FROM events e JOIN scenes s ON s.id = e.scene_id
+                    GROUP BY s.video_id
+                ),
+                node_ids AS (
+                    SELECT s.video_id, o.object_id AS node_id FROM objects o JOIN scenes s ON s.id = o.scene_id
+                    UNION
+                    SELECT s.video_id, e.event_id FROM events e JOIN scenes s ON s.id = e.scene_id
+                    UNION
+                    SELECT s.video_id, sp.spatial_id FROM spatial sp JOIN scenes s ON s.id = sp.scene_id
+                    UNION
+                    SELECT s.video_id, t.temporal_id FROM temporal t JOIN scenes s ON s.id = t.scene_id
+                ),
+                embedding_counts AS (
+                    SELECT n.video_id, COUNT(*) AS cnt
+                    FROM node_ids n JOIN embeddings em ON em.node_id = n.node_id
+                    GROUP BY n.video_id
+                )
+                SELECT v.id, v.video_unique_id, v.drama_name, v.episode_number,
+                       v.created_at, v.updated_at,
+                       COALESCE(sc.cnt, 0) AS scene_count,
+                       COALESCE(oc.cnt, 0) AS object_count,
+                       COALESCE(ec.cnt, 0) AS event_count,
+                       COALESCE(emc.cnt, 0) AS embedding_count
+                FROM video v
+                LEFT JOIN scene_counts sc ON sc.video_id = v.id
+                LEFT JOIN object_counts oc ON oc.video_id = v.id
+                LEFT JOIN event_counts ec ON ec.video_id = v.id
+                LEFT JOIN embedding_counts emc ON emc.video_id = v.id
+                ORDER BY v.created_at DESC
+            """))
+            
+            videos = [{
+                'id': row.id,
+                'video_unique_id': row.video_unique_id,
+                'drama_name': row.drama_name,
+                'episode_number': row.episode_number,
+                'created_at': row.created_at,
+                'updated_at': row.updated_at,
+                'scene_count': row.scene_count,
+                'object_count': row.object_count,
+                'event_count': row.event_count,
+                'embedding_count': row.embedding_count
+            } for row in results]
+            
+            return {
+                'total_videos': len(videos),
+                'total_scenes': sum(v['scene_count'] for v in videos),
+                'total_objects': sum(v['object_count'] for v in videos),
+                'total_events': sum(v['event_count'] for v in videos),
+                'total_embeddings': sum(v['embedding_count'] for v in videos),
+                'videos': videos
+            }
+        except SQLAlchemyError as e:
+            print(f"❌ 데이터 요약 조회 실패: {e}")
+            raise
+        finally:
+            session.close()
+    
     def _get_video_id_by_unique_id(self, video_unique_id: int) -> Optional[int]:
         """
         video_unique_id로 video_id 조회 (내부 메서드)
@@ -737,6 +888,31 @@ class SceneGraphDatabaseManager:
         finally:
             session.close()
     
+    def get_vocabulary(self) -> Dict[str, List[str]]:
+        """
+        저장된 객체 타입과 이벤트 동사의 고유 목록 조회 (클라이언트 문장 임베딩 캐시 사전 로드용)
+        
+        Returns:
+            Dict[str, List[str]]: {'objects': ["super_type:type_of", ...], 'verbs': [...]}
+        """
+        session = self.get_session()
+        try:
+            object_types = session.query(Object.super_type, Object.type_of).distinct().all()
+            verbs = session.query(Event.verb).distinct().all()
+            objects = {
+                f"{super_type}:{type_of}" if super_type and type_of else (type_of or super_type)
+                for super_type, type_of in object_types
+            }
+            return {
+                'objects': sorted(tok for tok in objects if tok),
+                'verbs': sorted(verb for (verb,) in verbs if verb)
+            }
+        except SQLAlchemyError as e:
+            print(f"❌ 어휘 목록 조회 실패: {e}")
+            raise
+        finally:
+            session.close()
+    
     def insert_object_data(self, scene_id: int, object_id: str, super_type: str,
                           type_of: str, label: str, attributes: Dict[str, Any] = None) -> int:
         """객체 노드 데이터 삽입"""
@@ -878,6 +1054,277 @@ class SceneGraphDatabaseManager:
             session.close()
     
 
+    def _bulk_upsert_nodes(self, model, id_field: str, scene_id: int,
+                           items: List[Dict[str, Any]], fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        장면 노드 일괄 upsert (하나의 세션/트랜잭션에서 처리)
+        
+        항목별로 SAVEPOINT를 사용하므로 일부 항목이 실패해도 나머지는 저장되며,
+        입력 순서대로 항목별 결과를 반환합니다.
+        """
+        session = self.get_session()
+        try:
+            results = self._upsert_nodes_in_session(session, model, id_field, scene_id, items, fields)
+            session.commit()
+            return results
+        except SQLAlchemyError as e:
+            session.rollback()
+            print(f"❌ {model.__tablename__} 일괄 삽입 실패: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def _upsert_nodes_in_session(self, session: Session, model, id_field: str, scene_id: int,
+                                 items: List[Dict[str, Any]], fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        주어진 세션에서 장면 노드 upsert (커밋은 호출자가 수행)
+        
+        한 번의 다중 행 INSERT ... ON CONFLICT로 반영합니다.
+        일부 항목이 잘못되어 실패하면 항목별 SAVEPOINT upsert로 재시도해 실패 항목만 보고합니다.
+        """
+        node_ids = [item.get(id_field) for item in items]
+        if not items:
+            return []
+        if None not in node_ids:
+            try:
+                with session.begin_nested():
+                    ids = self._insert_nodes_on_conflict(session, model, id_field, scene_id, items, fields)
+                return [{"success": True, id_field: node_id, "id": ids[node_id]} for node_id in node_ids]
+            except SQLAlchemyError as e:
+                print(f"⚠️ {model.__tablename__} 일괄 INSERT 실패, 항목별 저장으로 재시도: {e}")
+        
+        existing = {
+            getattr(row, id_field): row
+            for row in session.query(model).filter(
+                and_(model.scene_id == scene_id, getattr(model, id_field).in_(node_ids))
+            ).all()
+        }
+        
+        results = []
+        for node_id, item in zip(node_ids, items):
+            values = {field: item.get(field) for field in fields}
+            try:
+                with session.begin_nested():
+                    row = existing.get(node_id)
+                    if row is None:
+                        row = model(scene_id=scene_id, **{id_field: node_id}, **values)
+                        session.add(row)
+                    else:
+                        for field, value in values.items():
+                            setattr(row, field, value)
+                    session.flush()
+                existing[node_id] = row
+                results.append({"success": True, id_field: node_id, "id": row.id})
+            except SQLAlchemyError as e:
+                results.append({"success": False, id_field: node_id, "error": str(e)})
+        return results
+    
+    def _insert_nodes_on_conflict(self, session: Session, model, id_field: str, scene_id: int,
+                                  items: List[Dict[str, Any]], fields: Tuple[str, ...]) -> Dict[Any, int]:
+        """다중 행 INSERT ... ON CONFLICT (scene_id, 노드 ID) DO UPDATE 후 노드 ID -> 행 id 반환"""
+        # 같은 노드 ID가 여러 번 오면 마지막 값 사용 (ON CONFLICT는 한 명령 내 중복 키를 허용하지 않음)
+        rows = {
+            item.get(id_field): {"scene_id": scene_id, id_field: item.get(id_field),
+                                 **{field: item.get(field) for field in fields}}
+            for item in items
+        }
+        stmt = pg_insert(model).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.scene_id, getattr(model, id_field)],
+            set_={field: stmt.excluded[field] for field in fields}
+        ).returning(getattr(model, id_field), model.id)
+        return dict(session.execute(stmt).all())
+    
+    def insert_objects_bulk(self, scene_id: int, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """객체 노드 데이터 일괄 삽입"""
+        return self._bulk_upsert_nodes(Object, 'object_id', scene_id, items,
+                                       ('super_type', 'type_of', 'label', 'attributes'))
+    
+    def insert_events_bulk(self, scene_id: int, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """이벤트 노드 데이터 일괄 삽입"""
+        return self._bulk_upsert_nodes(Event, 'event_id', scene_id, items,
+                                       ('subject_id', 'verb', 'object_id', 'attributes'))
+    
+    def insert_spatial_bulk(self, scene_id: int, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """공간 관계 데이터 일괄 삽입"""
+        return self._bulk_upsert_nodes(Spatial, 'spatial_id', scene_id, items,
+                                       ('subject_id', 'predicate', 'object_id'))
+    
+    def insert_temporal_bulk(self, scene_id: int, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """시간 관계 데이터 일괄 삽입"""
+        return self._bulk_upsert_nodes(Temporal, 'temporal_id', scene_id, items,
+                                       ('subject_id', 'predicate', 'object_id'))
+    
+    def insert_embeddings_bulk(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """임베딩 데이터 일괄 upsert (node_id 기준, 항목별 결과 반환)"""
+        session = self.get_session()
+        try:
+            results = self._upsert_embeddings_in_session(session, items)
+            session.commit()
+            return results
+        except SQLAlchemyError as e:
+            session.rollback()
+            print(f"❌ 임베딩 일괄 삽입 실패: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def _upsert_embeddings_in_session(self, session: Session, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        주어진 세션에서 임베딩 upsert (커밋은 호출자가 수행)
+        
+        COPY로 임시 테이블에 적재한 뒤 한 번의 INSERT ... ON CONFLICT로 반영합니다.
+        일부 항목이 잘못되어 COPY가 실패하면 항목별 upsert로 재시도해 실패 항목만 보고합니다.
+        """
+        if not items:
+            return []
+        try:
+            with session.begin_nested():
+                self._copy_embeddings(session, items)
+            return [{"success": True, "node_id": item.get('node_id')} for item in items]
+        except Exception as e:
+            print(f"⚠️ 임베딩 COPY 실패, 항목별 저장으로 재시도: {e}")
+        
+        results = []
+        for item in items:
+            node_id = item.get('node_id')
+            try:
+                with session.begin_nested():
+                    session.merge(Embedding(
+                        node_id=node_id,
+                        node_type=item['node_type'],
+                        embedding=item['embedding'],
+                        created_at=func.now()
+                    ))
+                    session.flush()
+                results.append({"success": True, "node_id": node_id})
+            except (SQLAlchemyError, KeyError) as e:
+                results.append({"success": False, "node_id": node_id, "error": str(e)})
+        return results
+    
+    def _copy_embeddings(self, session: Session, items: List[Dict[str, Any]]) -> None:
+        """COPY FROM STDIN (CSV)으로 임베딩을 임시 테이블에 적재 후 embeddings에 upsert"""
+        # 같은 node_id가 여러 번 오면 마지막 값 사용 (ON CONFLICT는 한 명령 내 중복 키를 허용하지 않음)
+        rows = {item['node_id']: item for item in items}
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for node_id, item in rows.items():
+            vector = np.asarray(item['embedding'], dtype=np.float32).ravel()
+            writer.writerow((node_id, item['node_type'], '[' + ','.join(map(str, vector.tolist())) + ']'))
+        buffer.seek(0)
+        
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS embeddings_stage "
+                "(node_id VARCHAR(100), node_type VARCHAR(50), embedding vector) ON COMMIT DROP"
+            )
+            cursor.execute("TRUNCATE embeddings_stage")
+            cursor.copy_expert(
+                "COPY embeddings_stage (node_id, node_type, embedding) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+            cursor.execute(
+                "INSERT INTO embeddings (node_id, node_type, embedding, created_at) "
+                "SELECT node_id, node_type, embedding, NOW() FROM embeddings_stage "
+                "ON CONFLICT (node_id) DO UPDATE SET "
+                "node_type = EXCLUDED.node_type, embedding = EXCLUDED.embedding, created_at = EXCLUDED.created_at"
+            )
+        finally:
+            cursor.close()
+    
+    # /scenes/full 업로드에서 노드 종류별 (모델, ID 필드, 갱신 필드)
+    _FULL_SCENE_NODES = (
+        ('objects', Object, 'object_id', ('super_type', 'type_of', 'label', 'attributes')),
+        ('events', Event, 'event_id', ('subject_id', 'verb', 'object_id', 'attributes')),
+        ('spatial', Spatial, 'spatial_id', ('subject_id', 'predicate', 'object_id')),
+        ('temporal', Temporal, 'temporal_id', ('subject_id', 'predicate', 'object_id')),
+    )
+    
+    def insert_full_scene(self, video: Dict[str, Any], scene: Dict[str, Any],
+                          nodes: Dict[str, List[Dict[str, Any]]], embeddings: List[Dict[str, Any]],
+                          prefix_token: str = "$SCENE_PREFIX_") -> Dict[str, Any]:
+        """
+        비디오/장면/노드/임베딩을 하나의 트랜잭션으로 저장
+        
+        항목의 ID 값이 prefix_token으로 시작하면 "{video_unique_id}_{scene_id}_"로 치환합니다.
+        (클라이언트는 업로드 시점에 scene_id를 모르기 때문)
+        
+        Args:
+            video: {video_unique_id, drama_name, episode_number}
+            scene: 장면 메타데이터 (scene_number, scene_place, ...)
+            nodes: {"objects": [...], "events": [...], "spatial": [...], "temporal": [...]}
+            embeddings: [{node_id, node_type, embedding}, ...]
+            prefix_token: node_id 접두사 자리표시자
+            
+        Returns:
+            Dict: video_id, video_unique_id, scene_id와 종류별 항목 결과
+        """
+        session = self.get_session()
+        try:
+            # 1. 비디오 조회/생성 (드라마명+에피소드가 같으면 기존 비디오 사용)
+            video_row = session.query(Video).filter(
+                and_(Video.drama_name == video['drama_name'], Video.episode_number == video['episode_number'])
+            ).first()
+            if video_row is None:
+                video_row = Video(
+                    video_unique_id=video['video_unique_id'],
+                    drama_name=video['drama_name'],
+                    episode_number=video['episode_number']
+                )
+                session.add(video_row)
+                session.flush()
+            
+            # 2. 장면 upsert
+            scene_number = scene.get('scene_number', 'unknown')
+            scene_fields = ('scene_place', 'scene_time', 'scene_atmosphere', 'start_frame', 'end_frame')
+            scene_row = session.query(Scene).filter(
+                and_(Scene.video_id == video_row.id, Scene.scene_number == scene_number)
+            ).first()
+            if scene_row is None:
+                scene_row = Scene(video_id=video_row.id, scene_number=scene_number,
+                                  **{field: scene.get(field) for field in scene_fields})
+                session.add(scene_row)
+            else:
+                for field in scene_fields:
+                    setattr(scene_row, field, scene.get(field))
+            session.flush()
+            
+            # 3. 자리표시자 접두사를 실제 node_id 접두사로 치환
+            prefix = f"{video_row.video_unique_id}_{scene_row.id}_"
+            
+            def resolve(item: Dict[str, Any]) -> Dict[str, Any]:
+                return {
+                    key: prefix + value[len(prefix_token):]
+                    if isinstance(value, str) and value.startswith(prefix_token) else value
+                    for key, value in item.items()
+                }
+            
+            # 4. 노드 및 임베딩 저장
+            results = {}
+            for key, model, id_field, fields in self._FULL_SCENE_NODES:
+                items = [resolve(item) for item in nodes.get(key, [])]
+                results[key] = self._upsert_nodes_in_session(session, model, id_field, scene_row.id, items, fields)
+            results['embeddings'] = self._upsert_embeddings_in_session(
+                session, [resolve(item) for item in embeddings]
+            )
+            
+            session.commit()
+            print(f"✅ 장면 전체 업로드 완료: {scene_number} (ID: {scene_row.id})")
+            return {
+                "video_id": video_row.id,
+                "video_unique_id": video_row.video_unique_id,
+                "scene_id": scene_row.id,
+                "results": results
+            }
+        except SQLAlchemyError as e:
+            session.rollback()
+            print(f"❌ 장면 전체 업로드 실패: {e}")
+            raise
+        finally:
+            session.close()
+
     def close(self):
         """데이터베이스 연결 종료"""
         if self.engine:
@@ -33,6 +33,11 @@ class VectorSearchQuery(BaseModel):
     specific_node_id: Optional[str] = None
     tau: float = 0.0
 
+class BulkSceneDataQuery(BaseModel):
+    """여러 장면 데이터 일괄 조회 요청 스키마"""
+    scene_ids: Optional[List[int]] = None  # None이면 모든 장면
+    include_embeddings: bool = True
+
 class VideoResponse(BaseModel):
     """비디오 응답 스키마"""
     id: int
@@ -10,7 +10,7 @@ from sqlalchemy import (
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from pgvector.sqlalchemy import Vector
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -174,6 +174,17 @@ class Embedding(Base):
     # 제약 조건
     __table_args__ = (
         Index('idx_embeddings_node_type', 'node_type'),
+        # 노드 타입별 HNSW 인덱스 (검색 쿼리가 항상 node_type으로 한정되므로 부분 인덱스로 분리)
+        *[
+            Index(
+                f'idx_embeddings_hnsw_{node_type}', 'embedding',
+                postgresql_using='hnsw',
+                postgresql_with={'m': 16, 'ef_construction': 64},
+                postgresql_ops={'embedding': 'vector_cosine_ops'},
+                postgresql_where=text(f"node_type = '{node_type}'"),
+            )
+            for node_type in ('object', 'event', 'spatial')
+        ],
     )
 
 # 데이터베이스 연결 설정